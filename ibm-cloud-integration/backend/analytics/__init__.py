@@ -2,5 +2,11 @@
 
 from .cost_tracker import CostTracker
 from .metrics import MetricsCollector
+from .metrics_store import MetricsStore
+from .federation import MetricsFederation, create_federation
+from .ledger_store import CostLedgerStore
 
-__all__ = ["CostTracker", "MetricsCollector"]
\ No newline at end of file
+__all__ = [
+    "CostTracker", "MetricsCollector", "MetricsStore",
+    "MetricsFederation", "create_federation", "CostLedgerStore"
+]
\ No newline at end of file
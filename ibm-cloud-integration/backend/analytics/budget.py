@@ -0,0 +1,78 @@
+"""Constant-Time Spend Windows for Budget Enforcement"""
+
+import time
+from typing import Dict, List, Optional
+
+
+class SlidingWindowCounter:
+    """Running spend over a sliding window of fixed-size time buckets
+
+    Values land in a ring of ``window_seconds / bucket_seconds`` buckets.
+    Advancing the clock zeroes the buckets that fall out of the window and
+    subtracts them from the running total, so ``add`` and ``total`` cost
+    O(1) amortized regardless of how much history exists. Expiry has
+    bucket granularity.
+    """
+
+    def __init__(self, window_seconds: int, bucket_seconds: int):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = max(1, window_seconds // bucket_seconds)
+        self.buckets: List[float] = [0.0] * self.n_buckets
+        self.head: Optional[int] = None  # Absolute index of the newest bucket
+        self.running_total = 0.0
+
+    def _advance(self, timestamp: float) -> int:
+        """Move the window forward to timestamp, expiring old buckets"""
+        current = int(timestamp // self.bucket_seconds)
+
+        if self.head is None:
+            self.head = current
+        elif current > self.head:
+            if current - self.head >= self.n_buckets:
+                self.buckets = [0.0] * self.n_buckets
+                self.running_total = 0.0
+            else:
+                for absolute in range(self.head + 1, current + 1):
+                    slot = absolute % self.n_buckets
+                    self.running_total -= self.buckets[slot]
+                    self.buckets[slot] = 0.0
+            self.head = current
+
+        return current
+
+    def add(self, value: float, timestamp: Optional[float] = None):
+        """Add spend at timestamp (epoch seconds, default now)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        current = self._advance(timestamp)
+
+        # Late values inside the window go to their own bucket; older ones are dropped
+        if current > self.head - self.n_buckets:
+            self.buckets[current % self.n_buckets] += value
+            self.running_total += value
+
+    def total(self, timestamp: Optional[float] = None) -> float:
+        """Spend within the window ending at timestamp (default now)"""
+        self._advance(time.time() if timestamp is None else timestamp)
+        return max(self.running_total, 0.0)
+
+
+class ServiceSpendWindows:
+    """Daily and monthly spend counters for one service"""
+
+    DAY_SECONDS = 86400
+    MONTH_SECONDS = 30 * 86400
+
+    def __init__(self):
+        self.daily = SlidingWindowCounter(self.DAY_SECONDS, 60)        # Minute buckets
+        self.monthly = SlidingWindowCounter(self.MONTH_SECONDS, 3600)  # Hour buckets
+
+    def add(self, cost: float, timestamp: Optional[float] = None):
+        self.daily.add(cost, timestamp)
+        self.monthly.add(cost, timestamp)
+
+    def spending(self) -> Dict[str, float]:
+        return {
+            'daily': self.daily.total(),
+            'monthly': self.monthly.total()
+        }
@@ -0,0 +1,264 @@
+"""Columnar, Indexed Cost Ledger for DNALang"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from datetime import datetime
+import numpy as np
+
+
+class GrowableArray:
+    """Append-only NumPy array with amortized O(1) appends"""
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value):
+        if self._size == len(self._data):
+            grown = np.empty(max(len(self._data) * 2, 16), dtype=self._data.dtype)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+
+    @property
+    def values(self) -> np.ndarray:
+        """View of the populated portion"""
+        return self._data[:self._size]
+
+
+class _PrefixSeries:
+    """Timestamps with running cost totals for range-sum queries"""
+
+    def __init__(self):
+        self.timestamps = GrowableArray(np.float64)
+        self.cumulative = GrowableArray(np.float64)
+
+    def append(self, timestamp: float, cost: float):
+        previous = self.cumulative.values[-1] if len(self.cumulative) else 0.0
+        self.timestamps.append(timestamp)
+        self.cumulative.append(previous + cost)
+
+    def _prefix(self, timestamp: float, side: str) -> float:
+        """Sum of costs strictly before (``left``) or up to (``right``) timestamp"""
+        index = int(np.searchsorted(self.timestamps.values, timestamp, side=side))
+        return float(self.cumulative.values[index - 1]) if index > 0 else 0.0
+
+    def total(self) -> float:
+        return float(self.cumulative.values[-1]) if len(self.cumulative) else 0.0
+
+    def sum_between(self, start: Optional[float] = None, end: Optional[float] = None) -> float:
+        upper = self._prefix(end, 'right') if end is not None else self.total()
+        lower = self._prefix(start, 'left') if start is not None else 0.0
+        return upper - lower
+
+
+class DailyBuckets:
+    """Cost per calendar day, stored densely from the first recorded day"""
+
+    def __init__(self):
+        self.first_day: Optional[int] = None  # date ordinal of index 0
+        self.totals = GrowableArray(np.float64, capacity=64)
+
+    def add(self, day: int, cost: float):
+        if self.first_day is None:
+            self.first_day = day
+        offset = day - self.first_day
+        while len(self.totals) <= offset:
+            self.totals.append(0.0)
+        self.totals.values[offset] += cost
+
+    def series(self, last_day: int, days: int) -> np.ndarray:
+        """Costs for the ``days`` calendar days ending at ``last_day`` (inclusive)"""
+        result = np.zeros(days, dtype=np.float64)
+        if self.first_day is None:
+            return result
+
+        start_day = last_day - days + 1
+        lo = max(start_day, self.first_day)
+        hi = min(last_day, self.first_day + len(self.totals) - 1)
+        if lo <= hi:
+            result[lo - start_day:hi - start_day + 1] = \
+                self.totals.values[lo - self.first_day:hi - self.first_day + 1]
+        return result
+
+
+class CostLedger:
+    """Column store of cost entries with prefix sums and secondary indexes
+
+    Columns (timestamp, service code, organism code, cost) are NumPy arrays
+    in timestamp order. Running totals over the whole ledger and per
+    service turn any time-range spend into two binary searches; per-service
+    and per-organism totals and the hour-of-day distribution are maintained
+    on append, together with per-calendar-day buckets overall and per
+    service for forecasting. The original ``CostEntry`` rows are kept for
+    detail views and exports.
+    """
+
+    NO_ORGANISM = -1
+
+    def __init__(self, entries: Optional[Iterable[Any]] = None):
+        self.entries: List[Any] = []
+
+        # Columns
+        self.timestamps = GrowableArray(np.float64)
+        self.service_codes = GrowableArray(np.int16)
+        self.organism_codes = GrowableArray(np.int32)
+        self.costs = GrowableArray(np.float64)
+
+        # Dictionaries for the coded columns
+        self.service_names: List[str] = []
+        self._service_index: Dict[str, int] = {}
+        self.organism_ids: List[str] = []
+        self._organism_index: Dict[str, int] = {}
+
+        # Running sums
+        self._all = _PrefixSeries()
+        self._by_service: Dict[str, _PrefixSeries] = {}
+        self.service_totals: Dict[str, float] = {}
+        self.organism_totals: Dict[str, float] = {}
+        self.organism_service_totals: Dict[str, Dict[str, float]] = {}
+        self.hourly_totals: List[float] = [0.0] * 24
+        self.daily = DailyBuckets()
+        self.daily_by_service: Dict[str, DailyBuckets] = {}
+
+        # Per-organism row positions (ascending, hence time ordered)
+        self._organism_rows: Dict[str, List[int]] = {}
+
+        if entries:
+            for entry in sorted(entries, key=lambda e: e.timestamp):
+                self.append(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _code(self, value: str, names: List[str], index: Dict[str, int]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(names)
+            names.append(value)
+        return code
+
+    def append(self, entry: Any):
+        """Append a ``CostEntry``
+
+        Entries are expected in timestamp order; an out-of-order entry
+        triggers a rebuild so the prefix sums stay valid.
+        """
+        timestamp = entry.timestamp.timestamp()
+
+        if len(self.timestamps) and timestamp < self.timestamps.values[-1]:
+            self.rebuild(self.entries + [entry])
+            return
+
+        row = len(self.entries)
+        self.entries.append(entry)
+
+        service_code = self._code(entry.service, self.service_names, self._service_index)
+        if entry.organism_id:
+            organism_code = self._code(entry.organism_id, self.organism_ids, self._organism_index)
+        else:
+            organism_code = self.NO_ORGANISM
+
+        self.timestamps.append(timestamp)
+        self.service_codes.append(service_code)
+        self.organism_codes.append(organism_code)
+        self.costs.append(entry.total_cost)
+
+        self._all.append(timestamp, entry.total_cost)
+        if entry.service not in self._by_service:
+            self._by_service[entry.service] = _PrefixSeries()
+        self._by_service[entry.service].append(timestamp, entry.total_cost)
+
+        self.service_totals[entry.service] = (
+            self.service_totals.get(entry.service, 0) + entry.total_cost
+        )
+        self.hourly_totals[entry.timestamp.hour] += entry.total_cost
+
+        day = entry.timestamp.toordinal()
+        self.daily.add(day, entry.total_cost)
+        if entry.service not in self.daily_by_service:
+            self.daily_by_service[entry.service] = DailyBuckets()
+        self.daily_by_service[entry.service].add(day, entry.total_cost)
+
+        if entry.organism_id:
+            organism_id = entry.organism_id
+            self.organism_totals[organism_id] = (
+                self.organism_totals.get(organism_id, 0) + entry.total_cost
+            )
+            breakdown = self.organism_service_totals.setdefault(organism_id, {})
+            breakdown[entry.service] = breakdown.get(entry.service, 0) + entry.total_cost
+            self._organism_rows.setdefault(organism_id, []).append(row)
+
+    def rebuild(self, entries: Iterable[Any]):
+        """Replace the ledger contents"""
+        self.__init__(entries)
+
+    def total(self) -> float:
+        """Total cost of all entries"""
+        return self._all.total()
+
+    def spending_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        service: Optional[str] = None
+    ) -> float:
+        """Total cost in [start, end], optionally for one service"""
+        series = self._all if service is None else self._by_service.get(service)
+        if series is None:
+            return 0.0
+
+        return series.sum_between(
+            start.timestamp() if start else None,
+            end.timestamp() if end else None
+        )
+
+    def organism_entries(
+        self,
+        organism_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Any]:
+        """Entries for one organism within [start, end]"""
+        rows = self._organism_rows.get(organism_id, [])
+        timestamps = self.timestamps.values
+
+        lo, hi = 0, len(rows)
+        if start:
+            lo = bisect_left(rows, int(np.searchsorted(timestamps, start.timestamp(), side='left')))
+        if end:
+            hi = bisect_right(rows, int(np.searchsorted(timestamps, end.timestamp(), side='right')) - 1)
+
+        return [self.entries[row] for row in rows[lo:hi]]
+
+    def daily_series(
+        self,
+        days: int,
+        service: Optional[str] = None,
+        end: Optional[datetime] = None
+    ) -> np.ndarray:
+        """Per-day costs for the ``days`` calendar days ending at ``end`` (default today)"""
+        buckets = self.daily if service is None else self.daily_by_service.get(service)
+        if buckets is None:
+            return np.zeros(days, dtype=np.float64)
+        return buckets.series((end or datetime.now()).toordinal(), days)
+
+    def top_organisms(self, limit: int = 5) -> List[Tuple[str, float]]:
+        """Organisms with the highest total cost"""
+        return heapq.nlargest(limit, self.organism_totals.items(), key=lambda x: x[1])
+
+    def slice_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """Row range [lo, hi) of entries within [start, end]"""
+        timestamps = self.timestamps.values
+        lo = int(np.searchsorted(timestamps, start.timestamp(), side='left')) if start else 0
+        hi = int(np.searchsorted(timestamps, end.timestamp(), side='right')) if end else len(timestamps)
+        return lo, hi
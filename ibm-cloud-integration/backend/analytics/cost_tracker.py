@@ -1,11 +1,16 @@
 """IBM Cloud Cost Tracking for DNALang"""
 
+import io
+import csv
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-import numpy as np
 
+from .cost_ledger import CostLedger
+from .budget import ServiceSpendWindows
+from .forecasting import forecast_costs, prediction_confidence
+from .ledger_store import CostLedgerStore
 from ..config import settings
 
 
@@ -28,6 +33,12 @@ class CostEntry:
         data['timestamp'] = self.timestamp.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CostEntry':
+        data = dict(data)
+        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        return cls(**data)
+
 
 class CostTracker:
     """Track and analyze IBM Cloud costs"""
@@ -42,11 +53,51 @@ class CostTracker:
     # Compute pricing (simplified model)
     COMPUTE_PER_VCPU_HOUR = 0.08  # USD per vCPU hour
 
-    def __init__(self):
-        self.cost_history: List[CostEntry] = []
+    # Column order for CSV exports
+    EXPORT_FIELDS = [
+        'timestamp', 'service', 'resource', 'operation', 'units',
+        'unit_cost', 'total_cost', 'organism_id', 'job_id', 'metadata'
+    ]
+
+    def __init__(self, store: Optional[CostLedgerStore] = None):
+        self.ledger = CostLedger()
         self.budget_limits: Dict[str, float] = {}
         self.alerts: List[Dict[str, Any]] = []
 
+        # Sliding daily/monthly spend per service for O(1) budget checks
+        self.spend_windows: Dict[str, ServiceSpendWindows] = {}
+
+        # Durable append-only ledger
+        self.store = store
+        if self.store:
+            for record in self.store.iter_records():
+                self.ledger.append(CostEntry.from_dict(record))
+            self._rebuild_spend_windows()
+
+    @property
+    def cost_history(self) -> List[CostEntry]:
+        """Cost entries in timestamp order"""
+        return self.ledger.entries
+
+    def _record_entry(self, entry: CostEntry):
+        """Append an entry to the durable store, ledger and spend windows"""
+        if self.store:
+            self.store.append(entry.to_dict())
+        self.ledger.append(entry)
+        self._spend_window(entry.service).add(entry.total_cost, entry.timestamp.timestamp())
+
+    def _spend_window(self, service: str) -> ServiceSpendWindows:
+        if service not in self.spend_windows:
+            self.spend_windows[service] = ServiceSpendWindows()
+        return self.spend_windows[service]
+
+    def _rebuild_spend_windows(self):
+        """Recompute spend windows from the last 30 days of the ledger"""
+        self.spend_windows = {}
+        lo, hi = self.ledger.slice_between(start=datetime.now() - timedelta(days=30))
+        for entry in self.ledger.entries[lo:hi]:
+            self._spend_window(entry.service).add(entry.total_cost, entry.timestamp.timestamp())
+
     def track_quantum_execution(
         self,
         job_id: str,
@@ -81,7 +132,7 @@ class CostTracker:
             }
         )
 
-        self.cost_history.append(entry)
+        self._record_entry(entry)
 
         # Check budget alerts
         self._check_budget_alerts('quantum', cost)
@@ -122,7 +173,7 @@ class CostTracker:
             }
         )
 
-        self.cost_history.append(entry)
+        self._record_entry(entry)
 
         return cost
 
@@ -157,7 +208,7 @@ class CostTracker:
             }
         )
 
-        self.cost_history.append(entry)
+        self._record_entry(entry)
 
         return total_cost
 
@@ -173,38 +224,79 @@ class CostTracker:
             'monthly': monthly_limit
         }
 
+    def check_budget(
+        self,
+        service: str,
+        estimated_cost: float
+    ) -> Dict[str, Any]:
+        """Pre-submission budget gate
+
+        Returns whether spending ``estimated_cost`` now would stay within the
+        service's daily and monthly limits. Services without limits are
+        always allowed.
+        """
+
+        if service not in self.budget_limits:
+            return {'allowed': True, 'service': service}
+
+        limits = self.budget_limits[service]
+        spending = self._spend_window(service).spending()
+
+        for period, key in (('daily', 'daily'), ('monthly', 'monthly')):
+            if spending[key] + estimated_cost > limits[key]:
+                return {
+                    'allowed': False,
+                    'service': service,
+                    'period': period,
+                    'spending': spending[key],
+                    'estimated_cost': estimated_cost,
+                    'limit': limits[key]
+                }
+
+        return {
+            'allowed': True,
+            'service': service,
+            'spending': spending,
+            'estimated_cost': estimated_cost
+        }
+
     def _check_budget_alerts(self, service: str, new_cost: float):
-        """Check if budget limits are exceeded"""
+        """Check if budget limits are exceeded
+
+        Called after the new cost has been recorded, so the spend windows
+        already include it.
+        """
 
         if service not in self.budget_limits:
             return
 
         limits = self.budget_limits[service]
 
-        # Calculate current spending
-        daily_spending = self.get_spending_by_period(service, 'day')
-        monthly_spending = self.get_spending_by_period(service, 'month')
+        # Current spending from the sliding windows (constant time)
+        spending = self._spend_window(service).spending()
+        daily_spending = spending['daily']
+        monthly_spending = spending['monthly']
 
         # Check daily limit
-        if daily_spending + new_cost > limits['daily']:
+        if daily_spending > limits['daily']:
             self.alerts.append({
                 'timestamp': datetime.now().isoformat(),
                 'type': 'budget_exceeded',
                 'service': service,
                 'period': 'daily',
-                'spending': daily_spending + new_cost,
+                'spending': daily_spending,
                 'limit': limits['daily'],
                 'severity': 'warning'
             })
 
         # Check monthly limit
-        if monthly_spending + new_cost > limits['monthly']:
+        if monthly_spending > limits['monthly']:
             self.alerts.append({
                 'timestamp': datetime.now().isoformat(),
                 'type': 'budget_exceeded',
                 'service': service,
                 'period': 'monthly',
-                'spending': monthly_spending + new_cost,
+                'spending': monthly_spending,
                 'limit': limits['monthly'],
                 'severity': 'critical'
             })
@@ -225,15 +317,9 @@ class CostTracker:
         elif period == 'month':
             start_time = now - timedelta(days=30)
         else:
-            start_time = datetime.min
-
-        total = 0
-        for entry in self.cost_history:
-            if entry.timestamp >= start_time:
-                if service is None or entry.service == service:
-                    total += entry.total_cost
+            start_time = None  # All time
 
-        return total
+        return self.ledger.spending_between(start=start_time, service=service)
 
     def get_organism_costs(
         self,
@@ -243,21 +329,19 @@ class CostTracker:
     ) -> Dict[str, Any]:
         """Get costs for a specific organism"""
 
-        costs = []
-        for entry in self.cost_history:
-            if entry.organism_id == organism_id:
-                if start_date and entry.timestamp < start_date:
-                    continue
-                if end_date and entry.timestamp > end_date:
-                    continue
-                costs.append(entry)
-
-        # Calculate totals by service
-        service_totals = {}
-        for entry in costs:
-            if entry.service not in service_totals:
-                service_totals[entry.service] = 0
-            service_totals[entry.service] += entry.total_cost
+        if start_date is None and end_date is None:
+            # Whole-history totals are maintained by the ledger
+            costs = self.ledger.organism_entries(organism_id)
+            service_totals = dict(self.ledger.organism_service_totals.get(organism_id, {}))
+        else:
+            costs = self.ledger.organism_entries(organism_id, start_date, end_date)
+
+            # Calculate totals by service
+            service_totals = {}
+            for entry in costs:
+                if entry.service not in service_totals:
+                    service_totals[entry.service] = 0
+                service_totals[entry.service] += entry.total_cost
 
         return {
             'organism_id': organism_id,
@@ -274,26 +358,22 @@ class CostTracker:
     def get_cost_analytics(self) -> Dict[str, Any]:
         """Get comprehensive cost analytics"""
 
-        if not self.cost_history:
+        if not len(self.ledger):
             return {
                 'total_spending': 0,
                 'service_breakdown': {},
                 'trend': 'stable'
             }
 
-        # Total spending
-        total_spending = sum(entry.total_cost for entry in self.cost_history)
-
-        # Service breakdown
-        service_breakdown = {}
-        for entry in self.cost_history:
-            if entry.service not in service_breakdown:
-                service_breakdown[entry.service] = 0
-            service_breakdown[entry.service] += entry.total_cost
+        # Totals are maintained incrementally by the ledger
+        total_spending = self.ledger.total()
+        service_breakdown = dict(self.ledger.service_totals)
 
         # Calculate trend
-        recent_spending = self.get_spending_by_period(period='day')
-        weekly_spending = self.get_spending_by_period(period='week') / 7
+        daily_spending = self.get_spending_by_period(period='day')
+        weekly_total = self.get_spending_by_period(period='week')
+        recent_spending = daily_spending
+        weekly_spending = weekly_total / 7
 
         if recent_spending > weekly_spending * 1.2:
             trend = 'increasing'
@@ -303,31 +383,17 @@ class CostTracker:
             trend = 'stable'
 
         # Top organisms by cost
-        organism_costs = {}
-        for entry in self.cost_history:
-            if entry.organism_id:
-                if entry.organism_id not in organism_costs:
-                    organism_costs[entry.organism_id] = 0
-                organism_costs[entry.organism_id] += entry.total_cost
-
-        top_organisms = sorted(
-            organism_costs.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        top_organisms = self.ledger.top_organisms(5)
 
         # Hourly distribution
-        hourly_costs = [0] * 24
-        for entry in self.cost_history:
-            hour = entry.timestamp.hour
-            hourly_costs[hour] += entry.total_cost
+        hourly_costs = list(self.ledger.hourly_totals)
 
         return {
             'total_spending': total_spending,
             'service_breakdown': service_breakdown,
             'trend': trend,
-            'daily_spending': self.get_spending_by_period(period='day'),
-            'weekly_spending': self.get_spending_by_period(period='week'),
+            'daily_spending': daily_spending,
+            'weekly_spending': weekly_total,
             'monthly_spending': self.get_spending_by_period(period='month'),
             'top_organisms': [
                 {'organism_id': org_id, 'cost': cost}
@@ -363,8 +429,13 @@ class CostTracker:
 
         return status
 
-    def predict_monthly_cost(self) -> Dict[str, float]:
-        """Predict monthly cost based on current usage"""
+    def predict_monthly_cost(self, history_days: int = 28) -> Dict[str, Any]:
+        """Predict monthly cost based on current usage
+
+        Rolling averages come from the ledger prefix sums; the trend and
+        hour-of-day forecast work on per-day buckets, so the cost is
+        O(history_days) rather than O(entries).
+        """
 
         # Get daily average from last 7 days
         weekly_spending = self.get_spending_by_period(period='week')
@@ -384,39 +455,22 @@ class CostTracker:
             'total_predicted': predicted_monthly,
             'service_breakdown': service_predictions,
             'daily_average': daily_average,
-            'confidence': self._calculate_prediction_confidence()
+            'confidence': self._calculate_prediction_confidence(),
+            'forecast': forecast_costs(
+                self.ledger.daily_series(history_days),
+                self.ledger.hourly_totals,
+                horizon_days=30
+            )
         }
 
     def _calculate_prediction_confidence(self) -> float:
         """Calculate confidence in cost prediction"""
 
-        if len(self.cost_history) < 10:
+        if len(self.ledger) < 10:
             return 0.3  # Low confidence with little data
 
-        # Calculate variance in daily spending
-        daily_costs = []
-        for i in range(7):
-            date = datetime.now() - timedelta(days=i)
-            day_start = date.replace(hour=0, minute=0, second=0)
-            day_end = date.replace(hour=23, minute=59, second=59)
-
-            day_cost = sum(
-                entry.total_cost
-                for entry in self.cost_history
-                if day_start <= entry.timestamp <= day_end
-            )
-            daily_costs.append(day_cost)
-
-        if not daily_costs or np.mean(daily_costs) == 0:
-            return 0.5
-
-        # Lower variance = higher confidence
-        cv = np.std(daily_costs) / np.mean(daily_costs)  # Coefficient of variation
-
-        # Convert to confidence score (0-1)
-        confidence = max(0, min(1, 1 - cv))
-
-        return confidence
+        # Variance in daily spending over the last 7 calendar days
+        return prediction_confidence(self.ledger.daily_series(7))
 
     def export_cost_report(
         self,
@@ -425,13 +479,8 @@ class CostTracker:
     ) -> Dict[str, Any]:
         """Export detailed cost report"""
 
-        filtered_entries = []
-        for entry in self.cost_history:
-            if start_date and entry.timestamp < start_date:
-                continue
-            if end_date and entry.timestamp > end_date:
-                continue
-            filtered_entries.append(entry)
+        lo, hi = self.ledger.slice_between(start_date, end_date)
+        filtered_entries = self.ledger.entries[lo:hi]
 
         return {
             'report_period': {
@@ -449,10 +498,86 @@ class CostTracker:
             'generated_at': datetime.now().isoformat()
         }
 
+    def stream_cost_report(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        format: str = 'csv'
+    ) -> Iterator[str]:
+        """Stream cost entries as CSV rows or JSONL lines
+
+        Entries are read from the durable store when configured (otherwise
+        from the in-memory ledger) one at a time, so the full report is
+        never materialized. JSONL output ends with a summary line.
+        """
+
+        if self.store:
+            records = self.store.iter_records(start_date, end_date)
+        else:
+            lo, hi = self.ledger.slice_between(start_date, end_date)
+            records = (
+                self.ledger.entries[i].to_dict()
+                for i in range(lo, hi)
+            )
+
+        total_cost = 0.0
+        entry_count = 0
+        organisms = set()
+
+        if format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=self.EXPORT_FIELDS)
+            writer.writeheader()
+            yield buffer.getvalue()
+
+            for record in records:
+                buffer.seek(0)
+                buffer.truncate()
+                row = dict(record)
+                row['metadata'] = json.dumps(row.get('metadata')) if row.get('metadata') else ''
+                writer.writerow(row)
+                yield buffer.getvalue()
+
+        elif format == 'jsonl':
+            for record in records:
+                total_cost += record['total_cost']
+                entry_count += 1
+                if record.get('organism_id'):
+                    organisms.add(record['organism_id'])
+                yield json.dumps(record, default=str) + '\n'
+
+            yield json.dumps({
+                'summary': {
+                    'total_cost': total_cost,
+                    'entry_count': entry_count,
+                    'unique_organisms': len(organisms)
+                },
+                'report_period': {
+                    'start': start_date.isoformat() if start_date else 'all_time',
+                    'end': end_date.isoformat() if end_date else 'current'
+                },
+                'generated_at': datetime.now().isoformat()
+            }) + '\n'
+
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
+
     def clear_old_entries(self, days_to_keep: int = 90):
-        """Clear old cost entries"""
+        """Clear old cost entries
+
+        Compacts the durable store and drops the expired prefix of the
+        in-memory ledger.
+        """
         cutoff = datetime.now() - timedelta(days=days_to_keep)
-        self.cost_history = [
-            entry for entry in self.cost_history
-            if entry.timestamp >= cutoff
-        ]
\ No newline at end of file
+
+        if self.store:
+            self.store.compact(cutoff)
+
+        lo, _ = self.ledger.slice_between(start=cutoff)
+        self.ledger.rebuild(self.ledger.entries[lo:])
+        self._rebuild_spend_windows()
+
+    def close(self):
+        """Close the durable store"""
+        if self.store:
+            self.store.close()
@@ -0,0 +1,567 @@
+"""Cross-Replica Metrics Federation for DNALang"""
+
+import json
+import math
+import uuid
+import asyncio
+import logging
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timedelta
+from collections import defaultdict
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QuantileSketch:
+    """Mergeable log-bucketed histogram with bounded relative error"""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = defaultdict(int)
+        self.negative: Dict[int, int] = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+
+    # Values closer to zero than this share the zero bucket
+    MIN_MAGNITUDE = 1e-9
+
+    def _index(self, magnitude: float) -> int:
+        return int(math.ceil(math.log(magnitude) / self.log_gamma))
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Add an observation"""
+        if value > self.MIN_MAGNITUDE:
+            self.positive[self._index(value)] += count
+        elif value < -self.MIN_MAGNITUDE:
+            self.negative[self._index(-value)] += count
+        else:
+            self.zero_count += count
+        self.count += count
+
+    def merge(self, other: 'QuantileSketch'):
+        """Merge another sketch into this one"""
+        for index, count in other.positive.items():
+            self.positive[index] += count
+        for index, count in other.negative.items():
+            self.negative[index] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile q (0-1)"""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        cumulative = 0
+
+        for index in sorted(self.negative, reverse=True):
+            cumulative += self.negative[index]
+            if cumulative > rank:
+                return -self._value(index)
+
+        cumulative += self.zero_count
+        if cumulative > rank:
+            return 0.0
+
+        for index in sorted(self.positive):
+            cumulative += self.positive[index]
+            if cumulative > rank:
+                return self._value(index)
+
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'p': {str(k): v for k, v in self.positive.items()},
+            'n': {str(k): v for k, v in self.negative.items()},
+            'z': self.zero_count
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], relative_accuracy: float = 0.01) -> 'QuantileSketch':
+        sketch = cls(relative_accuracy)
+        for k, v in data.get('p', {}).items():
+            sketch.positive[int(k)] = v
+        for k, v in data.get('n', {}).items():
+            sketch.negative[int(k)] = v
+        sketch.zero_count = data.get('z', 0)
+        sketch.count = sum(sketch.positive.values()) + sum(sketch.negative.values()) + sketch.zero_count
+        return sketch
+
+
+class SeriesSummary:
+    """Pre-aggregated summary of one metric series within a time bucket"""
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.sum_squares = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sketch = QuantileSketch()
+
+    def add(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.sum_squares += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other: 'SeriesSummary'):
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_squares += other.sum_squares
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return 0.0
+        variance = self.sum_squares / self.count - self.mean ** 2
+        return math.sqrt(max(variance, 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'c': self.count,
+            's': self.sum,
+            'q': self.sum_squares,
+            'lo': self.min,
+            'hi': self.max,
+            'k': self.sketch.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SeriesSummary':
+        summary = cls()
+        summary.count = data['c']
+        summary.sum = data['s']
+        summary.sum_squares = data['q']
+        summary.min = data['lo']
+        summary.max = data['hi']
+        summary.sketch = QuantileSketch.from_dict(data['k'])
+        return summary
+
+
+class InMemoryAggregateStore:
+    """Process-local aggregate store (single replica and tests)"""
+
+    def __init__(self):
+        self.buckets: Dict[int, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+
+    async def push(self, replica_id: str, deltas: Dict[int, Dict[str, Any]]):
+        for bucket, delta in deltas.items():
+            self.buckets[bucket].append((replica_id, delta))
+
+    async def fetch(self, first_bucket: int, last_bucket: int) -> List[Tuple[str, Dict[str, Any]]]:
+        results = []
+        for bucket in range(first_bucket, last_bucket + 1):
+            results.extend(self.buckets.get(bucket, []))
+        return results
+
+    async def expire(self, before_bucket: int):
+        for bucket in [b for b in self.buckets if b < before_bucket]:
+            del self.buckets[bucket]
+
+    async def close(self):
+        pass
+
+
+class RedisAggregateStore:
+    """Redis-backed aggregate store shared by all API replicas
+
+    Each time bucket is a hash ``metrics_federation:<bucket>`` whose fields
+    are ``<replica>:<nonce>.<sequence>`` deltas; the per-process nonce keeps
+    a restarted replica with a stable id from overwriting its earlier
+    deltas. Keys expire with the retention.
+    """
+
+    KEY_PREFIX = 'metrics_federation'
+
+    def __init__(self, redis_client, retention_seconds: int = 86400 * 8):
+        self.redis = redis_client
+        self.retention_seconds = retention_seconds
+        self.nonce = uuid.uuid4().hex[:12]
+        self.sequence = 0
+
+    async def push(self, replica_id: str, deltas: Dict[int, Dict[str, Any]]):
+        self.sequence += 1
+        pipe = self.redis.pipeline()
+        for bucket, delta in deltas.items():
+            key = f"{self.KEY_PREFIX}:{bucket}"
+            pipe.hset(key, f"{replica_id}:{self.nonce}.{self.sequence}", json.dumps(delta))
+            pipe.expire(key, self.retention_seconds)
+        await pipe.execute()
+
+    async def fetch(self, first_bucket: int, last_bucket: int) -> List[Tuple[str, Dict[str, Any]]]:
+        pipe = self.redis.pipeline()
+        for bucket in range(first_bucket, last_bucket + 1):
+            pipe.hgetall(f"{self.KEY_PREFIX}:{bucket}")
+
+        results = []
+        for fields in await pipe.execute():
+            for field, payload in (fields or {}).items():
+                replica_id = field.rsplit(':', 1)[0]
+                results.append((replica_id, json.loads(payload)))
+        return results
+
+    async def expire(self, before_bucket: int):
+        # Redis TTLs handle expiry
+        pass
+
+    async def close(self):
+        await self.redis.close()
+
+
+class MetricsFederation:
+    """Push pre-aggregated metric deltas to a shared store and merge on query"""
+
+    # Labels kept when folding points into federated series; high-cardinality
+    # labels such as organism ids stay replica-local
+    FEDERATED_LABELS = ('backend', 'status')
+
+    PERIODS = {
+        'hour': timedelta(hours=1),
+        'day': timedelta(days=1),
+        'week': timedelta(weeks=1)
+    }
+
+    def __init__(
+        self,
+        store,
+        replica_id: str,
+        bucket_seconds: int = 60,
+        push_interval: float = 15.0
+    ):
+        self.store = store
+        self.replica_id = replica_id
+        self.bucket_seconds = bucket_seconds
+        self.push_interval = push_interval
+
+        # Pending deltas: bucket -> series key -> summary
+        self.pending: Dict[int, Dict[str, SeriesSummary]] = defaultdict(dict)
+        self.pending_aggregates: Dict[int, Dict[str, List[float]]] = defaultdict(dict)
+
+    def _bucket(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.bucket_seconds)
+
+    def _series_key(self, metric_name: str, labels: Dict[str, str]) -> str:
+        parts = [metric_name]
+        for label in self.FEDERATED_LABELS:
+            if label in labels:
+                parts.append(f"{label}={labels[label]}")
+        return '|'.join(parts)
+
+    @staticmethod
+    def _parse_series_key(key: str) -> Tuple[str, Dict[str, str]]:
+        metric_name, *label_parts = key.split('|')
+        labels = dict(part.split('=', 1) for part in label_parts)
+        return metric_name, labels
+
+    def observe(self, point):
+        """Fold a recorded ``MetricPoint`` into the pending delta"""
+        bucket = self.pending[self._bucket(point.timestamp)]
+        key = self._series_key(point.metric_name, point.labels)
+        if key not in bucket:
+            bucket[key] = SeriesSummary()
+        bucket[key].add(point.value)
+
+    def observe_aggregate(self, key: str, value: float, timestamp: Optional[datetime] = None):
+        """Fold an aggregate update (e.g. success rate) into the pending delta"""
+        bucket = self.pending_aggregates[self._bucket(timestamp or datetime.now())]
+        count_sum = bucket.setdefault(key, [0, 0.0])
+        count_sum[0] += 1
+        count_sum[1] += value
+
+    async def push(self):
+        """Send pending deltas to the shared store"""
+        if not self.pending and not self.pending_aggregates:
+            return
+
+        pending, self.pending = self.pending, defaultdict(dict)
+        pending_aggregates, self.pending_aggregates = self.pending_aggregates, defaultdict(dict)
+
+        deltas = {}
+        for bucket in set(pending) | set(pending_aggregates):
+            deltas[bucket] = {
+                'series': {
+                    key: summary.to_dict()
+                    for key, summary in pending.get(bucket, {}).items()
+                },
+                'aggregates': pending_aggregates.get(bucket, {})
+            }
+
+        try:
+            await self.store.push(self.replica_id, deltas)
+        except Exception as e:
+            logger.error(f"Metrics federation push failed: {e}")
+            # Requeue so the deltas are not lost
+            for bucket, series in pending.items():
+                for key, summary in series.items():
+                    if key in self.pending[bucket]:
+                        self.pending[bucket][key].merge(summary)
+                    else:
+                        self.pending[bucket][key] = summary
+            for bucket, aggregates in pending_aggregates.items():
+                for key, (count, total) in aggregates.items():
+                    count_sum = self.pending_aggregates[bucket].setdefault(key, [0, 0.0])
+                    count_sum[0] += count
+                    count_sum[1] += total
+
+    async def run(self):
+        """Periodically push deltas until cancelled"""
+        while True:
+            try:
+                await asyncio.sleep(self.push_interval)
+                await self.push()
+                await self.store.expire(
+                    self._bucket(datetime.now() - self.PERIODS['week']) - 1
+                )
+            except asyncio.CancelledError:
+                await self.push()
+                break
+            except Exception as e:
+                logger.error(f"Metrics federation error: {e}")
+
+    async def _merge_window(
+        self,
+        start_time: datetime
+    ) -> Tuple[Dict[str, SeriesSummary], Dict[str, List[float]], int]:
+        """Merge all replicas' deltas since start_time
+
+        Returns ``(series, aggregates, replica_count)``.
+        """
+        first_bucket = self._bucket(start_time)
+        last_bucket = self._bucket(datetime.now())
+
+        series: Dict[str, SeriesSummary] = {}
+        aggregates: Dict[str, List[float]] = {}
+        replicas = set()
+
+        for replica_id, delta in await self.store.fetch(first_bucket, last_bucket):
+            replicas.add(replica_id)
+
+            for key, data in delta.get('series', {}).items():
+                summary = SeriesSummary.from_dict(data)
+                if key in series:
+                    series[key].merge(summary)
+                else:
+                    series[key] = summary
+
+            for key, (count, total) in delta.get('aggregates', {}).items():
+                count_sum = aggregates.setdefault(key, [0, 0.0])
+                count_sum[0] += count
+                count_sum[1] += total
+
+        return series, aggregates, len(replicas)
+
+    @staticmethod
+    def _combine(series: Dict[str, SeriesSummary], metric_name: str, **labels) -> SeriesSummary:
+        """Merge every series of a metric that matches the given labels"""
+        combined = SeriesSummary()
+        for key, summary in series.items():
+            name, series_labels = MetricsFederation._parse_series_key(key)
+            if name != metric_name:
+                continue
+            if any(series_labels.get(k) != v for k, v in labels.items()):
+                continue
+            combined.merge(summary)
+        return combined
+
+    @staticmethod
+    def _summary_statistics(metric_name: str, period: str, summary: SeriesSummary) -> Dict[str, Any]:
+        if not summary.count:
+            return {
+                'metric': metric_name,
+                'period': period,
+                'count': 0
+            }
+
+        return {
+            'metric': metric_name,
+            'period': period,
+            'count': summary.count,
+            'mean': summary.mean,
+            'median': summary.sketch.quantile(0.5),
+            'std': summary.std,
+            'min': summary.min,
+            'max': summary.max,
+            'percentiles': {
+                'p25': summary.sketch.quantile(0.25),
+                'p50': summary.sketch.quantile(0.5),
+                'p75': summary.sketch.quantile(0.75),
+                'p95': summary.sketch.quantile(0.95),
+                'p99': summary.sketch.quantile(0.99)
+            }
+        }
+
+    async def calculate_statistics(
+        self,
+        metric_name: str,
+        period: str = 'hour'
+    ) -> Dict[str, Any]:
+        """Cluster-wide statistics for a metric"""
+        start_time = datetime.now() - self.PERIODS.get(period, self.PERIODS['week'])
+        series, _, _ = await self._merge_window(start_time)
+        return self._summary_statistics(metric_name, period, self._combine(series, metric_name))
+
+    @classmethod
+    def _backend_performance(
+        cls,
+        series: Dict[str, SeriesSummary],
+        aggregates: Dict[str, List[float]]
+    ) -> Dict[str, Any]:
+        backends = {}
+
+        for key in series:
+            name, labels = cls._parse_series_key(key)
+            if 'backend' in labels:
+                backends.setdefault(labels['backend'], None)
+
+        for backend in backends:
+            timings = cls._combine(series, 'quantum_execution_time', backend=backend)
+            phi = cls._combine(series, 'phi', backend=backend)
+            count, total = aggregates.get(f"success_rate_{backend}", (0, 0.0))
+
+            backends[backend] = {
+                'executions': timings.count,
+                'avg_time': timings.mean,
+                'success_rate': total / count if count else 0,
+                'avg_phi': phi.mean,
+                'avg_depth': 0
+            }
+
+        return backends
+
+    async def get_backend_performance(self) -> Dict[str, Any]:
+        """Cluster-wide backend performance (last 24 hours)"""
+        series, aggregates, _ = await self._merge_window(datetime.now() - self.PERIODS['day'])
+        return self._backend_performance(series, aggregates)
+
+    async def get_system_health(self) -> Dict[str, Any]:
+        """Cluster-wide health using the same scoring as MetricsCollector"""
+        now = datetime.now()
+        series, aggregates, replica_count = await self._merge_window(now - self.PERIODS['hour'])
+        recent_series, _, _ = await self._merge_window(now - timedelta(minutes=5))
+
+        recent_errors = (
+            self._combine(recent_series, 'api_latency', status='500').count +
+            self._combine(recent_series, 'api_latency', status='503').count
+        )
+        avg_latency = self._combine(series, 'api_latency').mean
+
+        queue = self._combine(recent_series, 'queue_size')
+        current_queue = queue.max if queue.count else 0
+
+        health_score = 100
+        health_score -= min(recent_errors * 5, 30)
+
+        if avg_latency > 5:
+            health_score -= 20
+        elif avg_latency > 2:
+            health_score -= 10
+
+        if current_queue > 100:
+            health_score -= 20
+        elif current_queue > 50:
+            health_score -= 10
+
+        if health_score >= 90:
+            status = 'healthy'
+        elif health_score >= 70:
+            status = 'degraded'
+        else:
+            status = 'unhealthy'
+
+        return {
+            'health_score': max(0, health_score),
+            'status': status,
+            'components': {
+                'api': {
+                    'recent_errors': recent_errors,
+                    'avg_latency': avg_latency,
+                    'status': 'healthy' if recent_errors < 5 else 'degraded'
+                },
+                'quantum': {
+                    'queue_size': current_queue,
+                    'backends_online': len(self._backend_performance(series, aggregates)),
+                    'status': 'healthy' if current_queue < 50 else 'degraded'
+                },
+                'storage': {
+                    'status': 'healthy'  # Simplified
+                }
+            },
+            'replicas': replica_count,
+            'timestamp': now.isoformat()
+        }
+
+    async def export_metrics_report(self, collector) -> Dict[str, Any]:
+        """Metrics report with cluster-wide sections merged across replicas
+
+        Organism rankings and operation timings remain replica-local.
+        """
+        report = collector.export_metrics_report()
+
+        series, aggregates, replica_count = await self._merge_window(
+            datetime.now() - self.PERIODS['day']
+        )
+
+        report['quantum_performance'] = self._summary_statistics(
+            'quantum_execution_time', 'day', self._combine(series, 'quantum_execution_time')
+        )
+        report['consciousness_metrics'] = self._summary_statistics(
+            'phi', 'day', self._combine(series, 'phi')
+        )
+        report['fitness_evolution'] = self._summary_statistics(
+            'fitness', 'day', self._combine(series, 'fitness')
+        )
+        report['backend_performance'] = self._backend_performance(series, aggregates)
+        report['system_health'] = await self.get_system_health()
+        report['replicas'] = replica_count
+
+        return report
+
+    async def close(self):
+        """Flush pending deltas and close the store"""
+        await self.push()
+        await self.store.close()
+
+
+async def create_federation(replica_id: Optional[str] = None) -> MetricsFederation:
+    """Create a federation backed by Redis, falling back to in-process storage"""
+    import socket
+    import redis.asyncio as redis
+
+    replica_id = replica_id or settings.METRICS_REPLICA_ID or socket.gethostname()
+
+    try:
+        redis_client = await redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True
+        )
+        await redis_client.ping()
+        store = RedisAggregateStore(redis_client)
+        logger.info("Metrics federation using Redis")
+    except Exception as e:
+        logger.warning(f"Redis connection failed: {e}. Metrics federation is replica-local.")
+        store = InMemoryAggregateStore()
+
+    return MetricsFederation(
+        store,
+        replica_id,
+        push_interval=settings.METRICS_FEDERATION_INTERVAL
+    )
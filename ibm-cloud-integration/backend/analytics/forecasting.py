@@ -0,0 +1,94 @@
+"""Cost Forecasting over Daily and Hourly Buckets"""
+
+from typing import Dict, List, Any, Sequence
+import numpy as np
+
+
+def moving_average(daily_costs: np.ndarray, window: int = 7) -> float:
+    """Mean daily cost over the last ``window`` days"""
+    if len(daily_costs) == 0:
+        return 0.0
+    return float(np.mean(daily_costs[-window:]))
+
+
+def linear_trend(daily_costs: np.ndarray) -> Dict[str, float]:
+    """Least-squares line through daily costs (x = day index, oldest first)"""
+    n = len(daily_costs)
+    if n < 2:
+        return {
+            'slope': 0.0,
+            'intercept': float(daily_costs[0]) if n else 0.0,
+            'r_squared': 0.0
+        }
+
+    x = np.arange(n, dtype=np.float64)
+    slope, intercept = np.polyfit(x, daily_costs, 1)
+
+    fitted = slope * x + intercept
+    total_variance = np.sum((daily_costs - np.mean(daily_costs)) ** 2)
+    r_squared = 1 - np.sum((daily_costs - fitted) ** 2) / total_variance if total_variance > 0 else 0.0
+
+    return {
+        'slope': float(slope),
+        'intercept': float(intercept),
+        'r_squared': float(max(0.0, min(r_squared, 1.0)))
+    }
+
+
+def project_trend(daily_costs: np.ndarray, horizon_days: int = 30) -> np.ndarray:
+    """Project per-day costs ``horizon_days`` ahead along the linear trend"""
+    trend = linear_trend(daily_costs)
+    x = np.arange(len(daily_costs), len(daily_costs) + horizon_days, dtype=np.float64)
+    return np.clip(trend['slope'] * x + trend['intercept'], 0.0, None)
+
+
+def hourly_seasonality(hourly_distribution: Sequence[float]) -> np.ndarray:
+    """Share of daily cost falling in each hour of the day (sums to 1)"""
+    hourly = np.asarray(hourly_distribution, dtype=np.float64)
+    total = hourly.sum()
+    if total <= 0:
+        return np.full(24, 1 / 24)
+    return hourly / total
+
+
+def prediction_confidence(daily_costs: np.ndarray) -> float:
+    """Confidence (0-1) from the coefficient of variation of daily costs"""
+    if len(daily_costs) == 0 or np.mean(daily_costs) == 0:
+        return 0.5
+
+    # Lower variance = higher confidence
+    cv = np.std(daily_costs) / np.mean(daily_costs)
+    return float(max(0, min(1, 1 - cv)))
+
+
+def forecast_costs(
+    daily_costs: np.ndarray,
+    hourly_distribution: Sequence[float],
+    horizon_days: int = 30,
+    window: int = 7
+) -> Dict[str, Any]:
+    """Moving-average and trend forecasts with an hour-of-day profile
+
+    ``daily_costs`` are per-calendar-day totals, oldest first, ending today.
+    """
+
+    average = moving_average(daily_costs, window)
+    trend = linear_trend(daily_costs)
+    projected = project_trend(daily_costs, horizon_days)
+    seasonality = hourly_seasonality(hourly_distribution)
+
+    # Expected spend per hour of the day at the moving-average daily rate
+    expected_hourly: List[float] = (seasonality * average).tolist()
+
+    return {
+        'horizon_days': horizon_days,
+        'moving_average_daily': average,
+        'moving_average_total': average * horizon_days,
+        'trend': trend,
+        'trend_total': float(projected.sum()),
+        'trend_daily': projected.tolist(),
+        'hourly_profile': seasonality.tolist(),
+        'expected_hourly_cost': expected_hourly,
+        'peak_hour': int(np.argmax(seasonality)),
+        'confidence': prediction_confidence(daily_costs[-window:])
+    }
@@ -0,0 +1,110 @@
+"""Incremental Organism Leaderboards for DNALang Metrics"""
+
+from typing import Dict, List, Optional, Any, Deque, Tuple
+from datetime import datetime, timedelta
+from collections import deque
+
+from sortedcontainers import SortedList
+
+
+class _OrganismStats:
+    """Running statistics for one organism on a leaderboard"""
+
+    __slots__ = ('current', 'sum', 'count', 'max', 'window_max')
+
+    def __init__(self):
+        self.current = 0.0
+        self.sum = 0.0
+        self.count = 0
+        self.max = float('-inf')
+        # Monotonic (timestamp, value) deque for sliding-window maxima
+        self.window_max: Deque[Tuple[datetime, float]] = deque()
+
+
+class OrganismLeaderboard:
+    """Organisms ranked by their latest metric value
+
+    Rankings are kept in a ``SortedList`` keyed by ``(-current, organism_id)``
+    so an update is an O(log n) removal and insertion and the top ``k`` is
+    a slice. With ``window`` set, samples older than the window are expired
+    as new samples arrive (or on read) and organisms without samples in the
+    window drop off the board.
+    """
+
+    def __init__(self, metric: str, window: Optional[timedelta] = None):
+        self.metric = metric
+        self.window = window
+        self.stats: Dict[str, _OrganismStats] = {}
+        self._order: SortedList = SortedList()  # (-current, organism_id)
+        self._events: Deque[Tuple[datetime, str, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    def _unrank(self, organism_id: str, stats: _OrganismStats):
+        self._order.discard((-stats.current, organism_id))
+
+    def update(self, organism_id: str, value: float, timestamp: Optional[datetime] = None):
+        """Record a new sample for an organism"""
+        timestamp = timestamp or datetime.now()
+
+        stats = self.stats.get(organism_id)
+        if stats is None:
+            stats = self.stats[organism_id] = _OrganismStats()
+        else:
+            self._unrank(organism_id, stats)
+
+        stats.current = value
+        stats.sum += value
+        stats.count += 1
+
+        if self.window is None:
+            stats.max = max(stats.max, value)
+        else:
+            while stats.window_max and stats.window_max[-1][1] <= value:
+                stats.window_max.pop()
+            stats.window_max.append((timestamp, value))
+            self._events.append((timestamp, organism_id, value))
+
+        self._order.add((-value, organism_id))
+
+        if self.window is not None:
+            self.expire(timestamp)
+
+    def expire(self, now: Optional[datetime] = None):
+        """Drop samples that have left the window"""
+        if self.window is None:
+            return
+
+        cutoff = (now or datetime.now()) - self.window
+
+        while self._events and self._events[0][0] < cutoff:
+            timestamp, organism_id, value = self._events.popleft()
+            stats = self.stats[organism_id]
+            stats.sum -= value
+            stats.count -= 1
+
+            while stats.window_max and stats.window_max[0][0] < cutoff:
+                stats.window_max.popleft()
+
+            if stats.count == 0:
+                self._unrank(organism_id, stats)
+                del self.stats[organism_id]
+
+    def top(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top organisms by current value"""
+        self.expire()
+
+        rankings = []
+        for negative_value, organism_id in self._order.islice(0, limit):
+            stats = self.stats[organism_id]
+            rankings.append({
+                'organism_id': organism_id,
+                'metric': self.metric,
+                'current_value': stats.current,
+                'average_value': stats.sum / stats.count,
+                'max_value': stats.window_max[0][1] if self.window is not None else stats.max,
+                'sample_count': stats.count
+            })
+
+        return rankings
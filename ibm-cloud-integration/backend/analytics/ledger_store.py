@@ -0,0 +1,174 @@
+"""Append-Only On-Disk Cost Ledger"""
+
+import os
+import json
+from typing import Dict, List, Optional, Any, Iterator
+from datetime import datetime
+
+
+class CostLedgerStore:
+    """Durable cost ledger made of append-only JSONL segment files
+
+    Entries are appended to the active segment (``costs-000001.jsonl``, ...)
+    which rolls over once it exceeds ``segment_max_bytes``. Each segment's
+    first and last timestamps are tracked so time-bounded reads skip whole
+    segments, and compaction drops or rewrites only the segments that hold
+    entries older than the cutoff.
+    """
+
+    SEGMENT_PREFIX = 'costs-'
+    SEGMENT_SUFFIX = '.jsonl'
+
+    def __init__(self, directory: str, segment_max_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # sequence -> {'first': epoch, 'last': epoch} (None for empty segments)
+        self.segments: Dict[int, Dict[str, Optional[float]]] = {}
+        for sequence in self._list_segments():
+            self.segments[sequence] = self._scan_bounds(sequence)
+
+        self.active_sequence = max(self.segments) if self.segments else 1
+        self.segments.setdefault(self.active_sequence, {'first': None, 'last': None})
+        self._active = open(self._segment_path(self.active_sequence), 'a', encoding='utf-8')
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(
+            self.directory,
+            f"{self.SEGMENT_PREFIX}{sequence:06d}{self.SEGMENT_SUFFIX}"
+        )
+
+    def _list_segments(self) -> List[int]:
+        sequences = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith(self.SEGMENT_PREFIX) and filename.endswith(self.SEGMENT_SUFFIX):
+                try:
+                    sequences.append(int(filename[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(sequences)
+
+    @staticmethod
+    def _timestamp(record: Dict[str, Any]) -> float:
+        return datetime.fromisoformat(record['timestamp']).timestamp()
+
+    def _read_segment(self, sequence: int) -> Iterator[Dict[str, Any]]:
+        with open(self._segment_path(sequence), 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write at the tail of a segment after a crash
+                    continue
+
+    def _scan_bounds(self, sequence: int) -> Dict[str, Optional[float]]:
+        first = last = None
+        for record in self._read_segment(sequence):
+            timestamp = self._timestamp(record)
+            if first is None:
+                first = timestamp
+            last = timestamp
+        return {'first': first, 'last': last}
+
+    def append(self, record: Dict[str, Any]):
+        """Append a serialized ``CostEntry`` (see ``CostEntry.to_dict``)"""
+        if self._active.tell() >= self.segment_max_bytes:
+            self._roll()
+
+        self._active.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+        self._active.flush()
+
+        timestamp = self._timestamp(record)
+        bounds = self.segments[self.active_sequence]
+        if bounds['first'] is None:
+            bounds['first'] = timestamp
+        bounds['last'] = timestamp
+
+    def _roll(self):
+        """Start a new active segment"""
+        self._active.close()
+        self.active_sequence += 1
+        self.segments[self.active_sequence] = {'first': None, 'last': None}
+        self._active = open(self._segment_path(self.active_sequence), 'a', encoding='utf-8')
+
+    def iter_records(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records within [start, end] in write order"""
+        self._active.flush()
+
+        start_ts = start.timestamp() if start else None
+        end_ts = end.timestamp() if end else None
+
+        for sequence in sorted(self.segments):
+            bounds = self.segments[sequence]
+            if bounds['first'] is None:
+                continue
+            if start_ts is not None and bounds['last'] < start_ts:
+                continue
+            if end_ts is not None and bounds['first'] > end_ts:
+                continue
+
+            for record in self._read_segment(sequence):
+                timestamp = self._timestamp(record)
+                if start_ts is not None and timestamp < start_ts:
+                    continue
+                if end_ts is not None and timestamp > end_ts:
+                    continue
+                yield record
+
+    def compact(self, cutoff: datetime) -> int:
+        """Remove entries older than cutoff; returns the number removed"""
+        cutoff_ts = cutoff.timestamp()
+        removed = 0
+
+        for sequence in sorted(self.segments):
+            bounds = self.segments[sequence]
+            if bounds['first'] is None or bounds['first'] >= cutoff_ts:
+                continue
+
+            is_active = sequence == self.active_sequence
+            if is_active:
+                self._active.close()
+
+            path = self._segment_path(sequence)
+
+            if bounds['last'] < cutoff_ts and not is_active:
+                # Entire segment is expired
+                removed += sum(1 for _ in self._read_segment(sequence))
+                os.remove(path)
+                del self.segments[sequence]
+                continue
+
+            # Rewrite the straddling segment without the expired prefix
+            tmp_path = path + '.tmp'
+            first = last = None
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                for record in self._read_segment(sequence):
+                    timestamp = self._timestamp(record)
+                    if timestamp < cutoff_ts:
+                        removed += 1
+                        continue
+                    out.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+                    if first is None:
+                        first = timestamp
+                    last = timestamp
+            os.replace(tmp_path, path)
+            self.segments[sequence] = {'first': first, 'last': last}
+
+            if is_active:
+                self._active = open(path, 'a', encoding='utf-8')
+
+        return removed
+
+    def close(self):
+        """Close the active segment"""
+        if self._active and not self._active.closed:
+            self._active.close()
@@ -1,14 +1,16 @@
 """Metrics Collection and Analysis for DNALang"""
 
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from prometheus_client import Counter, Histogram, Gauge, generate_latest
 
+from .metrics_store import MetricsStore
+from .leaderboard import OrganismLeaderboard
 from ..config import settings
 
 
@@ -30,9 +32,19 @@ class MetricPoint:
 class MetricsCollector:
     """Collect and analyze system metrics"""
 
-    def __init__(self):
-        # Time series storage
-        self.metrics_history: List[MetricPoint] = []
+    # Retention window for the in-memory time series
+    HISTORY_RETENTION = timedelta(hours=24)
+
+    # Leaderboard windows maintained for every organism-labelled metric
+    RANKING_WINDOWS = {
+        'hour': timedelta(hours=1),
+        'day': timedelta(days=1),
+        'all': None
+    }
+
+    def __init__(self, store: Optional[MetricsStore] = None):
+        # Time series storage (ordered by timestamp)
+        self.metrics_history: Deque[MetricPoint] = deque()
         self.aggregates: Dict[str, Dict[str, float]] = defaultdict(dict)
 
         # Prometheus metrics
@@ -41,6 +53,47 @@ class MetricsCollector:
         # Performance tracking
         self.operation_timings: Dict[str, List[float]] = defaultdict(list)
 
+        # Incremental organism rankings: metric -> period -> leaderboard
+        self.leaderboards: Dict[str, Dict[str, OrganismLeaderboard]] = {}
+
+        # Durable storage for warm restarts
+        self.store = store
+        if self.store:
+            self._restore_from_store()
+
+        # Cross-replica aggregation (see MetricsFederation)
+        self.federation = None
+
+    def _restore_from_store(self):
+        """Reload the retained window from the last snapshot and WAL"""
+        points, aggregate_updates, aggregates = self.store.load()
+
+        for key, agg in aggregates.items():
+            self.aggregates[key] = dict(agg)
+
+        for key, value in aggregate_updates:
+            self._apply_aggregate(key, value)
+
+        for timestamp, name, value, labels, metadata in points:
+            self._ingest_point(MetricPoint(
+                timestamp=timestamp,
+                metric_name=name,
+                value=value,
+                labels=labels,
+                metadata=metadata
+            ))
+
+    def snapshot(self):
+        """Write a compact snapshot of the current history and aggregates"""
+        if self.store:
+            self.store.write_snapshot(list(self.metrics_history), self.aggregates)
+
+    def close(self):
+        """Flush a final snapshot and release the store"""
+        if self.store:
+            self.snapshot()
+            self.store.close()
+
     def _init_prometheus_metrics(self):
         """Initialize Prometheus metrics"""
         # Quantum metrics
@@ -243,19 +296,60 @@ class MetricsCollector:
             metadata=metadata
         )
 
+        if self.store:
+            self.store.append_point(point.timestamp, name, value, labels, metadata)
+
+        self._ingest_point(point)
+
+        if self.federation:
+            self.federation.observe(point)
+
+        if self.store and self.store.snapshot_due():
+            self.snapshot()
+
+    def _ingest_point(self, point: MetricPoint):
+        """Add a point to the in-memory history"""
+
         self.metrics_history.append(point)
 
-        # Cleanup old metrics (keep last 24 hours)
-        cutoff = datetime.now() - timedelta(hours=24)
-        self.metrics_history = [
-            p for p in self.metrics_history
-            if p.timestamp >= cutoff
-        ]
+        # Cleanup old metrics (keep last 24 hours); history is time ordered
+        # so expired points are always at the left end
+        cutoff = point.timestamp - self.HISTORY_RETENTION
+        while self.metrics_history and self.metrics_history[0].timestamp < cutoff:
+            self.metrics_history.popleft()
+
+        if 'organism' in point.labels:
+            self._update_leaderboards(point)
+
+    def _update_leaderboards(self, point: MetricPoint):
+        """Feed an organism-labelled point into its metric's leaderboards"""
+
+        boards = self.leaderboards.get(point.metric_name)
+        if boards is None:
+            boards = self.leaderboards[point.metric_name] = {
+                period: OrganismLeaderboard(point.metric_name, window)
+                for period, window in self.RANKING_WINDOWS.items()
+            }
+
+        organism_id = point.labels['organism']
+        for board in boards.values():
+            board.update(organism_id, point.value, point.timestamp)
 
     def _update_aggregate(self, key: str, value: float):
         """Update aggregate statistics"""
 
-        if key not in self.aggregates:
+        if self.store:
+            self.store.append_aggregate(key, value)
+
+        if self.federation:
+            self.federation.observe_aggregate(key, value)
+
+        self._apply_aggregate(key, value)
+
+    def _apply_aggregate(self, key: str, value: float):
+        """Apply a value to aggregate statistics"""
+
+        if key not in self.aggregates or 'count' not in self.aggregates[key]:
             self.aggregates[key] = {
                 'count': 0,
                 'sum': 0,
@@ -395,34 +489,21 @@ class MetricsCollector:
     def get_organism_rankings(
         self,
         metric: str = 'fitness',
-        limit: int = 10
+        limit: int = 10,
+        period: str = 'day'
     ) -> List[Dict[str, Any]]:
-        """Get organism rankings by metric"""
+        """Get organism rankings by metric
 
-        organism_metrics = defaultdict(list)
-
-        # Collect metrics by organism
-        for point in self.metrics_history:
-            if point.metric_name == metric and 'organism' in point.labels:
-                organism_id = point.labels['organism']
-                organism_metrics[organism_id].append(point.value)
-
-        # Calculate averages and rank
-        rankings = []
-        for organism_id, values in organism_metrics.items():
-            rankings.append({
-                'organism_id': organism_id,
-                'metric': metric,
-                'current_value': values[-1] if values else 0,
-                'average_value': np.mean(values),
-                'max_value': max(values) if values else 0,
-                'sample_count': len(values)
-            })
+        ``period`` is ``'hour'``, ``'day'`` (the retained history window)
+        or ``'all'`` (since the collector's data began).
+        """
 
-        # Sort by current value
-        rankings.sort(key=lambda x: x['current_value'], reverse=True)
+        boards = self.leaderboards.get(metric)
+        if not boards:
+            return []
 
-        return rankings[:limit]
+        board = boards.get(period, boards['day'])
+        return board.top(limit)
 
     def get_system_health(self) -> Dict[str, Any]:
         """Get overall system health metrics"""
@@ -0,0 +1,284 @@
+"""Durable Metrics Storage with Columnar Snapshots and Write-Ahead Segments"""
+
+import os
+import json
+import time
+import shutil
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from datetime import datetime, timedelta
+import numpy as np
+
+
+class MetricsStore:
+    """Persist metric points so a restarted collector can warm up instantly
+
+    Layout of the store directory::
+
+        snapshot/            latest columnar snapshot
+            timestamps.npy   float64 epoch seconds
+            values.npy       float64 metric values
+            names.npy        int32 codes into manifest['names']
+            labels.npy       int32 codes into manifest['labels']
+            metadata.npy     int32 codes into manifest['metadata'] (-1 = None)
+            manifest.json    dictionaries, aggregates and first WAL segment
+        wal-000001.jsonl     append-only write-ahead segments
+
+    Every recorded point and aggregate update is appended to the active
+    write-ahead segment. A snapshot rolls the WAL to a new segment, so on
+    load the snapshot is memory-mapped and only segments written after it
+    are replayed.
+    """
+
+    SNAPSHOT_DIR = 'snapshot'
+    MANIFEST_FILE = 'manifest.json'
+    WAL_PREFIX = 'wal-'
+    WAL_SUFFIX = '.jsonl'
+
+    def __init__(
+        self,
+        directory: str,
+        snapshot_interval: float = 300.0,
+        retention_hours: int = 24
+    ):
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self.retention = timedelta(hours=retention_hours)
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        segments = self._list_segments()
+        self.wal_sequence = segments[-1] if segments else 1
+        self._wal = open(self._segment_path(self.wal_sequence), 'a', encoding='utf-8')
+        self.last_snapshot = time.monotonic()
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(
+            self.directory,
+            f"{self.WAL_PREFIX}{sequence:06d}{self.WAL_SUFFIX}"
+        )
+
+    def _list_segments(self) -> List[int]:
+        """List WAL segment sequence numbers in ascending order"""
+        sequences = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith(self.WAL_PREFIX) and filename.endswith(self.WAL_SUFFIX):
+                try:
+                    sequences.append(int(filename[len(self.WAL_PREFIX):-len(self.WAL_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(sequences)
+
+    def _write_record(self, record: Dict[str, Any]):
+        self._wal.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+        self._wal.flush()
+
+    def append_point(
+        self,
+        timestamp: datetime,
+        metric_name: str,
+        value: float,
+        labels: Dict[str, str],
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Append a metric point to the write-ahead segment"""
+        record = {
+            'k': 'point',
+            't': timestamp.timestamp(),
+            'n': metric_name,
+            'v': value,
+            'l': labels
+        }
+        if metadata is not None:
+            record['m'] = metadata
+        self._write_record(record)
+
+    def append_aggregate(self, key: str, value: float):
+        """Append an aggregate update to the write-ahead segment"""
+        self._write_record({'k': 'agg', 'key': key, 'v': value})
+
+    def snapshot_due(self) -> bool:
+        """Check whether the snapshot interval has elapsed"""
+        return time.monotonic() - self.last_snapshot >= self.snapshot_interval
+
+    def write_snapshot(
+        self,
+        points: List[Any],
+        aggregates: Dict[str, Dict[str, float]]
+    ):
+        """Write a columnar snapshot and roll the write-ahead log
+
+        ``points`` are ``MetricPoint`` instances in timestamp order.
+        """
+
+        # Start a fresh segment first: anything recorded after this call
+        # belongs to the new segment and is replayed on top of the snapshot
+        next_sequence = self.wal_sequence + 1
+        self._wal.close()
+        self._wal = open(self._segment_path(next_sequence), 'a', encoding='utf-8')
+        self.wal_sequence = next_sequence
+
+        # Dictionary-encode the string columns
+        name_codes: Dict[str, int] = {}
+        label_codes: Dict[str, int] = {}
+        metadata_codes: Dict[str, int] = {}
+
+        n = len(points)
+        timestamps = np.empty(n, dtype=np.float64)
+        values = np.empty(n, dtype=np.float64)
+        names = np.empty(n, dtype=np.int32)
+        labels = np.empty(n, dtype=np.int32)
+        metadata = np.empty(n, dtype=np.int32)
+
+        for i, point in enumerate(points):
+            timestamps[i] = point.timestamp.timestamp()
+            values[i] = point.value
+            names[i] = name_codes.setdefault(point.metric_name, len(name_codes))
+
+            label_key = json.dumps(point.labels, sort_keys=True)
+            labels[i] = label_codes.setdefault(label_key, len(label_codes))
+
+            if point.metadata is None:
+                metadata[i] = -1
+            else:
+                metadata_key = json.dumps(point.metadata, sort_keys=True, default=str)
+                metadata[i] = metadata_codes.setdefault(metadata_key, len(metadata_codes))
+
+        manifest = {
+            'created_at': datetime.now().isoformat(),
+            'point_count': n,
+            'wal_sequence': next_sequence,
+            'names': list(name_codes),
+            'labels': list(label_codes),
+            'metadata': list(metadata_codes),
+            'aggregates': {
+                key: {k: v for k, v in agg.items() if np.isfinite(v)}
+                for key, agg in aggregates.items()
+            }
+        }
+
+        # Write to a temporary directory and swap it in atomically
+        final_dir = os.path.join(self.directory, self.SNAPSHOT_DIR)
+        tmp_dir = final_dir + '.tmp'
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        np.save(os.path.join(tmp_dir, 'timestamps.npy'), timestamps)
+        np.save(os.path.join(tmp_dir, 'values.npy'), values)
+        np.save(os.path.join(tmp_dir, 'names.npy'), names)
+        np.save(os.path.join(tmp_dir, 'labels.npy'), labels)
+        np.save(os.path.join(tmp_dir, 'metadata.npy'), metadata)
+
+        with open(os.path.join(tmp_dir, self.MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+
+        old_dir = final_dir + '.old'
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if os.path.exists(final_dir):
+            os.replace(final_dir, old_dir)
+        os.replace(tmp_dir, final_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        # Segments older than the snapshot are fully contained in it
+        for sequence in self._list_segments():
+            if sequence < next_sequence:
+                os.remove(self._segment_path(sequence))
+
+        self.last_snapshot = time.monotonic()
+
+    def load(
+        self
+    ) -> Tuple[List[Tuple[datetime, str, float, Dict[str, str], Optional[Dict[str, Any]]]],
+               List[Tuple[str, float]],
+               Dict[str, Dict[str, float]]]:
+        """Load retained points, replayable aggregate updates and base aggregates
+
+        Returns ``(points, aggregate_updates, aggregates)`` where points are
+        ``(timestamp, name, value, labels, metadata)`` tuples in timestamp
+        order.
+        """
+
+        cutoff = (datetime.now() - self.retention).timestamp()
+        points = []
+        aggregates: Dict[str, Dict[str, float]] = {}
+        first_segment = 1
+
+        snapshot_dir = os.path.join(self.directory, self.SNAPSHOT_DIR)
+        manifest_path = os.path.join(snapshot_dir, self.MANIFEST_FILE)
+
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+            first_segment = manifest.get('wal_sequence', 1)
+            aggregates = manifest.get('aggregates', {})
+
+            if manifest.get('point_count', 0) > 0:
+                timestamps = np.load(os.path.join(snapshot_dir, 'timestamps.npy'), mmap_mode='r')
+
+                # Points are stored in time order, so the retained window is a suffix
+                start = int(np.searchsorted(timestamps, cutoff, side='left'))
+
+                if start < len(timestamps):
+                    values = np.load(os.path.join(snapshot_dir, 'values.npy'), mmap_mode='r')
+                    names = np.load(os.path.join(snapshot_dir, 'names.npy'), mmap_mode='r')
+                    labels = np.load(os.path.join(snapshot_dir, 'labels.npy'), mmap_mode='r')
+                    metadata = np.load(os.path.join(snapshot_dir, 'metadata.npy'), mmap_mode='r')
+
+                    name_table = manifest['names']
+                    label_table = [json.loads(l) for l in manifest['labels']]
+                    metadata_table = [json.loads(m) for m in manifest['metadata']]
+
+                    for ts, value, name, label, meta in zip(
+                        timestamps[start:].tolist(),
+                        values[start:].tolist(),
+                        names[start:].tolist(),
+                        labels[start:].tolist(),
+                        metadata[start:].tolist()
+                    ):
+                        points.append((
+                            datetime.fromtimestamp(ts),
+                            name_table[name],
+                            value,
+                            dict(label_table[label]),
+                            metadata_table[meta] if meta >= 0 else None
+                        ))
+
+        aggregate_updates = []
+        for record in self._replay(first_segment):
+            if record['k'] == 'point':
+                if record['t'] >= cutoff:
+                    points.append((
+                        datetime.fromtimestamp(record['t']),
+                        record['n'],
+                        record['v'],
+                        record['l'],
+                        record.get('m')
+                    ))
+            elif record['k'] == 'agg':
+                aggregate_updates.append((record['key'], record['v']))
+
+        return points, aggregate_updates, aggregates
+
+    def _replay(self, first_segment: int) -> Iterator[Dict[str, Any]]:
+        """Iterate WAL records from the given segment onward"""
+        self._wal.flush()
+
+        for sequence in self._list_segments():
+            if sequence < first_segment:
+                continue
+
+            with open(self._segment_path(sequence), 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write at the tail of a segment after a crash
+                        continue
+
+    def close(self):
+        """Close the active write-ahead segment"""
+        if self._wal and not self._wal.closed:
+            self._wal.close()
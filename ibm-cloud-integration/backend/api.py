@@ -6,9 +6,9 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, status
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
 
@@ -16,10 +16,13 @@ from qiskit import QuantumCircuit
 
 # Import modules
 from config import settings, validate_config
-from quantum import QiskitClient, QuantumOrchestrator, CircuitLibrary
-from organisms import OrganismEvaluator, OrganismRegistry, OrganismIDEBackend
+from quantum import QiskitClient, QuantumOrchestrator, CircuitLibrary, BudgetExceededError
+from organisms import (
+    OrganismEvaluator, OrganismRegistry, OrganismIDEBackend, BatchValidator, DNACache, TextEdit,
+    EvolutionEngine, create_organism_store
+)
 from storage import COSClient
-from analytics import CostTracker, MetricsCollector
+from analytics import CostTracker, MetricsCollector, MetricsStore, CostLedgerStore, create_federation
 from collaboration import TeamManager
 
 # Configure logging
@@ -32,9 +35,12 @@ orchestrator = None
 organism_registry = None
 organism_evaluator = None
 ide_backend = None
+batch_validator = None
+evolution_engine = None
 cos_client = None
 cost_tracker = None
 metrics_collector = None
+metrics_federation = None
 team_manager = None
 
 # WebSocket connections
@@ -49,6 +55,10 @@ class OrganismCreate(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class OrganismBulkCreate(BaseModel):
+    organisms: List[OrganismCreate]
+
+
 class CircuitExecute(BaseModel):
     organism_id: str
     circuit_qasm: Optional[str] = None
@@ -64,10 +74,37 @@ class JobSubmit(BaseModel):
     priority: int = 0
 
 
+class EvolutionRun(BaseModel):
+    generations: int = 1
+
+
 class DNAValidate(BaseModel):
     dna_code: str
 
 
+class CompletionAccept(BaseModel):
+    label: str
+
+
+class DocumentOpen(BaseModel):
+    document_id: str
+    dna_code: str
+    version: int = 0
+
+
+class DocumentEdit(BaseModel):
+    text: str
+    start_line: Optional[int] = None
+    start_character: Optional[int] = None
+    end_line: Optional[int] = None
+    end_character: Optional[int] = None
+
+
+class DocumentChange(BaseModel):
+    version: int
+    edits: List[DocumentEdit]
+
+
 class TeamCreate(BaseModel):
     name: str
     owner_email: str
@@ -85,6 +122,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     global quantum_client, orchestrator, organism_registry, organism_evaluator
     global ide_backend, cos_client, cost_tracker, metrics_collector, team_manager
+    global metrics_federation, batch_validator, evolution_engine
 
     # Startup
     logger.info("Starting DNALang IBM Integration API...")
@@ -98,17 +136,49 @@ async def lifespan(app: FastAPI):
         orchestrator = QuantumOrchestrator()
         await orchestrator.initialize()
 
-        organism_registry = OrganismRegistry()
+        # Parse/validation/compile results shared by the registry and IDE
+        dna_cache = DNACache(settings.DNA_CACHE_SIZE)
+        organism_registry = OrganismRegistry(
+            store=create_organism_store(
+                settings.ORGANISM_STORE_URL,
+                tenant_id=settings.ORGANISM_TENANT_ID,
+                owner_id=settings.ORGANISM_OWNER_ID
+            ),
+            dna_cache=dna_cache
+        )
         organism_evaluator = OrganismEvaluator()
-        ide_backend = OrganismIDEBackend()
+        evolution_engine = EvolutionEngine(
+            organism_registry,
+            organism_evaluator,
+            orchestrator,
+            max_workers=settings.EVOLUTION_WORKERS or None
+        )
+        ide_backend = OrganismIDEBackend(dna_cache=dna_cache)
+        batch_validator = BatchValidator(ide_backend, max_workers=settings.IDE_BATCH_WORKERS or None)
         cos_client = COSClient()
-        cost_tracker = CostTracker()
-        metrics_collector = MetricsCollector()
+        cost_tracker = CostTracker(
+            store=CostLedgerStore(settings.COST_LEDGER_DIR) if settings.COST_LEDGER_DIR else None
+        )
+        cost_tracker.clear_old_entries(settings.COST_RETENTION_DAYS)
+        orchestrator.budget_gate = cost_tracker.check_budget
+        orchestrator.cost_recorder = cost_tracker.track_quantum_execution
+        metrics_collector = MetricsCollector(
+            store=MetricsStore(
+                settings.METRICS_STORE_DIR,
+                snapshot_interval=settings.METRICS_SNAPSHOT_INTERVAL
+            ) if settings.METRICS_STORE_DIR else None
+        )
         team_manager = TeamManager()
 
         # Start orchestrator execution loop
         asyncio.create_task(orchestrator.execute_jobs())
 
+        # Share metrics across replicas
+        if settings.METRICS_FEDERATION_ENABLED:
+            metrics_federation = await create_federation()
+            metrics_collector.federation = metrics_federation
+            asyncio.create_task(metrics_federation.run())
+
         logger.info("API initialization complete")
 
     except Exception as e:
@@ -119,8 +189,20 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down API...")
+    if evolution_engine:
+        evolution_engine.shutdown()
     if orchestrator:
         await orchestrator.shutdown()
+    if metrics_federation:
+        await metrics_federation.close()
+    if metrics_collector:
+        metrics_collector.close()
+    if cost_tracker:
+        cost_tracker.close()
+    if organism_registry:
+        organism_registry.close()
+    if batch_validator:
+        batch_validator.shutdown()
 
 
 # Create FastAPI app
@@ -198,6 +280,66 @@ async def create_organism(organism: OrganismCreate):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/organisms/bulk")
+async def create_organisms_bulk(request: OrganismBulkCreate):
+    """Register a batch of organisms in one call (circuits are not compiled)"""
+    try:
+        organism_ids = organism_registry.register_many(
+            organism.dict() for organism in request.organisms
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    metrics_collector.record_api_request('POST', '/organisms/bulk', 200, 0.1)
+
+    return {
+        "organism_ids": organism_ids,
+        "count": len(organism_ids),
+        "success": True
+    }
+
+
+@app.post("/organisms/bulk/import")
+async def import_organisms_bulk(
+    request: Request,
+    preserve_lineage: bool = False,
+    batch_size: int = 1000
+):
+    """Import organisms streamed as NDJSON (one export document per line)"""
+    organism_ids: List[str] = []
+    lines: List[str] = []
+    buffer = b""
+
+    try:
+        async for chunk in request.stream():
+            buffer += chunk
+            *complete, buffer = buffer.split(b"\n")
+            lines.extend(line.decode() for line in complete)
+
+            if len(lines) >= batch_size:
+                organism_ids.extend(await asyncio.to_thread(
+                    organism_registry.import_jsonl, lines, preserve_lineage, batch_size
+                ))
+                lines = []
+
+        lines.append(buffer.decode())
+        organism_ids.extend(await asyncio.to_thread(
+            organism_registry.import_jsonl, lines, preserve_lineage, batch_size
+        ))
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{e} (imported {len(organism_ids)} organisms before the error)"
+        )
+
+    return {
+        "organism_ids": organism_ids,
+        "count": len(organism_ids),
+        "success": True
+    }
+
+
 @app.get("/organisms/{organism_id}")
 async def get_organism(organism_id: str):
     """Get organism details"""
@@ -209,6 +351,49 @@ async def get_organism(organism_id: str):
     return organism.to_dict()
 
 
+@app.get("/organisms/{organism_id}/lineage")
+async def get_organism_lineage(organism_id: str, max_depth: Optional[int] = None):
+    """Get ancestors of an organism (root first)"""
+    if not organism_registry.get_organism(organism_id):
+        raise HTTPException(status_code=404, detail="Organism not found")
+
+    lineage = organism_registry.get_lineage(organism_id, max_depth=max_depth)
+
+    return {
+        "organism_id": organism_id,
+        "lineage": [o.to_dict() for o in lineage],
+        "depth": len(lineage)
+    }
+
+
+@app.get("/organisms/{organism_id}/descendants")
+async def get_organism_descendants(
+    organism_id: str,
+    max_depth: Optional[int] = None,
+    limit: int = 100,
+    order: str = "bfs"
+):
+    """Get descendants of an organism"""
+    if not organism_registry.get_organism(organism_id):
+        raise HTTPException(status_code=404, detail="Organism not found")
+
+    try:
+        descendants = list(organism_registry.iter_descendants(
+            organism_id,
+            max_depth=max_depth,
+            limit=limit,
+            order=order
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "organism_id": organism_id,
+        "descendants": [o.to_dict() for o in descendants],
+        "total": organism_registry.count_descendants(organism_id)
+    }
+
+
 @app.get("/organisms")
 async def list_organisms(
     limit: int = 10,
@@ -269,6 +454,9 @@ async def execute_quantum_circuit(request: CircuitExecute):
             "backend": quantum_client.backend.name if quantum_client.backend else "unknown"
         }
 
+    except BudgetExceededError as e:
+        logger.warning(f"Execution rejected: {e}")
+        raise HTTPException(status_code=402, detail=str(e))
     except Exception as e:
         logger.error(f"Execution failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -371,14 +559,90 @@ async def evolve_organism(organism_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/evolution/species/{species}/run")
+async def run_species_evolution(species: str, request: EvolutionRun):
+    """Evolve a species population for some generations in the background"""
+    if species not in organism_registry.species_map:
+        raise HTTPException(status_code=404, detail="Species not found")
+    if request.generations < 1:
+        raise HTTPException(status_code=400, detail="generations must be at least 1")
+
+    if not evolution_engine.start(species, request.generations):
+        raise HTTPException(status_code=409, detail="Species is already evolving")
+
+    return {
+        "species": species,
+        "generations": request.generations,
+        "status": "started"
+    }
+
+
+@app.get("/evolution/species/{species}")
+async def get_species_evolution(species: str):
+    """Population evolution status and latest generation summary"""
+    if species not in organism_registry.species_map:
+        raise HTTPException(status_code=404, detail="Species not found")
+
+    return evolution_engine.status(species)
+
+
 # IDE endpoints
 @app.post("/ide/validate")
-async def validate_dna(request: DNAValidate):
-    """Validate DNALang syntax"""
+def validate_dna(request: DNAValidate):
+    """Validate DNALang syntax (runs in the threadpool, off the event loop)"""
     validation = ide_backend.validate_dna_syntax(request.dna_code)
     return validation
 
 
+@app.post("/ide/validate/batch")
+async def validate_dna_batch(request: Request, compile: bool = True):
+    """Validate (and compile) NDJSON documents across worker processes
+
+    Each input line is ``{"id": ..., "dna_code": ...}``. Results stream
+    back as NDJSON in completion order, each with its input ``index``.
+    """
+    malformed: List[Dict[str, Any]] = []
+
+    def decode(line: bytes, line_number: int):
+        try:
+            document = json.loads(line)
+            if not isinstance(document, dict):
+                raise TypeError("expected a JSON object")
+            if not isinstance(document["dna_code"], str):
+                raise TypeError("dna_code must be a string")
+            return document.get("id", line_number), document["dna_code"]
+        except (ValueError, KeyError, TypeError) as e:
+            malformed.append({"line": line_number, "error": f"Invalid document: {e}"})
+            return None
+
+    async def documents():
+        buffer = b""
+        line_number = 0
+
+        async for chunk in request.stream():
+            buffer += chunk
+            *complete, buffer = buffer.split(b"\n")
+            for line in complete:
+                line_number += 1
+                document = decode(line, line_number) if line.strip() else None
+                if document:
+                    yield document
+
+        document = decode(buffer, line_number + 1) if buffer.strip() else None
+        if document:
+            yield document
+
+    async def results():
+        async for result in batch_validator.stream(documents(), compile):
+            while malformed:
+                yield json.dumps(malformed.pop(0)) + "\n"
+            yield json.dumps(result) + "\n"
+        for error in malformed:
+            yield json.dumps(error) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @app.get("/ide/autocomplete")
 async def get_autocomplete(
     code: str,
@@ -389,6 +653,57 @@ async def get_autocomplete(
     return {"suggestions": suggestions}
 
 
+@app.post("/ide/autocomplete/accept")
+async def accept_autocomplete(request: CompletionAccept):
+    """Record an accepted suggestion (used to rank future suggestions)"""
+    if not ide_backend.record_completion(request.label):
+        raise HTTPException(status_code=404, detail="Unknown suggestion label")
+    return {"status": "recorded"}
+
+
+@app.post("/ide/documents")
+async def open_document(request: DocumentOpen):
+    """Open an editor document for incremental validation"""
+    return ide_backend.open_document(request.document_id, request.dna_code, request.version)
+
+
+@app.patch("/ide/documents/{document_id}")
+async def edit_document(document_id: str, request: DocumentChange):
+    """Apply editor changes and return validation for the new version"""
+    edits = [TextEdit(**edit.dict()) for edit in request.edits]
+    try:
+        return ide_backend.edit_document(document_id, request.version, edits)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Document not open")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@app.get("/ide/documents/{document_id}/autocomplete")
+async def get_document_autocomplete(
+    document_id: str,
+    line: int,
+    character: int,
+    version: Optional[int] = None
+):
+    """Get autocomplete suggestions at a position of an open document"""
+    try:
+        suggestions = ide_backend.get_document_suggestions(document_id, line, character, version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Document not open")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"suggestions": suggestions}
+
+
+@app.delete("/ide/documents/{document_id}")
+async def close_document(document_id: str):
+    """Close an editor document"""
+    if not ide_backend.close_document(document_id):
+        raise HTTPException(status_code=404, detail="Document not open")
+    return {"status": "closed"}
+
+
 @app.get("/ide/template/{template_type}")
 async def get_template(template_type: str = "basic"):
     """Get DNALang template"""
@@ -403,15 +718,43 @@ async def get_cost_analytics():
     return cost_tracker.get_cost_analytics()
 
 
+@app.get("/analytics/costs/export")
+async def export_costs(
+    format: str = "csv",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+):
+    """Stream cost entries as CSV or JSONL"""
+    if format not in ("csv", "jsonl"):
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'jsonl'")
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        cost_tracker.stream_cost_report(start, end, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=dnalang-costs.{format}"}
+    )
+
+
+@app.get("/analytics/costs/forecast")
+async def get_cost_forecast(history_days: int = 28):
+    """Get monthly cost forecast"""
+    return cost_tracker.predict_monthly_cost(history_days)
+
+
 @app.get("/analytics/metrics")
 async def get_metrics():
     """Get system metrics"""
+    if metrics_federation:
+        return await metrics_federation.export_metrics_report(metrics_collector)
     return metrics_collector.export_metrics_report()
 
 
 @app.get("/analytics/health")
 async def get_system_health():
     """Get system health"""
+    if metrics_federation:
+        return await metrics_federation.get_system_health()
     return metrics_collector.get_system_health()
 
 
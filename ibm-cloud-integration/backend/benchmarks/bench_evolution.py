@@ -0,0 +1,206 @@
+"""Population Evolution Benchmark
+
+Runs generations of ``EvolutionEngine`` over a seeded species and reports
+generations per hour with a per-stage breakdown, for several population
+sizes and worker counts. Circuit execution is replaced by an exact
+state-vector simulation (plus an optional fixed hardware latency), so the
+numbers measure the CPU side: selection, crossover, mutation, compilation,
+registration, bulk fitness evaluation and checkpointing.
+
+Run from the ibm-cloud-integration directory:
+
+    python -m backend.benchmarks.bench_evolution [--population 32 256] [--workers 1 4]
+"""
+
+import math
+import time
+import asyncio
+import argparse
+import tempfile
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from backend.organisms.compiler import CircuitProgram
+from backend.organisms.evaluator import OrganismEvaluator
+from backend.organisms.evolution import EvolutionEngine
+from backend.organisms.registry import OrganismRegistry
+
+
+ORGANISM_TEMPLATE = '''ORGANISM BenchOrganism {{
+  DNA {{
+    domain: "benchmark"
+    version: "1.0.0"
+  }}
+
+  GENOME {{
+    GENE entangler {{
+      purpose: "Entangle the register"
+
+      TRAITS {{
+        entanglement: {entanglement}
+        superposition: true
+        rotation_y: {rotation}
+      }}
+    }}
+
+    GENE rotator {{
+      purpose: "Local rotations"
+
+      TRAITS {{
+        superposition: {superposition}
+        rotation_x: {rotation}
+        phase_shift: true
+      }}
+    }}
+  }}
+
+  QUANTUM {{
+    n_qubits: {n_qubits}
+    shots: 1024
+  }}
+}}
+'''
+
+SINGLE_QUBIT = {
+    'h': lambda: np.array([[1, 1], [1, -1]]) / math.sqrt(2),
+    'x': lambda: np.array([[0, 1], [1, 0]]),
+    'rx': lambda t: np.array([[math.cos(t / 2), -1j * math.sin(t / 2)],
+                              [-1j * math.sin(t / 2), math.cos(t / 2)]]),
+    'ry': lambda t: np.array([[math.cos(t / 2), -math.sin(t / 2)],
+                              [math.sin(t / 2), math.cos(t / 2)]]),
+    'rz': lambda t: np.diag([np.exp(-0.5j * t), np.exp(0.5j * t)]),
+    'p': lambda t: np.diag([1, np.exp(1j * t)])
+}
+
+
+def simulate(program: CircuitProgram) -> Dict[str, Any]:
+    """Quantum results shaped like ``QiskitClient``'s, from the exact state"""
+    n = program.n_qubits
+    state = np.zeros((2,) * n, dtype=complex)
+    state[(0,) * n] = 1
+
+    for gate in program.gates:
+        if gate.name == 'cx':
+            control, target = gate.qubits
+            index = [slice(None)] * n
+            index[control] = 1
+            flipped = state[tuple(index)].copy()
+            axis = target - (target > control)
+            state[tuple(index)] = np.flip(flipped, axis=axis)
+        else:
+            matrix = SINGLE_QUBIT[gate.name](*gate.params)
+            state = np.moveaxis(np.tensordot(matrix, state, axes=([1], [gate.qubits[0]])), 0, gate.qubits[0])
+
+    probabilities = np.abs(state.reshape(-1)) ** 2
+    probabilities = probabilities[probabilities > 1e-12]
+    entropy = float(-(probabilities * np.log2(probabilities)).sum())
+    max_entropy = n or 1
+    gamma = float(np.var(probabilities) / (np.mean(probabilities) + 1e-10))
+
+    return {
+        'counts': {format(i, 'b'): 1 for i in range(len(probabilities))},
+        'probabilities': {format(i, 'b'): float(p) for i, p in enumerate(probabilities)},
+        'entropy': entropy,
+        'lambda': float(probabilities.max()) * 2.176435,
+        'phi': min((1 - abs(0.5 - entropy / max_entropy) * 2) * 0.987, 0.987),
+        'gamma': min(gamma, 10.0),
+        'transpiled_depth': program.depth(),
+        'n_qubits': n
+    }
+
+
+class SimulatedEngine(EvolutionEngine):
+    """Engine whose circuits run on a local simulator with a fixed latency"""
+
+    def __init__(self, *args, latency: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency = latency
+
+    async def execute(
+        self,
+        organism_ids: List[str],
+        programs: List[CircuitProgram]
+    ) -> List[Optional[Dict[str, Any]]]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [simulate(program) for program in programs]
+
+
+def seed_registry(size: int, n_qubits: int) -> OrganismRegistry:
+    rng = np.random.default_rng(0)
+    registry = OrganismRegistry()
+    registry.register_many(
+        {
+            'name': f"bench_{i}",
+            'dna_code': ORGANISM_TEMPLATE.format(
+                entanglement=rng.choice(['true', 'false', '"circular"', '"full"']),
+                superposition=rng.choice(['true', 'false']),
+                rotation=round(float(rng.uniform(0, math.pi)), 4),
+                n_qubits=n_qubits
+            )
+        }
+        for i in range(size)
+    )
+    return registry
+
+
+async def measure(args, population: int, workers: int) -> Dict[str, Any]:
+    registry = seed_registry(population, args.qubits)
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        engine = SimulatedEngine(
+            registry,
+            OrganismEvaluator(),
+            population_size=population,
+            max_workers=workers,
+            checkpoint_dir=checkpoint_dir,
+            latency=args.latency,
+            seed=0
+        )
+        try:
+            await engine.run_generation('BenchOrganism')  # Warm up the worker pool
+
+            start = time.perf_counter()
+            summaries = await engine.run('BenchOrganism', args.generations)
+            elapsed = time.perf_counter() - start
+        finally:
+            engine.shutdown()
+
+    stages: Dict[str, float] = {}
+    for summary in summaries:
+        for stage, seconds in summary['timings'].items():
+            stages[stage] = stages.get(stage, 0.0) + seconds / len(summaries)
+
+    return {
+        'generations_per_hour': 3600 * len(summaries) / elapsed,
+        'stages': stages,
+        'best_fitness': summaries[-1]['best_fitness']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--population', type=int, nargs='+', default=[32, 256])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--generations', type=int, default=5)
+    parser.add_argument('--qubits', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="simulated hardware seconds per generation batch")
+    args = parser.parse_args()
+
+    stages = ('breed', 'register', 'execute', 'evaluate', 'checkpoint')
+    print(f"{'population':>10} {'workers':>7} {'gen/hour':>10} {'best':>6} "
+          + ' '.join(f"{stage + ' ms':>13}" for stage in stages))
+
+    for population in args.population:
+        for workers in args.workers:
+            result = asyncio.run(measure(args, population, workers))
+            print(
+                f"{population:>10} {workers:>7} {result['generations_per_hour']:>10,.0f} "
+                f"{result['best_fitness']:>6.3f} "
+                + ' '.join(f"{result['stages'].get(stage, 0) * 1e3:>13.1f}" for stage in stages)
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Population Fitness Benchmark
+
+Times scoring a generation of random quantum results organism by organism
+with ``evaluate_fitness`` against ``population_metrics`` plus the
+vectorized ``evaluate_population``, followed by top-quartile selection.
+
+Run from the ibm-cloud-integration directory:
+
+    python -m backend.benchmarks.bench_fitness [--population 1000 10000 100000]
+"""
+
+import time
+import argparse
+from typing import Dict, List, Any
+
+import numpy as np
+
+from backend.organisms.evaluator import OrganismEvaluator
+
+
+def random_results(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Quantum results shaped like the orchestrator's, with 8-outcome distributions"""
+    rng = np.random.default_rng(seed)
+    probabilities = rng.dirichlet(np.ones(8), size)
+    return [
+        {
+            'phi': float(rng.uniform(0, 1)),
+            'lambda': float(rng.uniform(0, 20)),
+            'gamma': float(rng.uniform(0, 2)),
+            'entropy': float(rng.uniform(0, 3)),
+            'counts': {'000': 1},
+            'probabilities': {format(k, '03b'): float(p) for k, p in enumerate(row)},
+            'transpiled_depth': int(rng.integers(1, 100)),
+            'n_qubits': 3
+        }
+        for row in probabilities
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--population', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--generation', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'population':>10} {'scalar ms':>10} {'vector ms':>10} {'speedup':>8}")
+    for size in args.population:
+        results = random_results(size)
+        evaluator = OrganismEvaluator(cache_size=0, history_per_organism=1)
+
+        start = time.perf_counter()
+        scalar = [
+            evaluator.evaluate_fitness(f"org_{i}", result, args.generation)['total_fitness']
+            for i, result in enumerate(results)
+        ]
+        np.argsort(scalar)[-(size // 4):]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fitness = evaluator.evaluate_population(
+            **evaluator.population_metrics(results), generation=args.generation
+        )
+        np.argpartition(fitness['total_fitness'], -(size // 4))[-(size // 4):]
+        vector_time = time.perf_counter() - start
+
+        assert np.allclose(scalar, fitness['total_fitness'])
+        print(
+            f"{size:>10,} {scalar_time * 1e3:>10.1f} {vector_time * 1e3:>10.1f} "
+            f"{scalar_time / vector_time:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
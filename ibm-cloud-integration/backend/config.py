@@ -27,6 +27,7 @@ class Settings(BaseSettings):
     # Default Backends
     PRIMARY_BACKEND: str = "ibm_torino"
     FALLBACK_BACKENDS: list = ["ibm_kyoto", "ibm_osaka", "ibm_brisbane"]
+    MAX_QUBITS: int = 133  # Largest backend register (ibm_torino); compiler rejects more
 
     # IBM Cloud Object Storage
     COS_ENDPOINT: str = Field(
@@ -64,6 +65,22 @@ class Settings(BaseSettings):
     LAMBDA_PHI: float = 2.176435e-8
     PHI_THRESHOLD: float = 0.5
     MAX_EVOLUTION_GENERATIONS: int = 100
+    EVALUATION_CACHE_SIZE: int = 4096  # Memoized fitness scores
+    EVALUATION_HISTORY_PER_ORGANISM: int = 1000
+    EVALUATION_HISTORY_ORGANISMS: int = 10000  # Organisms with retained evaluation history
+    EVOLUTION_POPULATION_SIZE: int = 32
+    EVOLUTION_ELITE_COUNT: int = 2  # Best organisms carried over unchanged
+    EVOLUTION_TOURNAMENT_SIZE: int = 3
+    EVOLUTION_CROSSOVER_RATE: float = 0.7
+    EVOLUTION_MUTATION_RATE: float = 0.3  # Per compiler trait
+    EVOLUTION_WORKERS: int = 0  # Mutation/compile processes (0 = one per CPU)
+    EVOLUTION_JOB_TIMEOUT: int = 3600  # seconds to wait for a generation's circuits
+    EVOLUTION_CHECKPOINT_DIR: str = Field(
+        default=os.getenv("EVOLUTION_CHECKPOINT_DIR", ""),
+        description="Directory for per-generation population checkpoints (empty disables them; "
+                    "resuming also needs a persistent ORGANISM_STORE_URL)"
+    )
+    EVOLUTION_CHECKPOINT_KEEP: int = 5  # Latest checkpoints kept per species
 
     # API Configuration
     API_HOST: str = "0.0.0.0"
@@ -83,6 +100,26 @@ class Settings(BaseSettings):
     )
     MONGODB_DATABASE: str = "dnalang"
 
+    # Organism Persistence
+    ORGANISM_STORE_URL: str = Field(
+        default=os.getenv("ORGANISM_STORE_URL", ""),
+        description="Organism store: sqlite:///path/to.db or postgresql (empty keeps organisms in memory)"
+    )
+    ORGANISM_TENANT_ID: str = Field(
+        default=os.getenv("ORGANISM_TENANT_ID", ""),
+        description="Tenant UUID that owns registry organisms in PostgreSQL"
+    )
+    ORGANISM_OWNER_ID: str = Field(
+        default=os.getenv("ORGANISM_OWNER_ID", ""),
+        description="User UUID recorded as owner of registry organisms in PostgreSQL"
+    )
+    ORGANISM_DNA_RESIDENT: int = 4096  # Store-backed DNA bodies kept in memory
+
+    # IDE
+    IDE_MAX_OPEN_DOCUMENTS: int = 64
+    DNA_CACHE_SIZE: int = 1024  # Parsed/validated/compiled DNA bodies kept in memory
+    IDE_BATCH_WORKERS: int = 0  # Batch validation processes (0 = one per CPU)
+
     # Security
     SECRET_KEY: str = Field(
         default="dnalang-quantum-secret-key-2024",
@@ -93,6 +130,22 @@ class Settings(BaseSettings):
     # Analytics & Monitoring
     ENABLE_METRICS: bool = True
     METRICS_PORT: int = 9090
+    METRICS_STORE_DIR: str = Field(
+        default=os.getenv("METRICS_STORE_DIR", ""),
+        description="Directory for metrics snapshots and write-ahead log (empty disables persistence)"
+    )
+    METRICS_SNAPSHOT_INTERVAL: int = 300  # seconds between metrics snapshots
+    METRICS_FEDERATION_ENABLED: bool = False
+    METRICS_REPLICA_ID: str = Field(
+        default=os.getenv("HOSTNAME", ""),
+        description="Replica identifier for metrics federation (defaults to hostname)"
+    )
+    METRICS_FEDERATION_INTERVAL: int = 15  # seconds between delta pushes
+    COST_LEDGER_DIR: str = Field(
+        default=os.getenv("COST_LEDGER_DIR", ""),
+        description="Directory for the append-only cost ledger (empty keeps costs in memory)"
+    )
+    COST_RETENTION_DAYS: int = 90
 
     # Transpilation Settings
     OPTIMIZATION_LEVEL: int = 3
@@ -3,5 +3,16 @@
 from .evaluator import OrganismEvaluator
 from .registry import OrganismRegistry
 from .ide import OrganismIDEBackend
+from .workspace import DocumentCache, EditableDocument, TextEdit
+from .dna_cache import DNACache
+from .compiler import CircuitProgram, Gate
+from .batch import BatchValidator
+from .evolution import EvolutionEngine
+from .storage import OrganismStore, SQLiteOrganismStore, PostgresOrganismStore, create_organism_store
 
-__all__ = ["OrganismEvaluator", "OrganismRegistry", "OrganismIDEBackend"]
\ No newline at end of file
+__all__ = [
+    "OrganismEvaluator", "OrganismRegistry", "OrganismIDEBackend",
+    "DocumentCache", "EditableDocument", "TextEdit", "DNACache",
+    "CircuitProgram", "Gate", "BatchValidator", "EvolutionEngine",
+    "OrganismStore", "SQLiteOrganismStore", "PostgresOrganismStore", "create_organism_store"
+]
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""Parallel Batch Validation and Compilation of DNALang Documents"""
+
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, AsyncIterable, AsyncIterator, Tuple, Union
+
+from .ide import OrganismIDEBackend
+from .compiler import CircuitProgram
+
+_worker_backend: Optional[OrganismIDEBackend] = None
+
+
+def _backend() -> OrganismIDEBackend:
+    """Per-process IDE backend, so each worker keeps its own DNA cache"""
+    global _worker_backend
+    if _worker_backend is None:
+        _worker_backend = OrganismIDEBackend()
+    return _worker_backend
+
+
+def process_chunk(
+    documents: List[Tuple[int, str]],
+    compile_circuits: bool
+) -> List[Tuple[int, Dict[str, Any], Union[CircuitProgram, str, None]]]:
+    """Validate (and compile) documents in a worker process
+
+    Returns ``(index, validation, program)`` per document, where program is
+    the optimized gate list, an error message, or None when not compiling.
+    A document that raises unexpectedly comes back as ``(index, None,
+    message)`` so it cannot fail the rest of its chunk.
+    """
+    backend = _backend()
+    results = []
+
+    for index, dna_code in documents:
+        try:
+            validation = backend.validate_dna_syntax(dna_code)
+            program: Union[CircuitProgram, str, None] = None
+            if compile_circuits:
+                try:
+                    program = backend.compile_program(dna_code)
+                except ValueError as e:
+                    program = str(e)
+        except Exception as e:
+            results.append((index, None, f"{type(e).__name__}: {e}"))
+            continue
+        results.append((index, validation, program))
+
+    return results
+
+
+class BatchValidator:
+    """Validates and compiles document streams across a process pool
+
+    Documents are sent to workers in chunks to amortize pickling, with a
+    bounded number of chunks in flight so arbitrarily long inputs stream
+    through in constant memory. Results are yielded as chunks finish (not
+    in input order; each carries its input ``index``). Documents whose
+    results are already in the parent's DNA cache are answered without a
+    round trip, and worker results are added to it.
+    """
+
+    def __init__(
+        self,
+        backend: OrganismIDEBackend,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 16
+    ):
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = self.max_workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def stream(
+        self,
+        documents: AsyncIterable[Tuple[Any, str]],
+        compile_circuits: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a result per ``(document_id, dna_code)`` as it completes"""
+        loop = asyncio.get_running_loop()
+        cache = self.backend.dna_cache
+
+        pending: Dict[asyncio.Future, List[Tuple[int, str]]] = {}
+        ids: Dict[int, Any] = {}
+        chunk: List[Tuple[int, str]] = []
+        index = 0
+
+        def submit():
+            future = loop.run_in_executor(self.executor, process_chunk, chunk, compile_circuits)
+            pending[future] = chunk
+
+        async def drain(block: bool) -> List[Dict[str, Any]]:
+            """Results of finished chunks, waiting for one if block is set"""
+            if block:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            results = []
+            for future in [future for future in pending if future.done()]:
+                documents = dict(pending.pop(future))
+                try:
+                    processed = future.result()
+                except Exception as e:
+                    results.extend(
+                        {'index': i, 'id': ids.pop(i), 'error': f'Worker failed: {e}'}
+                        for i in documents
+                    )
+                    continue
+
+                for i, validation, program in processed:
+                    if validation is None:
+                        results.append({'index': i, 'id': ids.pop(i), 'error': f'Processing failed: {program}'})
+                        continue
+
+                    dna_code = documents[i]
+                    cache.put(dna_code, 'validation', validation)
+                    if isinstance(program, CircuitProgram):
+                        cache.put(dna_code, 'program', program)
+                    results.append(self._result(i, ids.pop(i), validation, program, compile_circuits))
+            return results
+
+        async for document_id, dna_code in documents:
+            validation = cache.peek(dna_code, 'validation')
+            program = cache.peek(dna_code, 'program') if compile_circuits else None
+
+            if validation is not None and (program is not None or not compile_circuits):
+                yield self._result(index, document_id, validation, program, compile_circuits)
+            else:
+                ids[index] = document_id
+                chunk.append((index, dna_code))
+                if len(chunk) >= self.chunk_size:
+                    submit()
+                    chunk = []
+
+                for result in await drain(block=len(pending) >= self.max_pending):
+                    yield result
+
+            index += 1
+
+        if chunk:
+            submit()
+
+        while pending:
+            for result in await drain(block=True):
+                yield result
+
+    @staticmethod
+    def _result(
+        index: int,
+        document_id: Any,
+        validation: Dict[str, Any],
+        program: Union[CircuitProgram, str, None],
+        compile_circuits: bool
+    ) -> Dict[str, Any]:
+        result = {'index': index, 'id': document_id, 'validation': validation}
+
+        if compile_circuits:
+            if isinstance(program, CircuitProgram):
+                result['compilation'] = {
+                    'compiled': True,
+                    'n_qubits': program.n_qubits,
+                    'gates': len(program.gates),
+                    'lowered_gates': program.lowered_gates,
+                    'depth': program.depth(),
+                    'gate_counts': program.gate_counts()
+                }
+            else:
+                result['compilation'] = {'compiled': False, 'error': program}
+
+        return result
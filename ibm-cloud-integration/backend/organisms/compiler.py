@@ -0,0 +1,198 @@
+"""DNALang to Quantum Circuit Compiler"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
+
+from .dnalang import Document
+from ..config import settings
+
+# Gates that are their own inverse, and single-parameter rotations that add
+SELF_INVERSE = {'h', 'x', 'y', 'z', 'cx', 'cz', 'swap'}
+SYMMETRIC = {'cz', 'swap'}
+ROTATIONS = {'rx', 'ry', 'rz', 'p'}
+
+ROTATION_TRAITS = {'rotation_x': 'rx', 'rotation_y': 'ry', 'rotation_z': 'rz'}
+TWO_PI = 2 * math.pi
+
+
+class Gate(NamedTuple):
+    """Intermediate gate: lower-case Qiskit method name, qubits and parameters"""
+    name: str
+    qubits: Tuple[int, ...]
+    params: Tuple[float, ...] = ()
+
+
+@dataclass
+class CircuitProgram:
+    """Gate list for an organism, independent of Qiskit (and picklable)"""
+    n_qubits: int
+    gates: List[Gate] = field(default_factory=list)
+    lowered_gates: int = 0  # Gate count before optimization
+
+    def gate_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for gate in self.gates:
+            counts[gate.name] = counts.get(gate.name, 0) + 1
+        return counts
+
+    def depth(self) -> int:
+        levels = [0] * self.n_qubits
+        for gate in self.gates:
+            level = max(levels[q] for q in gate.qubits) + 1
+            for q in gate.qubits:
+                levels[q] = level
+        return max(levels, default=0)
+
+
+def _flag(value: Any) -> bool:
+    """Trait flag: true booleans, or "true"/"yes"/"on" strings"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', 'yes', 'on')
+    return value is True
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _qubit_count(quantum: Dict[str, Any]) -> int:
+    value = quantum.get('n_qubits', 5)
+    try:
+        n_qubits = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"n_qubits must be an integer, got {value!r}")
+    if isinstance(value, bool) or n_qubits < 1 or n_qubits != _number(value):
+        raise ValueError(f"n_qubits must be a positive integer, got {value!r}")
+    if n_qubits > settings.MAX_QUBITS:
+        raise ValueError(f"n_qubits must be at most {settings.MAX_QUBITS}, got {n_qubits}")
+    return n_qubits
+
+
+def lower_traits(traits: Dict[str, Any], n_qubits: int) -> List[Gate]:
+    """Gates for one gene's typed traits
+
+    ``entanglement`` (true/"linear", "circular" or "full") adds CX layers,
+    ``superposition`` an H layer, ``phase_shift`` (true for the lambda-phi
+    phase, or an angle) a P layer and ``rotation_x/y/z`` angle RX/RY/RZ
+    layers, in that order.
+    """
+    gates: List[Gate] = []
+    qubits = range(n_qubits)
+
+    entanglement = traits.get('entanglement', False)
+    topology = entanglement.strip().lower() if isinstance(entanglement, str) else None
+    if _flag(entanglement) or topology in ('linear', 'circular', 'full'):
+        if topology == 'full':
+            gates.extend(Gate('cx', (i, j)) for i in qubits for j in range(i + 1, n_qubits))
+        else:
+            gates.extend(Gate('cx', (i, i + 1)) for i in range(n_qubits - 1))
+            if topology == 'circular' and n_qubits > 2:
+                gates.append(Gate('cx', (n_qubits - 1, 0)))
+
+    if _flag(traits.get('superposition', False)):
+        gates.extend(Gate('h', (i,)) for i in qubits)
+
+    phase_shift = traits.get('phase_shift', False)
+    angle = settings.LAMBDA_PHI * 1e8 if _flag(phase_shift) else _number(phase_shift)
+    if angle:
+        gates.extend(Gate('p', (i,), (angle,)) for i in qubits)
+
+    for trait, gate in ROTATION_TRAITS.items():
+        angle = _number(traits.get(trait))
+        if angle:
+            gates.extend(Gate(gate, (i,), (angle,)) for i in qubits)
+
+    return gates
+
+
+def lower(document: Document) -> CircuitProgram:
+    """Lower a parsed organism's GENE traits and QUANTUM config to gates"""
+    quantum = document.find('QUANTUM')
+    n_qubits = _qubit_count(quantum.field_values(raw=False) if quantum else {})
+
+    gates: List[Gate] = []
+    for gene in document.find_all('GENE'):
+        traits = gene.find('TRAITS')
+        if traits:
+            gates.extend(lower_traits(traits.field_values(raw=False), n_qubits))
+
+    return CircuitProgram(n_qubits, gates, len(gates))
+
+
+def optimize(gates: List[Gate], n_qubits: int) -> List[Gate]:
+    """Peephole pass: cancel adjacent self-inverse pairs, merge rotations
+
+    Gates are adjacent when each is the other's neighbour on every wire
+    they share. Each wire keeps a stack of gate positions, so removing a
+    pair exposes the gates before it and cancellations cascade
+    (``H X X H`` vanishes). Merged rotations that sum to a multiple of 2*pi
+    are dropped (up to global phase).
+    """
+    out: List[Optional[Gate]] = []
+    wires: List[List[int]] = [[] for _ in range(n_qubits)]
+
+    def remove(index: int):
+        for q in out[index].qubits:
+            wires[q].pop()
+        out[index] = None
+
+    for gate in gates:
+        first = wires[gate.qubits[0]]
+        index = first[-1] if first else None
+
+        if index is not None and all(wires[q] and wires[q][-1] == index for q in gate.qubits):
+            previous = out[index]
+            same_qubits = (
+                sorted(previous.qubits) == sorted(gate.qubits) if gate.name in SYMMETRIC
+                else previous.qubits == gate.qubits
+            )
+
+            if previous.name == gate.name and same_qubits:
+                if gate.name in SELF_INVERSE:
+                    remove(index)
+                    continue
+
+                if gate.name in ROTATIONS:
+                    angle = previous.params[0] + gate.params[0]
+                    if abs(math.remainder(angle, TWO_PI)) < 1e-12:
+                        remove(index)
+                    else:
+                        out[index] = Gate(gate.name, gate.qubits, (angle,))
+                    continue
+
+        position = len(out)
+        out.append(gate)
+        for q in gate.qubits:
+            wires[q].append(position)
+
+    return [gate for gate in out if gate is not None]
+
+
+def compile_program(document: Document) -> CircuitProgram:
+    """Lowered and optimized gate list for a parsed organism"""
+    program = lower(document)
+    program.gates = optimize(program.gates, program.n_qubits)
+    return program
+
+
+def to_circuit(program: CircuitProgram, measure: bool = True):
+    """Qiskit circuit for a program"""
+    from qiskit import QuantumCircuit
+
+    circuit = QuantumCircuit(program.n_qubits)
+    for gate in program.gates:
+        getattr(circuit, gate.name)(*gate.params, *gate.qubits)
+
+    if measure:
+        circuit.measure_all()
+    return circuit
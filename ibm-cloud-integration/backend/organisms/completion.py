@@ -0,0 +1,160 @@
+"""Prefix Trie and Fuzzy Ranking for IDE Autocomplete"""
+
+import threading
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+
+class _Node:
+    __slots__ = ('children', 'entries')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.entries: List[int] = []  # Entries in this subtree, in insertion order
+
+
+class CompletionTrie:
+    """Case-insensitive prefix trie over a fixed vocabulary of suggestions
+
+    Every node lists the entries below it, so a prefix lookup is a walk of
+    ``len(prefix)`` nodes with no subtree traversal. Items are built once
+    and must be treated as read-only.
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self.items: List[Dict[str, Any]] = []
+        self._keys: List[str] = []
+        self._initials: Dict[str, List[int]] = {}  # First character -> entries
+        self._root = _Node()
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: Dict[str, Any]):
+        entry = len(self.items)
+        key = item['label'].lower()
+        self.items.append(item)
+        self._keys.append(key)
+        if key:
+            self._initials.setdefault(key[0], []).append(entry)
+
+        node = self._root
+        node.entries.append(entry)
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+            node.entries.append(entry)
+
+    def prefix(self, prefix: str) -> List[int]:
+        """Entries whose label starts with prefix (case-insensitive)"""
+        node = self._root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.entries
+
+    def fuzzy(self, pattern: str) -> List[Tuple[int, int]]:
+        """(entry, gap) for labels starting with pattern[0] and containing the rest in order
+
+        ``gap`` counts characters skipped between matched ones, so
+        ``lrate`` matches ``learning_rate`` with a larger gap than ``lr``.
+        """
+        pattern = pattern.lower()
+        matches = []
+        for entry in self._initials.get(pattern[:1], ()):
+            key = self._keys[entry]
+            position = gap = 0
+            for char in pattern[1:]:
+                found = key.find(char, position + 1)
+                if found < 0:
+                    break
+                gap += found - position - 1
+                position = found
+            else:
+                matches.append((entry, gap))
+        return matches
+
+
+class CompletionIndex:
+    """Named vocabularies (per context) with usage-ranked completion
+
+    Prefix matches come first, then fuzzy (subsequence) matches for
+    partials of two or more characters; within each group, suggestions
+    accepted more often rank higher and ties keep vocabulary order.
+    Ranked results are memoized per query until usage changes.
+    """
+
+    MEMO_SIZE = 4096
+
+    def __init__(self, vocabularies: Dict[str, Iterable[Dict[str, Any]]]):
+        self.tries = {name: CompletionTrie(items) for name, items in vocabularies.items()}
+        self.labels = frozenset(item['label'] for trie in self.tries.values() for item in trie.items)
+        self.usage: Dict[str, int] = {}
+        self._memo: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def record_usage(self, label: str) -> bool:
+        """Count an accepted suggestion; labels outside every vocabulary are ignored"""
+        if label not in self.labels:
+            return False
+
+        with self._lock:
+            self.usage[label] = self.usage.get(label, 0) + 1
+            self._memo = {}
+        return True
+
+    def items(self, vocabularies: Iterable[str]) -> List[Dict[str, Any]]:
+        """All suggestions of vocabularies, in vocabulary order"""
+        return [dict(item) for name in vocabularies for item in self.tries[name].items]
+
+    def complete(
+        self,
+        vocabularies: Iterable[str],
+        partial: str,
+        limit: Optional[int] = 20,
+        fuzzy: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Suggestions from the vocabularies matching partial text"""
+        vocabularies = tuple(vocabularies)
+        key = (vocabularies, partial.lower(), limit, fuzzy)
+        ranked = self._memo.get(key)
+        if ranked is None:
+            ranked = self._rank(vocabularies, partial, limit, fuzzy)
+            if len(self._memo) >= self.MEMO_SIZE:
+                self._memo = {}
+            self._memo[key] = ranked
+        return [dict(item) for item in ranked]
+
+    def _rank(
+        self,
+        vocabularies: Tuple[str, ...],
+        partial: str,
+        limit: Optional[int],
+        fuzzy: bool
+    ) -> List[Dict[str, Any]]:
+        usage = self.usage
+        ranked: List[Tuple[int, int, int, int, Dict[str, Any]]] = []
+        seen = set()
+        order = 0
+
+        for name in vocabularies:
+            trie = self.tries[name]
+            prefixed = trie.prefix(partial)
+
+            for entry in prefixed:
+                item = trie.items[entry]
+                ranked.append((0, -usage.get(item['label'], 0), 0, order, item))
+                seen.add(item['label'])
+                order += 1
+
+            if fuzzy and len(partial) > 1 and len(prefixed) < len(trie):
+                for entry, gap in trie.fuzzy(partial):
+                    item = trie.items[entry]
+                    if item['label'] not in seen:
+                        ranked.append((1, -usage.get(item['label'], 0), gap, order, item))
+                        seen.add(item['label'])
+                        order += 1
+
+        ranked.sort(key=lambda rank: rank[:4])
+        return [rank[4] for rank in ranked[:limit]]
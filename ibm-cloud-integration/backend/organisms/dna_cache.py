@@ -0,0 +1,105 @@
+"""Content-Addressed Cache of Results Derived from DNA Text"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Callable
+
+from .dnalang import Document, parse
+
+
+class DNACache:
+    """Bounded LRU of parse trees, diagnostics and circuits per DNA body
+
+    Entries are keyed by the SHA-256 digest of the DNA text (the same key
+    as ``DNAPool``) and hold one value per kind, e.g. ``document``,
+    ``validation``, ``circuit`` or ``species``. The IDE backend and the
+    registry share one instance, so a template validated in the editor is
+    not parsed again when it is registered and compiled.
+
+    Values are computed outside the lock; concurrent misses for the same
+    key may compute twice, but the first stored value wins.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def digest(dna_code: str) -> bytes:
+        return hashlib.sha256(dna_code.encode()).digest()
+
+    def get_or_compute(
+        self,
+        dna_code: str,
+        kind: str,
+        compute: Callable[[str], Any],
+        digest: Optional[bytes] = None
+    ) -> Any:
+        """Cached ``compute(dna_code)`` for a kind of result"""
+        digest = digest or self.digest(dna_code)
+
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and kind in entry:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry[kind]
+            self.misses += 1
+
+        value = compute(dna_code)
+
+        with self._lock:
+            return self._store(digest).setdefault(kind, value)
+
+    def peek(self, dna_code: str, kind: str, digest: Optional[bytes] = None) -> Optional[Any]:
+        """Cached result if present, without computing it"""
+        digest = digest or self.digest(dna_code)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or kind not in entry:
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return entry[kind]
+
+    def put(self, dna_code: str, kind: str, value: Any, digest: Optional[bytes] = None):
+        """Store a result computed elsewhere (e.g. in a worker process)"""
+        digest = digest or self.digest(dna_code)
+        with self._lock:
+            self._store(digest).setdefault(kind, value)
+
+    def _store(self, digest: bytes) -> Dict[str, Any]:
+        """Entry for a digest, created (evicting the oldest) if missing; lock held"""
+        entry = self._entries.get(digest)
+        if entry is None:
+            entry = self._entries[digest] = {}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(digest)
+        return entry
+
+    def document(self, dna_code: str, digest: Optional[bytes] = None) -> Document:
+        """Parsed document (treat as read-only)"""
+        return self.get_or_compute(dna_code, 'document', parse, digest)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
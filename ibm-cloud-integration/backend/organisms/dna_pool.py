@@ -0,0 +1,125 @@
+"""Content-Addressed Pool of DNA Bodies"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Callable, Iterable, Tuple
+
+
+class DNAPool:
+    """DNA bodies deduplicated by SHA-256 digest
+
+    Organisms hold the digest of their DNA; identical bodies (common in
+    evolution runs where mutations are no-ops) are stored once and
+    reference counted. Bodies may be evicted while still referenced and
+    are then fetched again through ``loader(organism_id)`` on access, or
+    through ``batch_loader(organism_ids)`` by ``get_many``. Bodies that
+    can be reloaded (fetched from the store, or marked ``persisted`` once
+    written to it) share an LRU: at most ``max_loaded`` stay resident.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[str], Optional[str]]] = None,
+        batch_loader: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+        max_loaded: int = 1024
+    ):
+        self.bodies: Dict[bytes, str] = {}
+        self.refcounts: Dict[bytes, int] = {}
+        self.keys: Dict[bytes, bytes] = {}  # Canonical digest objects
+        self.resident: "OrderedDict[bytes, None]" = OrderedDict()  # Store-backed bodies, LRU order
+        self.loader = loader
+        self.batch_loader = batch_loader
+        self.max_loaded = max_loaded
+
+    def __len__(self) -> int:
+        return len(self.refcounts)
+
+    def add(self, dna_code: str) -> bytes:
+        """Reference a body, storing it if new; returns its digest"""
+        digest = hashlib.sha256(dna_code.encode()).digest()
+        digest = self.keys.setdefault(digest, digest)
+        self.refcounts[digest] = self.refcounts.get(digest, 0) + 1
+        self.bodies.setdefault(digest, dna_code)
+        return digest
+
+    def release(self, digest: Optional[bytes]):
+        """Drop a reference, freeing the body with the last one"""
+        if digest is None or digest not in self.refcounts:
+            return
+        self.refcounts[digest] -= 1
+        if self.refcounts[digest] <= 0:
+            del self.refcounts[digest]
+            del self.keys[digest]
+            self.bodies.pop(digest, None)
+            self.resident.pop(digest, None)
+
+    def evict(self, digest: bytes):
+        """Drop a body from memory, keeping references for lazy reload"""
+        if self.loader:
+            self.bodies.pop(digest, None)
+            self.resident.pop(digest, None)
+
+    def persisted(self, digests: Iterable[Optional[bytes]]):
+        """Put bodies just written to the store under the LRU bound"""
+        if not self.loader:
+            return
+        for digest in digests:
+            body = self.bodies.get(digest) if digest is not None else None
+            if body is not None:
+                self._keep(digest, body)
+
+    def _keep(self, digest: bytes, body: str):
+        """Cache a store-backed body, evicting the least recently used beyond the bound"""
+        self.bodies[digest] = body
+        self.resident[digest] = None
+        while len(self.resident) > self.max_loaded:
+            oldest, _ = self.resident.popitem(last=False)
+            self.bodies.pop(oldest, None)
+
+    def get(self, digest: Optional[bytes], organism_id: str) -> Optional[str]:
+        """Body for a digest, loading it for ``organism_id`` if evicted"""
+        if digest is None:
+            return None
+
+        body = self.bodies.get(digest)
+        if body is None and self.loader:
+            body = self.loader(organism_id)
+            if body is not None:
+                self._keep(digest, body)
+        elif digest in self.resident:
+            self.resident.move_to_end(digest)
+        return body
+
+    def get_many(self, keys: Iterable[Tuple[Optional[bytes], str]]) -> Dict[bytes, str]:
+        """Bodies for ``(digest, organism_id)`` pairs, loading evicted ones in one batch
+
+        The returned mapping holds every body found even when more were
+        loaded than ``max_loaded`` keeps resident.
+        """
+        found: Dict[bytes, str] = {}
+        missing: Dict[bytes, str] = {}  # Digest to an organism holding it
+        for digest, organism_id in keys:
+            if digest is None or digest in found or digest in missing:
+                continue
+            body = self.bodies.get(digest)
+            if body is not None:
+                found[digest] = body
+                if digest in self.resident:
+                    self.resident.move_to_end(digest)
+            else:
+                missing[digest] = organism_id
+
+        if not missing or not self.loader:
+            return found
+
+        if self.batch_loader:
+            loaded = self.batch_loader(list(missing.values()))
+        else:
+            loaded = {organism_id: self.loader(organism_id) for organism_id in missing.values()}
+
+        for digest, organism_id in missing.items():
+            body = loaded.get(organism_id)
+            if body is not None:
+                found[digest] = body
+                self._keep(digest, body)
+        return found
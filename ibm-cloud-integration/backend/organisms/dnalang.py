@@ -0,0 +1,406 @@
+"""DNALang Tokenizer and Parser"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+# Token kinds
+COMMENT, SPACE, STRING, NUMBER, IDENT, LBRACE, RBRACE, LBRACKET, RBRACKET, COLON, COMMA, OTHER = range(12)
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<comment>\#[^\n]*)
+   |(?P<space>\s+)
+   |(?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+   |(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)
+   |(?P<ident>[A-Za-z_]\w*)
+   |(?P<punct>[{}\[\]:,])
+   |(?P<other>.)
+""", re.VERBOSE)
+
+PUNCT_KINDS = {'{': LBRACE, '}': RBRACE, '[': LBRACKET, ']': RBRACKET, ':': COLON, ',': COMMA}
+GROUP_KINDS = {
+    'comment': COMMENT, 'space': SPACE, 'string': STRING,
+    'number': NUMBER, 'ident': IDENT, 'other': OTHER
+}
+
+# (kind, start, end) offsets into the source
+Token = Tuple[int, int, int]
+
+
+def tokenize(source: str, start: int = 0, end: Optional[int] = None) -> List[Token]:
+    """Tokenize source[start:end], skipping whitespace and comments
+
+    Offsets are absolute, so a document can be re-lexed from any token
+    boundary and spliced into an existing token list.
+    """
+    tokens: List[Token] = []
+    append = tokens.append
+    end = len(source) if end is None else end
+
+    for match in TOKEN_PATTERN.finditer(source, start, end):
+        group = match.lastgroup
+        if group == 'space' or group == 'comment':
+            continue
+        if group == 'punct':
+            kind = PUNCT_KINDS[match.group()]
+        else:
+            kind = GROUP_KINDS[group]
+        append((kind, match.start(), match.end()))
+
+    return tokens
+
+
+def scalar_value(kind: int, text: str) -> Any:
+    """Typed value of a single token"""
+    if kind == NUMBER:
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+
+    if kind == STRING:
+        return text[1:-1] if len(text) >= 2 and text[-1] == text[0] else text[1:]
+
+    if kind == IDENT:
+        if text == 'true':
+            return True
+        if text == 'false':
+            return False
+
+    return text
+
+
+def typed_value(items: List[Token], raw: str) -> Any:
+    """Typed field value: scalar, list, or the raw text
+
+    ``items`` are the value's tokens with offsets relative to ``raw``.
+    """
+    if len(items) == 1:
+        kind, start, end = items[0]
+        return scalar_value(kind, raw[start:end])
+
+    if items and items[0][0] == LBRACKET and items[-1][0] == RBRACKET:
+        elements = []
+        element: List[Token] = []
+        depth = 0
+        for item in items[1:-1]:
+            if item[0] == COMMA and depth == 0:
+                if element:
+                    elements.append(element)
+                element = []
+                continue
+            if item[0] == LBRACKET:
+                depth += 1
+            elif item[0] == RBRACKET:
+                depth -= 1
+            element.append(item)
+        if element:
+            elements.append(element)
+        return [
+            scalar_value(element[0][0], raw[element[0][1]:element[0][2]]) if len(element) == 1
+            else raw[element[0][1]:element[-1][2]]
+            for element in elements
+        ]
+
+    return raw
+
+
+@dataclass
+class Span:
+    """Source range [start, end) with the 1-based line of its start"""
+    start: int
+    end: int
+    line: int
+
+
+@dataclass
+class Field:
+    """``name: value`` member of a block"""
+    name: str
+    raw: str
+    value: Any
+    span: Span
+
+
+@dataclass
+class Block:
+    """``KIND [name] { ... }`` section; ``kind`` is None for bare braces"""
+    kind: Optional[str]
+    name: Optional[str]
+    span: Span
+    body_start: int
+    closed: bool = False
+    fields: List[Field] = field(default_factory=list)
+    blocks: List['Block'] = field(default_factory=list)
+
+    def field_values(self, raw: bool = True) -> Dict[str, Any]:
+        """Field name -> raw text (or typed value)"""
+        return {f.name: (f.raw if raw else f.value) for f in self.fields}
+
+    def walk(self) -> Iterator['Block']:
+        """This block and all nested blocks, pre-order, without recursion"""
+        stack = [self]
+        while stack:
+            block = stack.pop()
+            yield block
+            stack.extend(reversed(block.blocks))
+
+    def find(self, kind: str) -> Optional['Block']:
+        """First nested block (excluding self) of a kind"""
+        return next((b for b in self.walk() if b is not self and b.kind == kind), None)
+
+
+@dataclass
+class ParseIssue:
+    """Parser diagnostic"""
+    line: int
+    severity: str  # 'error' or 'warning'
+    message: str
+
+
+class Document:
+    """Parsed DNALang source: tokens, block tree and diagnostics"""
+
+    def __init__(self, source: str, tokens: Optional[List[Token]] = None):
+        self.source = source
+        self.tokens = tokens if tokens is not None else tokenize(source)
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+        self.blocks: List[Block] = []
+        self.fields: List[Field] = []  # Top-level fields (outside any block)
+        self.issues: List[ParseIssue] = []
+        Parser(self).parse()
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of an offset"""
+        return bisect_right(self.line_starts, offset)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def text(self, token: Token) -> str:
+        return self.source[token[1]:token[2]]
+
+    def walk(self) -> Iterator[Block]:
+        """All blocks, pre-order"""
+        for block in self.blocks:
+            yield from block.walk()
+
+    def find_all(self, kind: str) -> List[Block]:
+        return [block for block in self.walk() if block.kind == kind]
+
+    def find(self, kind: str) -> Optional[Block]:
+        return next((block for block in self.walk() if block.kind == kind), None)
+
+    def path_at(self, offset: int) -> List[Block]:
+        """Blocks whose body contains offset, outermost first"""
+        path = []
+        blocks = self.blocks
+        while True:
+            inner = None
+            for block in blocks:
+                if block.body_start > offset:
+                    break
+                if offset < block.span.end or (not block.closed and offset <= block.span.end):
+                    inner = block
+            if inner is None:
+                return path
+            path.append(inner)
+            blocks = inner.blocks
+
+
+class Parser:
+    """Predictive parser with error recovery
+
+    Grammar (LL(3))::
+
+        members := (field | block | '}')*
+        field   := IDENT ':' value
+        block   := IDENT [IDENT] '{' members '}' | '{' members '}'
+        value   := tokens to end of line, or a bracketed list
+
+    Unbalanced braces and malformed members become ``ParseIssue`` entries
+    rather than exceptions, so partial documents typed in the IDE still
+    produce a usable tree. Nesting is tracked with an explicit stack
+    instead of recursion, so deeply nested input cannot exhaust it.
+    """
+
+    def __init__(self, document: Document):
+        self.document = document
+        self.source = document.source
+        self.tokens = document.tokens
+        self.position = 0
+        self._warned_line = 0
+
+    def _issue(self, offset: int, message: str, severity: str = 'error'):
+        self.document.issues.append(ParseIssue(self.document.line_of(offset), severity, message))
+
+    def _unexpected(self, start: int, end: int):
+        """Warn once per line about tokens that are not part of a member"""
+        line = self.document.line_of(start)
+        if line != self._warned_line:
+            self._warned_line = line
+            self._issue(start, f"Unexpected '{self.source[start:end]}'", 'warning')
+
+    def _kind(self, index: int) -> Optional[int]:
+        return self.tokens[index][0] if index < len(self.tokens) else None
+
+    def parse(self):
+        document = self.document
+        tokens = self.tokens
+        n = len(tokens)
+        source = self.source
+
+        # Stack of open blocks; the document itself is the implicit root
+        stack: List[Block] = []
+
+        def add_block(block: Block):
+            (stack[-1].blocks if stack else document.blocks).append(block)
+            stack.append(block)
+
+        while self.position < n:
+            kind, start, end = tokens[self.position]
+
+            if kind == RBRACE:
+                if stack:
+                    block = stack.pop()
+                    block.closed = True
+                    block.span.end = end
+                else:
+                    self._issue(start, 'Unexpected closing brace')
+                self.position += 1
+
+            elif kind == LBRACE:
+                add_block(Block(None, None, Span(start, len(source), document.line_of(start)), end))
+                self.position += 1
+
+            elif kind == IDENT:
+                next_kind = self._kind(self.position + 1)
+
+                if next_kind == COLON:
+                    member = self._field()
+                    (stack[-1].fields if stack else document.fields).append(member)
+
+                elif next_kind == LBRACE:
+                    brace = tokens[self.position + 1]
+                    add_block(Block(
+                        source[start:end], None,
+                        Span(start, len(source), document.line_of(start)), brace[2]
+                    ))
+                    self.position += 2
+
+                elif next_kind == IDENT and self._kind(self.position + 2) == LBRACE:
+                    name = tokens[self.position + 1]
+                    brace = tokens[self.position + 2]
+                    add_block(Block(
+                        source[start:end], source[name[1]:name[2]],
+                        Span(start, len(source), document.line_of(start)), brace[2]
+                    ))
+                    self.position += 3
+
+                else:
+                    self._unexpected(start, end)
+                    self.position += 1
+
+            else:
+                self._unexpected(start, end)
+                self.position += 1
+
+        for block in stack:
+            self._issue(block.span.start, f'Unclosed brace for {block.kind or "block"}')
+
+    def _field(self) -> Field:
+        """Parse ``IDENT ':' value`` starting at the current token"""
+        tokens = self.tokens
+        n = len(tokens)
+        document = self.document
+
+        name_token = tokens[self.position]
+        colon = tokens[self.position + 1]
+        line = document.line_of(colon[1])
+        self.position += 2
+
+        value_tokens: List[Token] = []
+        depth = 0
+        while self.position < n:
+            token = tokens[self.position]
+            kind = token[0]
+
+            if depth == 0:
+                if kind in (RBRACE, LBRACE) or document.line_of(token[1]) != line:
+                    break
+            if kind == LBRACKET:
+                depth += 1
+            elif kind == RBRACKET:
+                depth -= 1
+
+            value_tokens.append(token)
+            self.position += 1
+
+            if depth < 0:
+                break
+
+        if depth > 0:
+            self._issue(name_token[1], "Unclosed '['")
+
+        if value_tokens:
+            base = value_tokens[0][1]
+            raw = self.source[base:value_tokens[-1][2]]
+            end = value_tokens[-1][2]
+        else:
+            base = 0
+            raw = ''
+            end = colon[2]
+
+        return Field(
+            name=self.source[name_token[1]:name_token[2]],
+            raw=raw,
+            value=typed_value([(kind, s - base, e - base) for kind, s, e in value_tokens], raw),
+            span=Span(name_token[1], end, document.line_of(name_token[1]))
+        )
+
+
+def parse(source: str) -> Document:
+    """Parse DNALang source"""
+    return Document(source)
+
+
+def format_source(document: Document, indent_size: int = 2) -> str:
+    """Re-indent source lines by brace depth computed from tokens
+
+    Braces inside strings and comments are ignored; a line starting with
+    ``}`` is dedented. Line contents are otherwise kept as written.
+    """
+    source = document.source
+    lines = source.split('\n')
+
+    # Net brace change and leading-close flag per line, from tokens
+    line_delta = [0] * len(lines)
+    starts_with_close = [False] * len(lines)
+    first_token_seen = [False] * len(lines)
+
+    for kind, start, _ in document.tokens:
+        index = document.line_of(start) - 1
+        if not first_token_seen[index]:
+            first_token_seen[index] = True
+            starts_with_close[index] = kind == RBRACE
+        if kind == LBRACE:
+            line_delta[index] += 1
+        elif kind == RBRACE:
+            line_delta[index] -= 1
+
+    formatted = []
+    depth = 0
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            formatted.append('')
+            depth = max(0, depth + line_delta[index])
+            continue
+
+        level = depth - 1 if starts_with_close[index] else depth
+        formatted.append(' ' * (max(0, level) * indent_size) + stripped)
+        depth = max(0, depth + line_delta[index])
+
+    return '\n'.join(formatted)
@@ -1,20 +1,156 @@
 """Organism Fitness Evaluation System"""
 
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Union
+from collections import OrderedDict, deque
 from datetime import datetime
-import json
-import hashlib
+import bisect
+import heapq
+import itertools
 
 from ..config import settings
 
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Fitness components in weighting order
+COMPONENTS = ('consciousness', 'coherence', 'information', 'stability', 'complexity')
+
+# Row of evaluate_population: components, weighted total and evolution potential
+FITNESS_DTYPE = np.dtype(
+    [(name, np.float64) for name in COMPONENTS + ('total_fitness', 'evolution_potential')]
+)
+
+
+class OrganismHistory:
+    """One organism's evaluations, in evaluation order and by generation
+
+    ``records`` holds ``(sequence, key, evaluation)`` in evaluation order,
+    bounded by ``maxlen`` (oldest dropped first). The same evaluations are
+    indexed sorted by ``(generation, sequence)``, so the latest generation
+    is the last entry, and ``columns`` exposes the trajectory as arrays,
+    rebuilt only after the history changes.
+    """
+
+    # Trajectory column -> (section, field) of an evaluation
+    COLUMNS = {
+        'generation': (None, 'generation'),
+        'fitness': (None, 'total_fitness'),
+        'evolution_potential': (None, 'evolution_potential'),
+        'phi': ('quantum_metrics', 'phi'),
+        'lambda': ('quantum_metrics', 'lambda')
+    }
+
+    __slots__ = ('records', 'maxlen', '_order', '_evaluations', '_columns')
+
+    def __init__(self, maxlen: int):
+        self.records: deque = deque()
+        self.maxlen = maxlen
+        self._order: List[tuple] = []  # Sorted (generation, sequence)
+        self._evaluations: List[Dict[str, Any]] = []  # Parallel to _order
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, sequence: int, key: tuple, evaluation: Dict[str, Any]):
+        """Add an evaluation, replacing the latest one if its key is identical"""
+        if self.records and self.records[-1][1] == key:
+            self._unindex(self.records.pop())
+        while self.records and len(self.records) >= self.maxlen:
+            self._unindex(self.records.popleft())
+
+        record = (sequence, key, evaluation)
+        self.records.append(record)
+        position = (evaluation['generation'], sequence)
+        index = bisect.bisect(self._order, position)
+        self._order.insert(index, position)
+        self._evaluations.insert(index, evaluation)
+        self._columns = None
+
+    def _unindex(self, record: tuple):
+        index = bisect.bisect_left(self._order, (record[2]['generation'], record[0]))
+        del self._order[index]
+        del self._evaluations[index]
+        self._columns = None
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recent evaluation of the highest generation"""
+        return self._evaluations[-1] if self._evaluations else None
+
+    def by_generation(self) -> List[Dict[str, Any]]:
+        """Evaluations sorted by generation (evaluation order within one)"""
+        return list(self._evaluations)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Trajectory as generation-sorted arrays (treat as read-only)"""
+        if self._columns is None:
+            self._columns = {
+                column: np.fromiter(
+                    (
+                        (evaluation[section] if section else evaluation)[name]
+                        for evaluation in self._evaluations
+                    ),
+                    dtype=np.float64,
+                    count=len(self._evaluations)
+                )
+                for column, (section, name) in self.COLUMNS.items()
+            }
+        return self._columns
+
 
 class OrganismEvaluator:
-    """Evaluate organism fitness based on quantum execution results"""
+    """Evaluate organism fitness based on quantum execution results
+
+    Scores are memoized in ``fitness_cache``, an LRU keyed by the metrics
+    that affect them, the generation and the weights, so repeated
+    evaluations of the same results skip the computation. History is kept
+    per organism, bounded in evaluations per organism and in organisms.
+    """
+
+    # Component weights of the total fitness
+    WEIGHTS = {
+        'consciousness': 0.3,
+        'coherence': 0.25,
+        'information': 0.2,
+        'stability': 0.15,
+        'complexity': 0.1
+    }
+
+    # Quantum result fields the scores depend on (besides counts and probabilities)
+    METRIC_KEYS = ('phi', 'lambda', 'gamma', 'entropy', 'transpiled_depth', 'n_qubits')
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        cache_size: int = settings.EVALUATION_CACHE_SIZE,
+        history_per_organism: int = settings.EVALUATION_HISTORY_PER_ORGANISM,
+        max_organisms: int = settings.EVALUATION_HISTORY_ORGANISMS
+    ):
+        self.weights = dict(weights or self.WEIGHTS)
+        self._weights_key = tuple(sorted(self.weights.items()))
+        self.cache_size = cache_size
+        self.history_per_organism = history_per_organism
+        self.max_organisms = max_organisms
+
+        # Organism ID -> history, least recently evaluated first
+        self.history: "OrderedDict[str, OrganismHistory]" = OrderedDict()
+        self.fitness_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._sequence = itertools.count()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def evaluation_history(self) -> List[Dict[str, Any]]:
+        """Retained evaluations of all organisms in evaluation order"""
+        return [
+            record[2]
+            for record in heapq.merge(*(history.records for history in self.history.values()))
+        ]
 
-    def __init__(self):
-        self.evaluation_history: List[Dict[str, Any]] = []
-        self.fitness_cache: Dict[str, float] = {}
+    def organism_history(self, organism_id: str) -> List[Dict[str, Any]]:
+        """Retained evaluations of one organism in evaluation order"""
+        history = self.history.get(organism_id)
+        return [record[2] for record in history.records] if history is not None else []
 
     def evaluate_fitness(
         self,
@@ -31,26 +167,59 @@ class OrganismEvaluator:
         entropy = quantum_results.get('entropy', 0)
         coherence_index = quantum_results.get('coherence_index', 0)
 
+        cache_key = self._generate_cache_key(quantum_results, generation)
+        scores = self._scores(cache_key, quantum_results, generation)
+
+        # Create evaluation record
+        evaluation = {
+            'organism_id': organism_id,
+            'generation': generation,
+            'timestamp': datetime.now().isoformat(),
+            'total_fitness': scores['total_fitness'],
+            'fitness_components': dict(scores['fitness_components']),
+            'evolution_potential': scores['evolution_potential'],
+            'quantum_metrics': {
+                'phi': phi,
+                'lambda': lambda_val,
+                'gamma': gamma,
+                'entropy': entropy,
+                'coherence_index': coherence_index
+            },
+            'recommendation': scores['recommendation']
+        }
+
+        self._record(organism_id, evaluation, cache_key)
+
+        return evaluation
+
+    def _scores(
+        self,
+        cache_key: tuple,
+        quantum_results: Dict[str, Any],
+        generation: int
+    ) -> Dict[str, Any]:
+        """Fitness components, total, potential and recommendation (memoized)"""
+        scores = self.fitness_cache.get(cache_key)
+        if scores is not None:
+            self.fitness_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return scores
+        self.cache_misses += 1
+
         # Multi-objective fitness calculation
         fitness_components = {
-            'consciousness': self._evaluate_consciousness(phi),
-            'coherence': self._evaluate_coherence(lambda_val, gamma),
-            'information': self._evaluate_information(entropy),
+            'consciousness': self._evaluate_consciousness(quantum_results.get('phi', 0)),
+            'coherence': self._evaluate_coherence(
+                quantum_results.get('lambda', 0), quantum_results.get('gamma', 1)
+            ),
+            'information': self._evaluate_information(quantum_results.get('entropy', 0)),
             'stability': self._evaluate_stability(quantum_results),
             'complexity': self._evaluate_complexity(quantum_results)
         }
 
         # Weighted fitness score
-        weights = {
-            'consciousness': 0.3,
-            'coherence': 0.25,
-            'information': 0.2,
-            'stability': 0.15,
-            'complexity': 0.1
-        }
-
         total_fitness = sum(
-            fitness_components[key] * weights[key]
+            fitness_components[key] * self.weights[key]
             for key in fitness_components
         )
 
@@ -60,32 +229,144 @@ class OrganismEvaluator:
             generation
         )
 
-        # Create evaluation record
-        evaluation = {
-            'organism_id': organism_id,
-            'generation': generation,
-            'timestamp': datetime.now().isoformat(),
-            'total_fitness': total_fitness,
+        scores = {
             'fitness_components': fitness_components,
+            'total_fitness': total_fitness,
             'evolution_potential': evolution_potential,
-            'quantum_metrics': {
-                'phi': phi,
-                'lambda': lambda_val,
-                'gamma': gamma,
-                'entropy': entropy,
-                'coherence_index': coherence_index
-            },
             'recommendation': self._generate_recommendation(total_fitness, evolution_potential)
         }
 
-        # Cache fitness score
-        cache_key = self._generate_cache_key(organism_id, generation)
-        self.fitness_cache[cache_key] = total_fitness
+        self.fitness_cache[cache_key] = scores
+        while len(self.fitness_cache) > self.cache_size:
+            self.fitness_cache.popitem(last=False)
 
-        # Store in history
-        self.evaluation_history.append(evaluation)
+        return scores
 
-        return evaluation
+    def _record(self, organism_id: str, evaluation: Dict[str, Any], cache_key: tuple):
+        """Append to the organism's history, replacing an identical latest evaluation"""
+        history = self.history.get(organism_id)
+        if history is None:
+            history = self.history[organism_id] = OrganismHistory(self.history_per_organism)
+            while len(self.history) > self.max_organisms:
+                self.history.popitem(last=False)
+        else:
+            self.history.move_to_end(organism_id)
+
+        key = (evaluation['generation'], cache_key)
+        history.append(next(self._sequence), key, evaluation)
+
+    def evaluate_population(
+        self,
+        phi: ArrayLike,
+        lambda_val: ArrayLike,
+        gamma: ArrayLike,
+        entropy: ArrayLike,
+        variance: Optional[ArrayLike] = None,
+        transpiled_depth: Optional[ArrayLike] = None,
+        n_qubits: Optional[ArrayLike] = None,
+        generation: Union[int, ArrayLike] = 0
+    ) -> np.ndarray:
+        """Fitness of a whole population at once, as a ``FITNESS_DTYPE`` array
+
+        Takes one value per organism for each metric and scores them with
+        the same formulas as ``evaluate_fitness``, vectorized. ``variance``
+        is the variance of each organism's measurement probabilities (NaN,
+        or None for all, where there were no counts); see
+        ``population_metrics`` to build the arguments from quantum results.
+        Nothing is cached or recorded in the history.
+        """
+        phi = np.asarray(phi, dtype=np.float64)
+        size = phi.shape[0]
+
+        def column(values: Optional[ArrayLike], default: float) -> np.ndarray:
+            if values is None:
+                return np.full(size, default)
+            return np.broadcast_to(np.asarray(values, dtype=np.float64), (size,))
+
+        lambda_val = column(lambda_val, 0.0)
+        gamma = column(gamma, 1.0)
+        entropy = column(entropy, 0.0)
+        variance = column(variance, np.nan)
+        transpiled_depth = column(transpiled_depth, 0.0)
+        n_qubits = column(n_qubits, 1.0)
+        generation = column(generation, 0.0)
+
+        fitness = np.empty(size, dtype=FITNESS_DTYPE)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = np.minimum(phi / 0.987, 1.0)
+            fitness['consciousness'] = 1 / (1 + np.exp(-10 * (normalized - 0.5)))
+
+            coherence_index = lambda_val / (gamma + 1e-10)
+            fitness['coherence'] = np.where(gamma == 0, 1.0, np.minimum(coherence_index / 10, 1.0))
+
+            information = np.exp(-((entropy - 2.0) ** 2) / (2 * 1.5 ** 2))
+            fitness['information'] = np.where(entropy <= 0, 0.0, information)
+
+            stability = 1.0 - np.minimum(variance / 0.25, 1.0)
+            fitness['stability'] = np.where(np.isnan(variance), 0.0, stability)
+
+            depth_ratio = transpiled_depth / n_qubits
+            complexity = np.where(depth_ratio <= 10.0, depth_ratio / 10.0, 10.0 / depth_ratio)
+            fitness['complexity'] = np.where(
+                (transpiled_depth == 0) | (n_qubits == 0), 0.0, complexity
+            )
+
+        components = np.column_stack([fitness[name] for name in COMPONENTS])
+
+        total = np.zeros(size)
+        for name in COMPONENTS:
+            total += fitness[name] * self.weights[name]
+        fitness['total_fitness'] = total
+
+        imbalance_score = np.minimum(components.std(axis=1) * 2, 1.0)
+        generation_factor = 1.0 - (generation / settings.MAX_EVOLUTION_GENERATIONS)
+        consciousness_potential = 1.0 - fitness['consciousness']
+        fitness['evolution_potential'] = np.minimum(
+            imbalance_score * 0.4 + generation_factor * 0.3 + consciousness_potential * 0.3,
+            1.0
+        )
+
+        return fitness
+
+    @staticmethod
+    def population_metrics(results: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """``evaluate_population`` arguments from per-organism quantum results"""
+        def column(key: str, default: float) -> np.ndarray:
+            return np.fromiter(
+                (result.get(key, default) for result in results),
+                dtype=np.float64,
+                count=len(results)
+            )
+
+        # Variance per organism over one flat array of all probabilities
+        distributions = [
+            list(result.get('probabilities', {}).values()) if result.get('counts') else []
+            for result in results
+        ]
+        lengths = np.fromiter(map(len, distributions), dtype=np.int64, count=len(results))
+        probabilities = np.fromiter(
+            itertools.chain.from_iterable(distributions), dtype=np.float64, count=int(lengths.sum())
+        )
+
+        variance = np.full(len(results), np.nan)
+        measured = lengths > 0
+        if measured.any():
+            sizes = lengths[measured]
+            starts = np.cumsum(lengths)[measured] - sizes
+            means = np.add.reduceat(probabilities, starts) / sizes
+            deviations = (probabilities - np.repeat(means, sizes)) ** 2
+            variance[measured] = np.add.reduceat(deviations, starts) / sizes
+
+        return {
+            'phi': column('phi', 0),
+            'lambda_val': column('lambda', 0),
+            'gamma': column('gamma', 1),
+            'entropy': column('entropy', 0),
+            'variance': variance,
+            'transpiled_depth': column('transpiled_depth', 0),
+            'n_qubits': column('n_qubits', 1)
+        }
 
     def _evaluate_consciousness(self, phi: float) -> float:
         """Evaluate consciousness component (0-1 scale)"""
@@ -213,9 +494,15 @@ class OrganismEvaluator:
             else:
                 return "REDESIGN: Low fitness and potential. Consider organism redesign."
 
-    def _generate_cache_key(self, organism_id: str, generation: int) -> str:
-        """Generate cache key for fitness score"""
-        return f"{organism_id}_{generation}"
+    def _generate_cache_key(self, quantum_results: Dict[str, Any], generation: int) -> tuple:
+        """Hashable key of the inputs that determine the fitness scores"""
+        return (
+            tuple(quantum_results.get(key) for key in self.METRIC_KEYS),
+            bool(quantum_results.get('counts')),
+            tuple(sorted(quantum_results.get('probabilities', {}).values())),
+            generation,
+            self._weights_key
+        )
 
     def compare_organisms(
         self,
@@ -228,13 +515,10 @@ class OrganismEvaluator:
 
         for org_id in organism_ids:
             # Get latest evaluation for each organism
-            org_evals = [
-                e for e in self.evaluation_history
-                if e['organism_id'] == org_id
-            ]
+            history = self.history.get(org_id)
 
-            if org_evals:
-                latest = max(org_evals, key=lambda x: x['generation'])
+            if history:
+                latest = history.latest()
                 comparisons.append({
                     'organism_id': org_id,
                     'metric_value': latest.get(metric, 0),
@@ -260,12 +544,8 @@ class OrganismEvaluator:
 
         trajectory = []
 
-        evaluations = [
-            e for e in self.evaluation_history
-            if e['organism_id'] == organism_id
-        ]
-
-        evaluations.sort(key=lambda x: x['generation'])
+        history = self.history.get(organism_id)
+        evaluations = history.by_generation() if history is not None else []
 
         for eval in evaluations:
             trajectory.append({
@@ -286,32 +566,30 @@ class OrganismEvaluator:
     ) -> Dict[str, Any]:
         """Predict generations needed to reach target fitness"""
 
-        trajectory = self.get_evolution_trajectory(organism_id)
+        history = self.history.get(organism_id)
 
-        if len(trajectory) < 2:
+        if history is None or len(history) < 2:
             return {
                 'prediction': 'insufficient_data',
                 'confidence': 0.0
             }
 
         # Calculate fitness improvement rate
-        recent_trajectory = trajectory[-5:]  # Last 5 generations
-        fitness_values = [t['fitness'] for t in recent_trajectory]
-        generations = [t['generation'] for t in recent_trajectory]
+        columns = history.columns()
+        x = columns['generation'][-5:]  # Last 5 generations
+        y = columns['fitness'][-5:]
 
         # Linear regression for trend
-        if len(fitness_values) >= 2:
+        if len(y) >= 2:
             # Simple linear fit
-            x = np.array(generations)
-            y = np.array(fitness_values)
 
             # Calculate slope
             n = len(x)
             slope = (n * np.sum(x * y) - np.sum(x) * np.sum(y)) / \
                    (n * np.sum(x ** 2) - np.sum(x) ** 2)
 
-            current_fitness = fitness_values[-1]
-            current_generation = generations[-1]
+            current_fitness = float(y[-1])
+            current_generation = x[-1]
 
             if slope > 0:
                 # Predict generations to target
@@ -347,15 +625,16 @@ class OrganismEvaluator:
 
     def export_evaluation_data(self) -> Dict[str, Any]:
         """Export all evaluation data"""
+        evaluation_history = self.evaluation_history
         return {
-            'evaluations': self.evaluation_history,
+            'evaluations': evaluation_history,
             'summary': {
-                'total_evaluations': len(self.evaluation_history),
-                'unique_organisms': len(set(e['organism_id'] for e in self.evaluation_history)),
-                'average_fitness': np.mean([e['total_fitness'] for e in self.evaluation_history])
-                                 if self.evaluation_history else 0,
-                'max_fitness': max([e['total_fitness'] for e in self.evaluation_history])
-                              if self.evaluation_history else 0
+                'total_evaluations': len(evaluation_history),
+                'unique_organisms': len(set(e['organism_id'] for e in evaluation_history)),
+                'average_fitness': np.mean([e['total_fitness'] for e in evaluation_history])
+                                 if evaluation_history else 0,
+                'max_fitness': max([e['total_fitness'] for e in evaluation_history])
+                              if evaluation_history else 0
             },
             'exported_at': datetime.now().isoformat()
         }
\ No newline at end of file
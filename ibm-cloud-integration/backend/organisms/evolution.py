@@ -0,0 +1,544 @@
+"""Generational Evolution Engine for Organism Populations"""
+
+import os
+import re
+import json
+import math
+import time
+import heapq
+import random
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import numpy as np
+
+from .compiler import CircuitProgram, compile_program, to_circuit
+from .dnalang import Block, Document, Field, parse
+from .evaluator import OrganismEvaluator
+from .mutation import apply_mutations
+from .registry import OrganismRegistry
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Compiler traits the mutation operator perturbs
+ENTANGLEMENT_VALUES = ('true', 'false', '"linear"', '"circular"', '"full"')
+ANGLE_TRAITS = ('phase_shift', 'rotation_x', 'rotation_y', 'rotation_z')
+TRUE_VALUES = ('true', 'yes', 'on')
+
+# (index, parent DNA, crossover partner DNA or None, seed)
+BreedTask = Tuple[int, str, Optional[str], int]
+
+# (index, child DNA, mutations, genes from partner, program or compile error)
+Offspring = Tuple[int, str, Dict[str, Any], int, Union[CircuitProgram, str]]
+
+
+def _genes(document: Document) -> List[Block]:
+    """Outermost closed GENE blocks in source order"""
+    genes: List[Block] = []
+    for block in document.find_all('GENE'):
+        if block.closed and (not genes or block.span.start >= genes[-1].span.end):
+            genes.append(block)
+    return genes
+
+
+def crossover(dna_code: str, partner_dna: str, rng: random.Random) -> Tuple[str, int]:
+    """Uniform gene crossover
+
+    Each GENE block of ``dna_code`` is replaced, with probability 1/2, by
+    the partner's gene at the same position; the rest of the organism
+    (DNA, QUANTUM, ...) is kept. Returns the child DNA and the number of
+    genes taken from the partner.
+    """
+    genes = _genes(parse(dna_code))
+    partner_genes = _genes(parse(partner_dna))
+
+    swaps = [
+        (gene, partner_gene)
+        for gene, partner_gene in zip(genes, partner_genes)
+        if rng.random() < 0.5
+    ]
+
+    # Splice from the end so earlier offsets stay valid
+    child = dna_code
+    for gene, partner_gene in reversed(swaps):
+        child = (
+            child[:gene.span.start]
+            + partner_dna[partner_gene.span.start:partner_gene.span.end]
+            + child[gene.span.end:]
+        )
+
+    return child, len(swaps)
+
+
+def _mutated_trait(trait: Field, rng: random.Random) -> Optional[str]:
+    """New raw value for a compiler trait, or None if it is not one"""
+    raw = trait.raw.strip().lower()
+
+    if trait.name == 'entanglement':
+        return rng.choice([value for value in ENTANGLEMENT_VALUES if value != raw])
+
+    if trait.name == 'superposition' or (trait.name == 'phase_shift' and isinstance(trait.value, bool)):
+        return 'false' if raw in TRUE_VALUES else 'true'
+
+    if trait.name in ANGLE_TRAITS and isinstance(trait.value, (int, float)) \
+            and not isinstance(trait.value, bool):
+        angle = trait.value * math.exp(rng.gauss(0, 0.25)) + rng.gauss(0, 0.05)
+        return repr(round(angle, 6))
+
+    return None
+
+
+def mutation_plan(document: Document, rng: random.Random, rate: float) -> Dict[str, Any]:
+    """Random ``trait_modification`` of the compiler traits present
+
+    Each distinct trait (entanglement topology, superposition, phase
+    shift and rotation angles) is mutated with probability ``rate``; the
+    plan is applied with ``MutationEngine`` like any other mutation.
+    """
+    traits: Dict[str, str] = {}
+    seen = set()
+
+    for block in document.find_all('TRAITS'):
+        for trait in block.fields:
+            if trait.name in seen:
+                continue
+            seen.add(trait.name)
+
+            if rng.random() < rate:
+                value = _mutated_trait(trait, rng)
+                if value is not None:
+                    traits[trait.name] = value
+
+    return {'trait_modification': traits} if traits else {}
+
+
+def process_chunk(tasks: List[BreedTask], mutation_rate: float) -> List[Offspring]:
+    """Cross over, mutate and compile offspring in a worker process
+
+    Each task carries its own seed, so results do not depend on how tasks
+    are split across workers.
+    """
+    offspring = []
+
+    for index, dna_code, partner_dna, seed in tasks:
+        rng = random.Random(seed)
+        swapped = 0
+        if partner_dna is not None:
+            dna_code, swapped = crossover(dna_code, partner_dna, rng)
+
+        document = parse(dna_code)
+        mutations = mutation_plan(document, rng, mutation_rate)
+        if mutations:
+            dna_code = apply_mutations(dna_code, mutations)
+            document = parse(dna_code)
+
+        program: Union[CircuitProgram, str]
+        try:
+            program = compile_program(document)
+        except ValueError as e:
+            program = str(e)
+
+        offspring.append((index, dna_code, mutations, swapped, program))
+
+    return offspring
+
+
+@dataclass
+class Population:
+    """Current generation of a species: members, their fitness and the RNG"""
+    species: str
+    generation: int
+    organism_ids: List[str]
+    fitness: np.ndarray
+    rng: np.random.Generator
+
+
+class EvolutionEngine:
+    """Evolves whole species populations one generation at a time
+
+    A generation keeps the ``elite_count`` fittest members, picks parents
+    by tournament selection, breeds offspring (gene crossover and trait
+    mutation, then compilation) across a process pool, registers the
+    viable ones in one batch, runs their circuits as a single orchestrator
+    batch, scores them with ``evaluate_population`` and checkpoints the new
+    population. Populations resume from the latest checkpoint, otherwise
+    they are seeded with the species' fittest registered organisms.
+    Resuming needs a persistent organism store (``ORGANISM_STORE_URL``):
+    a checkpoint whose members are no longer registered is archived and
+    the species starts again from generation 0.
+    """
+
+    CHECKPOINT_PREFIX = 'generation-'
+    CHECKPOINT_SUFFIX = '.json'
+
+    def __init__(
+        self,
+        registry: OrganismRegistry,
+        evaluator: OrganismEvaluator,
+        orchestrator: Optional[Any] = None,
+        population_size: int = settings.EVOLUTION_POPULATION_SIZE,
+        elite_count: int = settings.EVOLUTION_ELITE_COUNT,
+        tournament_size: int = settings.EVOLUTION_TOURNAMENT_SIZE,
+        crossover_rate: float = settings.EVOLUTION_CROSSOVER_RATE,
+        mutation_rate: float = settings.EVOLUTION_MUTATION_RATE,
+        shots: int = 1024,
+        max_workers: Optional[int] = None,
+        checkpoint_dir: str = settings.EVOLUTION_CHECKPOINT_DIR,
+        checkpoint_keep: int = settings.EVOLUTION_CHECKPOINT_KEEP,
+        job_timeout: float = settings.EVOLUTION_JOB_TIMEOUT,
+        seed: Optional[int] = None
+    ):
+        self.registry = registry
+        self.evaluator = evaluator
+        self.orchestrator = orchestrator
+        self.population_size = population_size
+        self.elite_count = elite_count
+        self.tournament_size = tournament_size
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.shots = shots
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.checkpoint_dir = checkpoint_dir
+        self.checkpoint_keep = max(checkpoint_keep, 1)
+        self.job_timeout = job_timeout
+        self.seed = seed
+
+        self.populations: Dict[str, Population] = {}
+        self.summaries: Dict[str, Dict[str, Any]] = {}  # Latest generation summary per species
+        self.tasks: Dict[str, asyncio.Task] = {}  # Background runs per species
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self):
+        for task in self.tasks.values():
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def population(self, species: str) -> Population:
+        """Current population of a species (checkpointed or seeded)"""
+        population = self.populations.get(species)
+        if population is not None:
+            return population
+
+        checkpoint = self.load_checkpoint(species)
+        if checkpoint is not None:
+            members = [
+                (organism_id, fitness)
+                for organism_id, fitness in zip(checkpoint['organism_ids'], checkpoint['fitness'])
+                if organism_id in self.registry.organisms
+            ]
+            if members:
+                rng = np.random.default_rng()
+                rng.bit_generator.state = checkpoint['rng_state']
+                population = Population(
+                    species,
+                    checkpoint['generation'],
+                    [organism_id for organism_id, _ in members],
+                    np.array([fitness for _, fitness in members], dtype=np.float64),
+                    rng
+                )
+                self.summaries.setdefault(species, checkpoint.get('summary'))
+
+        if population is None:
+            members = self.registry.get_species_members(species)
+            if not members:
+                raise KeyError(f"Species {species} has no organisms")
+            if checkpoint is not None:
+                self._archive_checkpoints(species)
+            members = heapq.nlargest(self.population_size, members, key=lambda o: o.fitness)
+            population = Population(
+                species,
+                0,
+                [organism.id for organism in members],
+                np.array([organism.fitness for organism in members], dtype=np.float64),
+                np.random.default_rng(self.seed)
+            )
+
+        self.populations[species] = population
+        return population
+
+    def select_parents(
+        self,
+        fitness: np.ndarray,
+        count: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """Indices of ``count`` tournament winners (sampled with replacement)"""
+        contestants = rng.integers(0, len(fitness), size=(count, self.tournament_size))
+        winners = fitness[contestants].argmax(axis=1)
+        return contestants[np.arange(count), winners]
+
+    async def run(self, species: str, generations: int = 1) -> List[Dict[str, Any]]:
+        """Run several generations, returning their summaries"""
+        return [await self.run_generation(species) for _ in range(generations)]
+
+    def start(self, species: str, generations: int = 1) -> bool:
+        """Run generations in the background; False if the species is already evolving"""
+        task = self.tasks.get(species)
+        if task is not None and not task.done():
+            return False
+
+        task = asyncio.create_task(self.run(species, generations))
+        self.tasks[species] = task
+
+        def finished(task: asyncio.Task):
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Evolution of {species} failed: {task.exception()}")
+
+        task.add_done_callback(finished)
+        return True
+
+    def status(self, species: str) -> Dict[str, Any]:
+        """Whether a species is evolving, and its latest generation summary"""
+        task = self.tasks.get(species)
+        latest = self.summaries.get(species)
+        if latest is None:
+            checkpoint = self.load_checkpoint(species)
+            latest = checkpoint.get('summary') if checkpoint else None
+
+        return {
+            'species': species,
+            'running': task is not None and not task.done(),
+            'latest': latest
+        }
+
+    async def run_generation(self, species: str) -> Dict[str, Any]:
+        """Breed, execute, evaluate and checkpoint one generation"""
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        mark = started
+
+        def lap(stage: str):
+            nonlocal mark
+            now = time.perf_counter()
+            timings[stage] = now - mark
+            mark = now
+
+        population = self.population(species)
+        rng = population.rng
+        fitness = population.fitness
+        parents = [self.registry.organisms[organism_id] for organism_id in population.organism_ids]
+
+        # Selection
+        elites = np.argsort(-fitness, kind='stable')[:min(self.elite_count, self.population_size)]
+        offspring_count = self.population_size - len(elites)
+        mothers = self.select_parents(fitness, offspring_count, rng)
+        fathers = self.select_parents(fitness, offspring_count, rng)
+        crossing = (rng.random(offspring_count) < self.crossover_rate) & (mothers != fathers)
+        seeds = rng.integers(0, np.iinfo(np.int64).max, size=offspring_count)
+
+        tasks = [
+            (
+                i,
+                parents[mothers[i]].dna_code,
+                parents[fathers[i]].dna_code if crossing[i] else None,
+                int(seeds[i])
+            )
+            for i in range(offspring_count)
+        ]
+
+        # Crossover, mutation and compilation across worker processes
+        offspring = await self._breed(tasks)
+        viable = [child for child in offspring if isinstance(child[4], CircuitProgram)]
+        lap('breed')
+
+        timestamp = datetime.now().isoformat()
+        specs = []
+        for index, dna_code, mutations, swapped, _ in viable:
+            mother = parents[mothers[index]]
+            metadata = {
+                'mutations': mutations,
+                'parent_fitness': mother.fitness,
+                'evolution_generation': population.generation + 1,
+                'evolution_timestamp': timestamp
+            }
+            if crossing[index]:
+                metadata['crossover_parent'] = parents[fathers[index]].id
+                metadata['crossover_genes'] = swapped
+
+            specs.append({
+                'name': f"{mother.name}_gen{mother.generation + 1}",
+                'dna_code': dna_code,
+                'author': 'evolution',
+                'parent_id': mother.id,
+                'metadata': metadata
+            })
+
+        # Store writes and file I/O run in threads so the API loop stays responsive
+        child_ids = await asyncio.to_thread(self.registry.register_many, specs) if specs else []
+        lap('register')
+
+        results = await self.execute(child_ids, [child[4] for child in viable]) if child_ids else []
+        lap('execute')
+
+        # Bulk fitness evaluation
+        measured = np.array([result is not None for result in results], dtype=bool)
+        scores = self.evaluator.evaluate_population(
+            **self.evaluator.population_metrics([result or {} for result in results]),
+            generation=[self.registry.organisms[organism_id].generation for organism_id in child_ids]
+        )
+        child_fitness = np.where(measured, scores['total_fitness'], 0.0)
+
+        await asyncio.to_thread(self.registry.update_many, {
+            organism_id: {'fitness': float(value), 'consciousness_level': float(result.get('phi', 0))}
+            for organism_id, value, result in zip(child_ids, child_fitness, results)
+            if result is not None
+        })
+        lap('evaluate')
+
+        population.organism_ids = [population.organism_ids[i] for i in elites] + child_ids
+        population.fitness = np.concatenate([fitness[elites], child_fitness])
+        population.generation += 1
+
+        best = int(np.argmax(population.fitness))
+        summary = {
+            'species': species,
+            'generation': population.generation,
+            'population': len(population.organism_ids),
+            'offspring': offspring_count,
+            'nonviable': offspring_count - len(viable),
+            'failed': int(len(results) - measured.sum()),
+            'best_organism_id': population.organism_ids[best],
+            'best_fitness': float(population.fitness[best]),
+            'mean_fitness': float(population.fitness.mean()),
+            'timings': timings,
+            'completed_at': timestamp
+        }
+
+        await asyncio.to_thread(self._checkpoint, population, summary)
+        lap('checkpoint')
+
+        duration = time.perf_counter() - started
+        summary['duration'] = duration
+        summary['generations_per_hour'] = 3600 / duration if duration > 0 else None
+        self.summaries[species] = summary
+
+        return summary
+
+    async def _breed(self, tasks: List[BreedTask]) -> List[Offspring]:
+        """Offspring for all tasks, in task order"""
+        if not tasks:
+            return []
+
+        loop = asyncio.get_running_loop()
+        size = -(-len(tasks) // (self.max_workers * 4))
+        chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+        processed = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, process_chunk, chunk, self.mutation_rate)
+            for chunk in chunks
+        ))
+        return [child for chunk in processed for child in chunk]
+
+    async def execute(
+        self,
+        organism_ids: List[str],
+        programs: List[CircuitProgram]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Quantum results per organism (None where the job failed)
+
+        All circuits of the generation go to the orchestrator as one batch.
+        Jobs unfinished after ``job_timeout`` are abandoned and scored as
+        failures.
+        """
+        if self.orchestrator is None:
+            raise RuntimeError("No orchestrator configured to execute circuits")
+
+        circuits = await asyncio.to_thread(lambda: [to_circuit(program) for program in programs])
+        job_ids = await self.orchestrator.submit_batch(
+            organism_ids,
+            circuits,
+            shots=self.shots,
+            metadata={'evolution': True}
+        )
+        try:
+            jobs = await self.orchestrator.wait_for_jobs(job_ids, timeout=self.job_timeout)
+        except asyncio.TimeoutError:
+            jobs = await self.orchestrator.abandon_jobs(job_ids)
+            logger.warning(
+                f"{sum(job is None for job in jobs)} of {len(jobs)} evolution jobs "
+                f"unfinished after {self.job_timeout}s, scored as failures"
+            )
+
+        return [job.result if job is not None and job.error is None else None for job in jobs]
+
+    def _species_dir(self, species: str) -> str:
+        return os.path.join(self.checkpoint_dir, re.sub(r'[^\w.-]', '_', species))
+
+    def _checkpoint(self, population: Population, summary: Dict[str, Any]):
+        """Write the population atomically as the species' latest checkpoint"""
+        if not self.checkpoint_dir:
+            return
+
+        directory = self._species_dir(population.species)
+        os.makedirs(directory, exist_ok=True)
+
+        data = {
+            'species': population.species,
+            'generation': population.generation,
+            'organism_ids': population.organism_ids,
+            'fitness': population.fitness.tolist(),
+            'rng_state': population.rng.bit_generator.state,
+            'summary': summary
+        }
+
+        path = os.path.join(
+            directory,
+            f"{self.CHECKPOINT_PREFIX}{population.generation:06d}{self.CHECKPOINT_SUFFIX}"
+        )
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(path + '.tmp', path)
+
+        # Keep only the latest checkpoint_keep generations
+        for filename in self._checkpoint_files(directory)[:-self.checkpoint_keep]:
+            os.remove(os.path.join(directory, filename))
+
+    def _checkpoint_files(self, directory: str) -> List[str]:
+        """Checkpoint file names in a species directory, oldest first"""
+        return sorted(
+            filename for filename in os.listdir(directory)
+            if filename.startswith(self.CHECKPOINT_PREFIX) and filename.endswith(self.CHECKPOINT_SUFFIX)
+        )
+
+    def _archive_checkpoints(self, species: str):
+        """Move a species' checkpoints aside so a reseeded run does not resume them"""
+        directory = self._species_dir(species)
+        archive = os.path.join(directory, f"archived-{datetime.now():%Y%m%dT%H%M%S%f}")
+        os.makedirs(archive)
+
+        for filename in self._checkpoint_files(directory):
+            os.replace(os.path.join(directory, filename), os.path.join(archive, filename))
+
+        logger.warning(
+            f"Checkpoints of {species} reference organisms missing from the registry; "
+            f"archived to {archive} and reseeding at generation 0"
+        )
+
+    def load_checkpoint(self, species: str) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint of a species, if any"""
+        if not self.checkpoint_dir:
+            return None
+
+        directory = self._species_dir(species)
+        if not os.path.isdir(directory):
+            return None
+
+        checkpoints = self._checkpoint_files(directory)
+        if not checkpoints:
+            return None
+
+        with open(os.path.join(directory, checkpoints[-1]), encoding='utf-8') as f:
+            return json.load(f)
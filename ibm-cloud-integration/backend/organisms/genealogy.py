@@ -0,0 +1,100 @@
+"""Genealogy Index over the Evolution Tree"""
+
+from typing import Dict, List, Optional
+
+
+class GenealogyIndex:
+    """Euler-tour interval index answering ancestry queries in O(1)
+
+    An iterative DFS assigns every node its pre-order position ``entry``
+    and subtree size; A is an ancestor of B exactly when B's entry falls
+    inside A's interval ``(entry[A], entry[A] + size[A])``. The tour is
+    rebuilt lazily (O(n), no recursion) on the first query after the tree
+    changed, so bursts of registrations pay for one rebuild.
+    """
+
+    def __init__(self, evolution_tree: Dict[str, List[str]], organisms: Dict[str, object]):
+        self.evolution_tree = evolution_tree
+        self.organisms = organisms
+
+        self.entry: Dict[str, int] = {}
+        self.size: Dict[str, int] = {}
+        self.depth: Dict[str, int] = {}
+        self.dirty = True
+
+    def invalidate(self):
+        """Mark the tour stale after the tree changed"""
+        self.dirty = True
+
+    def _children(self, node_id: str) -> List[str]:
+        return [
+            child_id for child_id in self.evolution_tree.get(node_id, [])
+            if child_id in self.organisms
+        ]
+
+    def rebuild(self):
+        """Recompute entry positions, subtree sizes and depths"""
+        children = set()
+        for node_id, child_ids in self.evolution_tree.items():
+            children.update(child_id for child_id in child_ids if child_id in self.organisms)
+
+        # Roots: organisms without a registered parent, plus unknown parents
+        roots = [node_id for node_id in self.organisms if node_id not in children]
+        roots.extend(
+            node_id for node_id in self.evolution_tree
+            if node_id not in self.organisms and node_id not in children
+        )
+
+        entry: Dict[str, int] = {}
+        size: Dict[str, int] = {}
+        depth: Dict[str, int] = {}
+        position = 0
+
+        for root_id in roots:
+            if root_id in entry:
+                continue
+
+            # (node, depth, exiting) frames; exit frames close the interval
+            stack = [(root_id, 0, False)]
+            while stack:
+                node_id, node_depth, exiting = stack.pop()
+                if exiting:
+                    size[node_id] = position - entry[node_id]
+                    continue
+
+                entry[node_id] = position
+                depth[node_id] = node_depth
+                position += 1
+
+                stack.append((node_id, node_depth, True))
+                for child_id in reversed(self._children(node_id)):
+                    stack.append((child_id, node_depth + 1, False))
+
+        self.entry = entry
+        self.size = size
+        self.depth = depth
+        self.dirty = False
+
+    def _ensure(self):
+        if self.dirty:
+            self.rebuild()
+
+    def is_ancestor(self, ancestor_id: str, organism_id: str) -> bool:
+        """True if ancestor_id is a strict ancestor of organism_id"""
+        self._ensure()
+        start = self.entry.get(ancestor_id)
+        position = self.entry.get(organism_id)
+        if start is None or position is None:
+            return False
+        return start < position < start + self.size[ancestor_id]
+
+    def count_descendants(self, organism_id: str) -> int:
+        """Number of descendants (excluding the organism itself)"""
+        self._ensure()
+        size = self.size.get(organism_id)
+        return size - 1 if size else 0
+
+    def generation_depth(self, organism_id: str) -> Optional[int]:
+        """Distance from the root of the organism's tree"""
+        self._ensure()
+        return self.depth.get(organism_id)
@@ -1,13 +1,119 @@
 """Organism IDE Backend Services"""
 
-import re
+import copy
 import json
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+from .dnalang import Document, ParseIssue, format_source
+from .dna_cache import DNACache
+from .compiler import CircuitProgram, compile_program, to_circuit
+from .completion import CompletionIndex
+from .workspace import DocumentCache, TextEdit
 from ..config import settings
 
 
+# Keyword documentation, built once and read-only
+DOCUMENTATION = MappingProxyType({
+    'ORGANISM': MappingProxyType({
+        'syntax': 'ORGANISM <name> { ... }',
+        'description': 'Defines a quantum organism with unique identity',
+        'example': 'ORGANISM QuantumOptimizer {\n  DNA { ... }\n  GENOME { ... }\n}'
+    }),
+    'DNA': MappingProxyType({
+        'syntax': 'DNA { <properties> }',
+        'description': 'Organism metadata and configuration',
+        'required_fields': ('domain', 'version', 'quantum_enabled', 'lambda_phi'),
+        'example': 'DNA {\n  domain: "quantum_computing"\n  version: "1.0.0"\n  quantum_enabled: true\n  lambda_phi: 2.176435e-8\n}'
+    }),
+    'GENOME': MappingProxyType({
+        'syntax': 'GENOME { <genes> }',
+        'description': 'Collection of genes defining organism behavior',
+        'example': 'GENOME {\n  GENE optimizer { ... }\n  GENE evaluator { ... }\n}'
+    }),
+    'GENE': MappingProxyType({
+        'syntax': 'GENE <name> { <properties> }',
+        'description': 'Individual functional unit of organism',
+        'properties': ('purpose', 'TRAITS', 'MUTATIONS'),
+        'example': 'GENE optimizer {\n  purpose: "Optimize quantum circuits"\n  TRAITS { ... }\n}'
+    }),
+    'TRAITS': MappingProxyType({
+        'syntax': 'TRAITS { <trait_definitions> }',
+        'description': 'Behavioral characteristics of a gene',
+        'example': 'TRAITS {\n  learning_rate: 0.01\n  mutation_probability: 0.1\n}'
+    }),
+    'MUTATIONS': MappingProxyType({
+        'syntax': 'MUTATIONS { <mutation_rules> }',
+        'description': 'Evolution rules for gene adaptation',
+        'example': 'MUTATIONS {\n  adaptive_learning {\n    trigger: "fitness < 0.5"\n    action: "increase learning_rate"\n  }\n}'
+    }),
+    'QUANTUM': MappingProxyType({
+        'syntax': 'QUANTUM { <quantum_config> }',
+        'description': 'Quantum backend and circuit configuration',
+        'properties': ('backend', 'circuits', 'optimization_level'),
+        'example': 'QUANTUM {\n  backend: "ibm_torino"\n  optimization_level: 3\n}'
+    })
+})
+
+
+def _values(*labels: str) -> Tuple[Dict[str, Any], ...]:
+    return tuple({'label': label, 'kind': 'value'} for label in labels)
+
+
+# Suggested values per field (context independent)
+FIELD_VALUES = MappingProxyType({
+    'backend': (
+        {'label': 'ibm_torino', 'kind': 'value', 'detail': '133 qubits'},
+        {'label': 'ibm_kyoto', 'kind': 'value', 'detail': '127 qubits'},
+        {'label': 'ibm_osaka', 'kind': 'value', 'detail': '127 qubits'},
+        {'label': 'aer_simulator', 'kind': 'value', 'detail': 'Simulator'}
+    ),
+    'quantum_enabled': _values('true', 'false'),
+    'domain': _values('quantum_computing', 'optimization', 'machine_learning', 'cryptography'),
+    'version': _values('"1.0.0"', '"0.1.0"'),
+    'lambda_phi': (
+        {'label': str(settings.LAMBDA_PHI), 'kind': 'value', 'detail': 'Universal constant'},
+    ),
+    'optimization_level': (
+        {'label': '3', 'kind': 'value', 'detail': 'Maximum optimization'},
+        {'label': '2', 'kind': 'value', 'detail': 'Medium optimization'},
+        {'label': '1', 'kind': 'value', 'detail': 'Light optimization'}
+    ),
+    'entanglement': _values('true', 'false', '"linear"', '"circular"', '"full"'),
+    'superposition': _values('true', 'false'),
+    'phase_shift': _values('true', 'false')
+})
+
+
+def _properties(*labels: str) -> Tuple[Dict[str, Any], ...]:
+    return tuple({'label': label, 'kind': 'property'} for label in labels)
+
+
+# Completion vocabularies: section keywords and per-context members
+COMPLETIONS = {
+    'sections': tuple(
+        {'label': kw, 'kind': 'keyword', 'detail': 'Section'}
+        for kw in ['ORGANISM', 'DNA', 'GENOME', 'PHENOME', 'QUANTUM']
+    ),
+    'GENOME': (
+        {'label': 'GENE', 'kind': 'keyword', 'detail': 'Define gene'},
+        {'label': 'regulatory_network', 'kind': 'property'},
+        {'label': 'expression_level', 'kind': 'property'}
+    ),
+    'GENE': (
+        {'label': 'purpose', 'kind': 'property'},
+        {'label': 'TRAITS', 'kind': 'keyword'},
+        {'label': 'MUTATIONS', 'kind': 'keyword'}
+    ),
+    'DNA': _properties('domain', 'version', 'quantum_enabled', 'lambda_phi'),
+    'TRAITS': _properties(
+        'entanglement', 'superposition', 'phase_shift', 'rotation_x', 'rotation_y', 'rotation_z'
+    ),
+    'QUANTUM': _properties('backend', 'circuits', 'optimization_level', 'n_qubits')
+}
+
+
 class OrganismIDEBackend:
     """Backend services for DNALang organism IDE"""
 
@@ -29,9 +135,19 @@ class OrganismIDEBackend:
         'RX', 'RY', 'RZ', 'T', 'S', 'TOFFOLI', 'CCX'
     ]
 
-    def __init__(self):
+    def __init__(self, dna_cache: Optional[DNACache] = None):
         self.validation_rules = self._initialize_validation_rules()
-        self.autocomplete_cache = {}
+        # Parse trees, diagnostics and circuits by DNA content hash
+        self.dna_cache = dna_cache if dna_cache is not None else DNACache(settings.DNA_CACHE_SIZE)
+        self.documents = DocumentCache(settings.IDE_MAX_OPEN_DOCUMENTS)
+        # Prefix tries built once per backend; gates are offered in circuit lines
+        self.completions = CompletionIndex({
+            **COMPLETIONS,
+            'gates': [
+                {'label': gate, 'kind': 'function', 'detail': 'Quantum gate'}
+                for gate in self.GATES
+            ]
+        })
 
     def _initialize_validation_rules(self) -> Dict[str, Any]:
         """Initialize DNALang validation rules"""
@@ -51,93 +167,73 @@ class OrganismIDEBackend:
 
     def validate_dna_syntax(self, dna_code: str) -> Dict[str, Any]:
         """Validate DNALang syntax"""
+        return copy.deepcopy(
+            self.dna_cache.get_or_compute(dna_code, 'validation', self._validate)
+        )
+
+    def _validate(self, dna_code: str) -> Dict[str, Any]:
+        document = self.dna_cache.document(dna_code)
+
+        sections_found = set()
+        genes = 0
+        dna_fields = []
+
+        for block in document.walk():
+            sections_found.add(block.kind)
+            if block.kind == 'GENE':
+                genes += 1
+            elif block.kind == 'DNA':
+                dna_fields.extend(
+                    (field.name, field.value, field.span.line) for field in block.fields
+                )
+
+        return self._validation_report(
+            document.issues, sections_found, genes, dna_fields, document.line_count
+        )
+
+    def _validation_report(
+        self,
+        issues: List[ParseIssue],
+        sections_found: set,
+        genes: int,
+        dna_fields: List[Tuple[str, Any, int]],
+        total_lines: int
+    ) -> Dict[str, Any]:
+        """Validation result from parser diagnostics and section contents"""
 
         errors = []
         warnings = []
         line_errors = {}
 
-        lines = dna_code.split('\n')
-
-        # Track opened/closed braces
-        brace_stack = []
-        current_section = None
-        current_subsection = None
-
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith('#'):
+        # Parser diagnostics (brace matching, malformed members)
+        for issue in issues:
+            entry = {'line': issue.line, 'type': issue.severity, 'message': issue.message}
+            if issue.severity == 'error':
+                errors.append(entry)
+                line_errors[issue.line] = issue.message
+            else:
+                warnings.append(entry)
+
+        # Check DNA fields
+        for name, value, line in dna_fields:
+            if name != 'lambda_phi':
                 continue
-
-            # Check for section declarations
-            for keyword in self.KEYWORDS:
-                if stripped.startswith(keyword):
-                    current_section = keyword
-                    if '{' in stripped:
-                        brace_stack.append((keyword, line_num))
-                    break
-
-            # Check brace matching
-            open_braces = line.count('{')
-            close_braces = line.count('}')
-
-            for _ in range(open_braces):
-                if current_section:
-                    brace_stack.append((current_section, line_num))
-
-            for _ in range(close_braces):
-                if brace_stack:
-                    brace_stack.pop()
-                else:
-                    errors.append({
-                        'line': line_num,
-                        'type': 'error',
-                        'message': 'Unexpected closing brace'
-                    })
-                    line_errors[line_num] = 'Unexpected closing brace'
-
-            # Validate field assignments
-            if ':' in stripped and not stripped.startswith('#'):
-                field_name = stripped.split(':')[0].strip()
-                field_value = stripped.split(':', 1)[1].strip()
-
-                # Check for required DNA fields
-                if current_section == 'DNA':
-                    if field_name == 'lambda_phi':
-                        try:
-                            value = float(field_value)
-                            if abs(value - settings.LAMBDA_PHI) > 1e-10:
-                                warnings.append({
-                                    'line': line_num,
-                                    'type': 'warning',
-                                    'message': f'lambda_phi should be {settings.LAMBDA_PHI}'
-                                })
-                        except:
-                            errors.append({
-                                'line': line_num,
-                                'type': 'error',
-                                'message': 'lambda_phi must be a number'
-                            })
-
-        # Check for unclosed braces
-        if brace_stack:
-            for section, line_num in brace_stack:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
                 errors.append({
-                    'line': line_num,
+                    'line': line,
                     'type': 'error',
-                    'message': f'Unclosed brace for {section}'
+                    'message': 'lambda_phi must be a number'
+                })
+            elif abs(value - settings.LAMBDA_PHI) > 1e-10:
+                warnings.append({
+                    'line': line,
+                    'type': 'warning',
+                    'message': f'lambda_phi should be {settings.LAMBDA_PHI}'
                 })
 
         # Check for required sections
-        required_found = {section: False for section in self.validation_rules['required_sections']}
-
         for section in self.validation_rules['required_sections']:
-            if section in dna_code:
-                required_found[section] = True
-
-        for section, found in required_found.items():
-            if not found:
+            if section not in sections_found:
                 errors.append({
                     'line': 0,
                     'type': 'error',
@@ -150,9 +246,9 @@ class OrganismIDEBackend:
             'warnings': warnings,
             'line_errors': line_errors,
             'statistics': {
-                'total_lines': len(lines),
-                'sections': sum(1 for k in self.KEYWORDS if k in dna_code),
-                'genes': dna_code.count('GENE')
+                'total_lines': total_lines,
+                'sections': sum(1 for k in self.KEYWORDS if k in sections_found),
+                'genes': genes
             }
         }
 
@@ -163,268 +259,167 @@ class OrganismIDEBackend:
     ) -> List[Dict[str, Any]]:
         """Get autocomplete suggestions based on context"""
 
-        suggestions = []
-
         # Find cursor context
         before_cursor = dna_code[:cursor_position]
-        lines_before = before_cursor.split('\n')
-        current_line = lines_before[-1] if lines_before else ""
+        current_line = before_cursor[before_cursor.rfind('\n') + 1:]
 
         # Determine context
-        context = self._determine_context(before_cursor)
+        context = self._determine_context(dna_code, cursor_position)
 
-        if not current_line.strip():
-            # Suggest section keywords
-            if context == 'root':
-                suggestions.extend([
-                    {'label': kw, 'kind': 'keyword', 'detail': 'Section'}
-                    for kw in ['ORGANISM', 'DNA', 'GENOME', 'PHENOME', 'QUANTUM']
-                ])
+        return self._suggestions(current_line, context)
 
-        elif current_line.strip().endswith(':'):
-            # Suggest values based on field
-            field = current_line.strip()[:-1].strip()
-            suggestions.extend(self._get_field_value_suggestions(field, context))
-
-        else:
-            # Partial typing - filter existing suggestions
-            partial = current_line.strip().split()[-1] if current_line.strip() else ""
-
-            if context == 'GENOME':
-                suggestions.extend([
-                    {'label': 'GENE', 'kind': 'keyword', 'detail': 'Define gene'},
-                    {'label': 'regulatory_network', 'kind': 'property'},
-                    {'label': 'expression_level', 'kind': 'property'}
-                ])
-
-            elif context == 'GENE':
-                suggestions.extend([
-                    {'label': 'purpose', 'kind': 'property'},
-                    {'label': 'TRAITS', 'kind': 'keyword'},
-                    {'label': 'MUTATIONS', 'kind': 'keyword'}
-                ])
-
-            elif context == 'QUANTUM':
-                suggestions.extend([
-                    {'label': 'backend', 'kind': 'property'},
-                    {'label': 'circuits', 'kind': 'property'},
-                    {'label': 'optimization_level', 'kind': 'property'}
-                ])
-
-            # Add quantum gates if in circuit context
-            if 'circuit' in current_line.lower():
-                suggestions.extend([
-                    {'label': gate, 'kind': 'function', 'detail': 'Quantum gate'}
-                    for gate in self.GATES
-                ])
-
-            # Filter by partial match
-            if partial:
-                suggestions = [
-                    s for s in suggestions
-                    if s['label'].lower().startswith(partial.lower())
-                ]
-
-        return suggestions[:20]  # Limit suggestions
-
-    def _determine_context(self, code: str) -> str:
-        """Determine current context in DNA code"""
-
-        # Count braces to determine nesting
-        open_braces = code.count('{')
-        close_braces = code.count('}')
-        depth = open_braces - close_braces
-
-        # Find most recent section
-        for keyword in reversed(self.KEYWORDS):
-            if keyword in code:
-                last_occurrence = code.rfind(keyword)
-                # Check if we're still within this section
-                after_keyword = code[last_occurrence:]
-                keyword_open = after_keyword.count('{')
-                keyword_close = after_keyword.count('}')
-                if keyword_open > keyword_close:
-                    return keyword
-
-        return 'root' if depth == 0 else 'unknown'
+    def _suggestions(self, current_line: str, context: str) -> List[Dict[str, Any]]:
+        """Suggestions for the text before the cursor on its line"""
 
-    def _get_field_value_suggestions(
-        self,
-        field: str,
-        context: str
-    ) -> List[Dict[str, Any]]:
-        """Get suggestions for field values"""
+        stripped = current_line.strip()
 
-        suggestions = []
+        if not stripped:
+            # Suggest section keywords
+            return self.completions.items(['sections']) if context == 'root' else []
 
-        if field == 'backend':
-            suggestions = [
-                {'label': 'ibm_torino', 'kind': 'value', 'detail': '133 qubits'},
-                {'label': 'ibm_kyoto', 'kind': 'value', 'detail': '127 qubits'},
-                {'label': 'ibm_osaka', 'kind': 'value', 'detail': '127 qubits'},
-                {'label': 'aer_simulator', 'kind': 'value', 'detail': 'Simulator'}
-            ]
+        if stripped.endswith(':'):
+            # Suggest values based on field
+            return self._get_field_value_suggestions(stripped[:-1].strip(), context)
 
-        elif field == 'quantum_enabled':
-            suggestions = [
-                {'label': 'true', 'kind': 'value'},
-                {'label': 'false', 'kind': 'value'}
-            ]
+        # Partial typing - rank context vocabulary (and gates in circuits)
+        partial = stripped.split()[-1]
+        vocabularies = [context] if context in self.completions.tries else []
+        if 'circuit' in current_line.lower():
+            vocabularies.append('gates')
 
-        elif field == 'domain':
-            suggestions = [
-                {'label': 'quantum_computing', 'kind': 'value'},
-                {'label': 'optimization', 'kind': 'value'},
-                {'label': 'machine_learning', 'kind': 'value'},
-                {'label': 'cryptography', 'kind': 'value'}
-            ]
+        return self.completions.complete(vocabularies, partial, limit=20)
 
-        elif field == 'version':
-            suggestions = [
-                {'label': '"1.0.0"', 'kind': 'value'},
-                {'label': '"0.1.0"', 'kind': 'value'}
-            ]
+    def record_completion(self, label: str) -> bool:
+        """Count an accepted suggestion so it ranks higher (False if unknown)"""
+        return self.completions.record_usage(label)
 
-        elif field == 'lambda_phi':
-            suggestions = [
-                {'label': str(settings.LAMBDA_PHI), 'kind': 'value',
-                 'detail': 'Universal constant'}
-            ]
+    def _determine_context(
+        self,
+        code: str,
+        cursor_position: Optional[int] = None,
+        document: Optional[Document] = None
+    ) -> str:
+        """Determine current context in DNA code
 
-        elif field == 'optimization_level':
-            suggestions = [
-                {'label': '3', 'kind': 'value', 'detail': 'Maximum optimization'},
-                {'label': '2', 'kind': 'value', 'detail': 'Medium optimization'},
-                {'label': '1', 'kind': 'value', 'detail': 'Light optimization'}
-            ]
+        Innermost open keyword section at the cursor (end of code by
+        default), from the parsed block tree.
+        """
 
-        return suggestions
+        document = document or self.dna_cache.document(code)
+        offset = len(code) if cursor_position is None else cursor_position
+        return self._context_of([block.kind for block in document.path_at(offset)])
 
-    def format_dna_code(self, dna_code: str) -> str:
-        """Format DNALang code with proper indentation"""
+    def _context_of(self, kinds: List[Optional[str]]) -> str:
+        """Innermost keyword section among open block kinds, outermost first"""
+        for kind in reversed(kinds):
+            if kind in self.KEYWORDS:
+                return kind
 
-        formatted_lines = []
-        indent_level = 0
-        indent_size = 2
+        return 'root' if not kinds else 'unknown'
 
-        lines = dna_code.split('\n')
+    def _get_field_value_suggestions(
+        self,
+        field: str,
+        context: str
+    ) -> List[Dict[str, Any]]:
+        """Get suggestions for field values"""
+        return [dict(item) for item in FIELD_VALUES.get(field, ())]
 
-        for line in lines:
-            stripped = line.strip()
+    def open_document(self, document_id: str, dna_code: str, version: int = 0) -> Dict[str, Any]:
+        """Open (or reset) an editor document and validate it"""
+        self.documents.open(document_id, dna_code, version)
+        return self.validate_document(document_id)
 
-            # Skip empty lines
-            if not stripped:
-                formatted_lines.append('')
-                continue
+    def edit_document(
+        self,
+        document_id: str,
+        version: int,
+        edits: List[TextEdit]
+    ) -> Dict[str, Any]:
+        """Apply editor changes to an open document and re-validate
+
+        Only the edited lines and the lines whose parse state they change
+        are re-parsed. Raises KeyError for unknown documents and ValueError
+        for versions not newer than the current one.
+        """
+        self.documents.apply(document_id, version, edits)
+        return self.validate_document(document_id)
+
+    def validate_document(self, document_id: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """Validate an open document from its maintained parse"""
+        document = self.documents.get(document_id, version)
+
+        dna_fields = [
+            ('lambda_phi', value, line)
+            for value, owner, line in document.fields('lambda_phi')
+            if owner == 'DNA'
+        ]
+
+        validation = self._validation_report(
+            document.issues(), set(document.block_counts),
+            document.block_counts.get('GENE', 0), dna_fields, document.line_count
+        )
+        validation['version'] = document.version
+        return validation
+
+    def get_document_suggestions(
+        self,
+        document_id: str,
+        line: int,
+        character: int,
+        version: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Autocomplete at a 0-based (line, character) position of an open document"""
+        document = self.documents.get(document_id, version)
 
-            # Decrease indent for closing braces
-            if stripped.startswith('}'):
-                indent_level = max(0, indent_level - 1)
+        context = self._context_of([kind for kind, _ in document.path_at(line, character)])
+        line = min(max(line, 0), document.line_count - 1)
+        current_line = document.lines[line].text[:max(character, 0)]
 
-            # Add indented line
-            formatted_lines.append(' ' * (indent_level * indent_size) + stripped)
+        return self._suggestions(current_line, context)
 
-            # Increase indent after opening braces
-            if stripped.endswith('{'):
-                indent_level += 1
+    def close_document(self, document_id: str) -> bool:
+        return self.documents.close(document_id)
 
-        return '\n'.join(formatted_lines)
+    def format_dna_code(self, dna_code: str) -> str:
+        """Format DNALang code with proper indentation"""
+        return self.dna_cache.get_or_compute(
+            dna_code, 'formatted', lambda code: format_source(self.dna_cache.document(code))
+        )
 
     def get_documentation(self, keyword: str) -> Optional[Dict[str, Any]]:
         """Get documentation for DNALang keyword"""
-
-        docs = {
-            'ORGANISM': {
-                'syntax': 'ORGANISM <name> { ... }',
-                'description': 'Defines a quantum organism with unique identity',
-                'example': 'ORGANISM QuantumOptimizer {\n  DNA { ... }\n  GENOME { ... }\n}'
-            },
-            'DNA': {
-                'syntax': 'DNA { <properties> }',
-                'description': 'Organism metadata and configuration',
-                'required_fields': ['domain', 'version', 'quantum_enabled', 'lambda_phi'],
-                'example': 'DNA {\n  domain: "quantum_computing"\n  version: "1.0.0"\n  quantum_enabled: true\n  lambda_phi: 2.176435e-8\n}'
-            },
-            'GENOME': {
-                'syntax': 'GENOME { <genes> }',
-                'description': 'Collection of genes defining organism behavior',
-                'example': 'GENOME {\n  GENE optimizer { ... }\n  GENE evaluator { ... }\n}'
-            },
-            'GENE': {
-                'syntax': 'GENE <name> { <properties> }',
-                'description': 'Individual functional unit of organism',
-                'properties': ['purpose', 'TRAITS', 'MUTATIONS'],
-                'example': 'GENE optimizer {\n  purpose: "Optimize quantum circuits"\n  TRAITS { ... }\n}'
-            },
-            'TRAITS': {
-                'syntax': 'TRAITS { <trait_definitions> }',
-                'description': 'Behavioral characteristics of a gene',
-                'example': 'TRAITS {\n  learning_rate: 0.01\n  mutation_probability: 0.1\n}'
-            },
-            'MUTATIONS': {
-                'syntax': 'MUTATIONS { <mutation_rules> }',
-                'description': 'Evolution rules for gene adaptation',
-                'example': 'MUTATIONS {\n  adaptive_learning {\n    trigger: "fitness < 0.5"\n    action: "increase learning_rate"\n  }\n}'
-            },
-            'QUANTUM': {
-                'syntax': 'QUANTUM { <quantum_config> }',
-                'description': 'Quantum backend and circuit configuration',
-                'properties': ['backend', 'circuits', 'optimization_level'],
-                'example': 'QUANTUM {\n  backend: "ibm_torino"\n  optimization_level: 3\n}'
-            }
-        }
-
-        return docs.get(keyword)
+        entry = DOCUMENTATION.get(keyword)
+        if entry is None:
+            return None
+        return {key: list(value) if isinstance(value, tuple) else value for key, value in entry.items()}
 
     def compile_to_quantum_circuit(self, dna_code: str) -> Tuple[bool, Any]:
         """Compile DNALang to quantum circuit"""
+        success, result = self.dna_cache.get_or_compute(dna_code, 'circuit', self._compile)
+        return success, (result.copy() if success else result)
 
+    def _compile(self, dna_code: str) -> Tuple[bool, Any]:
         try:
-            # Parse DNA code
-            organism_data = self._parse_dna_code(dna_code)
-
-            if not organism_data:
-                return False, "Failed to parse DNA code"
-
-            # Extract quantum configuration
-            quantum_config = organism_data.get('quantum', {})
-
-            # Generate circuit based on genes
-            from qiskit import QuantumCircuit
-            n_qubits = quantum_config.get('n_qubits', 5)
-            circuit = QuantumCircuit(n_qubits)
-
-            # Add gates based on genome
-            genes = organism_data.get('genome', {}).get('genes', [])
-
-            for gene in genes:
-                traits = gene.get('traits', {})
-
-                # Add quantum gates based on traits
-                if traits.get('entanglement', False):
-                    for i in range(n_qubits - 1):
-                        circuit.cx(i, i + 1)
-
-                if traits.get('superposition', False):
-                    for i in range(n_qubits):
-                        circuit.h(i)
-
-                if traits.get('phase_shift', False):
-                    for i in range(n_qubits):
-                        circuit.p(settings.LAMBDA_PHI * 1e8, i)
-
-            # Add measurements
-            circuit.measure_all()
-
-            return True, circuit
-
+            return True, to_circuit(self.compile_program(dna_code))
         except Exception as e:
             return False, str(e)
 
+    def compile_program(self, dna_code: str) -> CircuitProgram:
+        """Optimized gate list for DNA code (cached; treat as read-only)
+
+        Raises ValueError for an invalid QUANTUM configuration.
+        """
+        return self.dna_cache.get_or_compute(
+            dna_code, 'program', lambda code: compile_program(self.dna_cache.document(code))
+        )
+
     def _parse_dna_code(self, dna_code: str) -> Optional[Dict[str, Any]]:
         """Parse DNALang code to dictionary"""
 
         try:
+            document = self.dna_cache.document(dna_code)
+
             result = {
                 'organism': None,
                 'dna': {},
@@ -432,48 +427,24 @@ class OrganismIDEBackend:
                 'quantum': {}
             }
 
-            # Simple regex-based parser
-            # Extract organism name
-            organism_match = re.search(r'ORGANISM\s+(\w+)', dna_code)
-            if organism_match:
-                result['organism'] = organism_match.group(1)
-
-            # Extract DNA section
-            dna_match = re.search(r'DNA\s*{([^}]+)}', dna_code, re.DOTALL)
-            if dna_match:
-                dna_content = dna_match.group(1)
-                for line in dna_content.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        result['dna'][key.strip()] = value.strip()
-
-            # Extract genes
-            gene_pattern = r'GENE\s+(\w+)\s*{([^}]+)}'
-            for match in re.finditer(gene_pattern, dna_code, re.DOTALL):
-                gene_name = match.group(1)
-                gene_content = match.group(2)
-
-                gene_data = {'name': gene_name, 'traits': {}}
-
-                # Extract traits
-                traits_match = re.search(r'TRAITS\s*{([^}]+)}', gene_content)
-                if traits_match:
-                    traits_content = traits_match.group(1)
-                    for line in traits_content.split('\n'):
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            gene_data['traits'][key.strip()] = value.strip()
-
-                result['genome']['genes'].append(gene_data)
-
-            # Extract quantum config
-            quantum_match = re.search(r'QUANTUM\s*{([^}]+)}', dna_code, re.DOTALL)
-            if quantum_match:
-                quantum_content = quantum_match.group(1)
-                for line in quantum_content.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        result['quantum'][key.strip()] = value.strip()
+            organism = document.find('ORGANISM')
+            if organism:
+                result['organism'] = organism.name
+
+            dna = document.find('DNA')
+            if dna:
+                result['dna'] = dna.field_values()
+
+            for gene in document.find_all('GENE'):
+                traits = gene.find('TRAITS')
+                result['genome']['genes'].append({
+                    'name': gene.name,
+                    'traits': traits.field_values() if traits else {}
+                })
+
+            quantum = document.find('QUANTUM')
+            if quantum:
+                result['quantum'] = quantum.field_values()
 
             return result
 
@@ -0,0 +1,338 @@
+"""Secondary Indexes for the Organism Registry"""
+
+from typing import Dict, List, Optional, Any, Set, Iterable, Iterator, Tuple
+
+from sortedcontainers import SortedList
+
+
+class SortedIndex:
+    """Organism ids ordered by a numeric key
+
+    Entries are ``(value, tiebreak, organism_id)`` tuples in a
+    ``SortedList``, so updates are O(log n); ``tiebreak`` is the negated
+    registration sequence so that, walking from the top, equal values come
+    out in registration order.
+    """
+
+    def __init__(self):
+        self._entries: SortedList = SortedList()  # (value, -sequence, organism_id)
+        self._keys: Dict[str, Tuple[float, int, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, organism_id: str, value: float, sequence: int):
+        key = (value, -sequence, organism_id)
+        self._keys[organism_id] = key
+        self._entries.add(key)
+
+    def add_many(self, items: Iterable[Tuple[str, float, int]]):
+        """Add ``(organism_id, value, sequence)`` items in one bulk update"""
+        keys = []
+        for organism_id, value, sequence in items:
+            key = (value, -sequence, organism_id)
+            self._keys[organism_id] = key
+            keys.append(key)
+        self._entries.update(keys)
+
+    def remove(self, organism_id: str):
+        key = self._keys.pop(organism_id, None)
+        if key is not None:
+            self._entries.discard(key)
+
+    def update(self, organism_id: str, value: float, sequence: int):
+        self.remove(organism_id)
+        self.add(organism_id, value, sequence)
+
+    def value(self, organism_id: str) -> Optional[float]:
+        key = self._keys.get(organism_id)
+        return key[0] if key else None
+
+    def descending(self) -> Iterator[str]:
+        """Ids from highest to lowest value"""
+        for entry in reversed(self._entries):
+            yield entry[2]
+
+    def top(self, limit: int) -> List[str]:
+        """Ids of the ``limit`` highest values, highest first"""
+        if limit <= 0:
+            return []
+        start = max(len(self._entries) - limit, 0)
+        return [entry[2] for entry in self._entries.islice(start, reverse=True)]
+
+    def at_least(self, minimum: float) -> List[str]:
+        """Ids with value >= minimum"""
+        return [entry[2] for entry in self._entries.irange(minimum=(minimum, float('-inf'), ''))]
+
+    def at_most(self, maximum: float) -> List[str]:
+        """Ids with value <= maximum"""
+        return [entry[2] for entry in self._entries.irange(maximum=(maximum, float('inf'), ''))]
+
+    def max(self) -> Optional[float]:
+        return self._entries[-1][0] if self._entries else None
+
+
+class NGramIndex:
+    """Inverted index of character n-grams for case-insensitive substring search
+
+    Queries of at least ``n`` characters are answered by intersecting the
+    posting lists of their n-grams; the result is a candidate superset that
+    callers verify with a substring check. Keys are organism ids or, for
+    DNA, content digests.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.postings: Dict[str, Set[Any]] = {}
+
+    def _grams(self, text: str) -> Set[str]:
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def add(self, key: Any, *texts: str):
+        for text in texts:
+            for gram in self._grams(text.lower()):
+                posting = self.postings.get(gram)
+                if posting is None:
+                    posting = self.postings[gram] = set()
+                posting.add(key)
+
+    def remove(self, key: Any, *texts: str):
+        for text in texts:
+            for gram in self._grams(text.lower()):
+                posting = self.postings.get(gram)
+                if posting is not None:
+                    posting.discard(key)
+                    if not posting:
+                        del self.postings[gram]
+
+    def candidates(self, query: str) -> Optional[Set[Any]]:
+        """Keys that may contain query, or None if query is too short to index"""
+        grams = self._grams(query.lower())
+        if not grams:
+            return None
+
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+
+class OrganismIndex:
+    """Secondary indexes over registered organisms
+
+    Maintains author -> ids, tag -> ids, generation buckets, n-gram
+    indexes over names and DNA so that searches intersect posting lists
+    instead of scanning every organism, and sorted indexes for each ranking
+    metric (fitness, consciousness, generation, recent) so leaderboards are
+    read in O(k). DNA is indexed once per distinct body (by content digest)
+    since evolution runs produce many organisms sharing the same DNA.
+    """
+
+    def __init__(self):
+        self.sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+
+        self.by_author: Dict[str, Set[str]] = {}
+        self.by_tag: Dict[str, Set[str]] = {}
+        self.by_generation: Dict[int, Set[str]] = {}
+        self.names = NGramIndex()
+        self.dna = NGramIndex()
+        self.dna_members: Dict[bytes, Set[str]] = {}  # DNA digest -> ids
+
+        # Ranking metric -> sorted index
+        self.rankings: Dict[str, SortedIndex] = {
+            'fitness': SortedIndex(),
+            'consciousness': SortedIndex(),
+            'generation': SortedIndex(),
+            'recent': SortedIndex()
+        }
+        self.fitness = self.rankings['fitness']
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    @staticmethod
+    def _add_to(index: Dict[Any, Set[str]], key: Any, organism_id: str):
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = set()
+        bucket.add(organism_id)
+
+    @staticmethod
+    def _remove_from(index: Dict[Any, Set[str]], key: Any, organism_id: str):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(organism_id)
+            if not bucket:
+                del index[key]
+
+    def _add_postings(self, organism) -> int:
+        """Add an organism to the hash indexes; returns its sequence"""
+        organism_id = organism.id
+        sequence = self.sequence[organism_id] = self._next_sequence
+        self._next_sequence += 1
+
+        self._add_to(self.by_author, organism.author, organism_id)
+        self._add_to(self.by_generation, organism.generation, organism_id)
+        for tag in organism.tags or []:
+            self._add_to(self.by_tag, tag, organism_id)
+
+        self.names.add(organism_id, organism.name)
+        self.add_dna(organism)
+
+        return sequence
+
+    def add(self, organism):
+        """Index a newly registered organism"""
+        sequence = self._add_postings(organism)
+        for metric, value in self._ranking_values(organism).items():
+            self.rankings[metric].add(organism.id, value, sequence)
+
+    def add_many(self, organisms: Iterable[Any]):
+        """Index a batch of organisms, merging each ranking index once"""
+        items: Dict[str, List[Tuple[str, float, int]]] = {metric: [] for metric in self.rankings}
+        for organism in organisms:
+            sequence = self._add_postings(organism)
+            for metric, value in self._ranking_values(organism).items():
+                items[metric].append((organism.id, value, sequence))
+
+        for metric, metric_items in items.items():
+            self.rankings[metric].add_many(metric_items)
+
+    @staticmethod
+    def _ranking_values(organism) -> Dict[str, float]:
+        return {
+            'fitness': organism.fitness,
+            'consciousness': organism.consciousness_level,
+            'generation': organism.generation,
+            'recent': organism.updated_at.timestamp()
+        }
+
+    def update_rankings(self, organism):
+        """Re-rank an organism after its ranked fields changed"""
+        sequence = self.sequence[organism.id]
+        for metric, value in self._ranking_values(organism).items():
+            if self.rankings[metric].value(organism.id) != value:
+                self.rankings[metric].update(organism.id, value, sequence)
+
+    def ranking(self, metric: str) -> Optional[SortedIndex]:
+        """Sorted index for a ranking metric, if one is maintained"""
+        return self.rankings.get(metric)
+
+    def update_tags(self, organism_id: str, old_tags: Iterable[str], new_tags: Iterable[str]):
+        for tag in old_tags or []:
+            self._remove_from(self.by_tag, tag, organism_id)
+        for tag in new_tags or []:
+            self._add_to(self.by_tag, tag, organism_id)
+
+    def add_dna(self, organism):
+        """Index an organism's DNA (on registration or after it changed)"""
+        members = self.dna_members.get(organism.dna_digest)
+        if members is None:
+            # Only a new body needs its text indexed (and loaded)
+            members = self.dna_members[organism.dna_digest] = set()
+            self.dna.add(organism.dna_digest, organism.dna_code)
+        members.add(organism.id)
+
+    def remove_dna(self, organism):
+        """Unindex an organism's DNA before it changes"""
+        members = self.dna_members.get(organism.dna_digest)
+        if members is None:
+            return
+        members.discard(organism.id)
+        if not members:
+            del self.dna_members[organism.dna_digest]
+            self.dna.remove(organism.dna_digest, organism.dna_code)
+
+    def text_candidates(self, query: str) -> Optional[Set[str]]:
+        """Ids whose name or DNA may contain query (None if too short)"""
+        names = self.names.candidates(query)
+        digests = self.dna.candidates(query)
+        if names is None or digests is None:
+            return None
+
+        result = set(names)
+        for digest in digests:
+            result |= self.dna_members.get(digest, set())
+        return result
+
+    def candidates(
+        self,
+        query: Optional[str] = None,
+        min_fitness: Optional[float] = None,
+        max_generation: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        author: Optional[str] = None
+    ) -> Tuple[Optional[Set[str]], bool]:
+        """Intersect posting lists for the given filters
+
+        Returns ``(ids, needs_text_check)``. ``ids`` is None when no indexed
+        filter applies (every organism is a candidate). ``needs_text_check``
+        is True when ``query`` could not be fully answered by the index and
+        candidates must be verified with a substring match.
+        """
+
+        postings: List[Set[str]] = []
+        needs_text_check = False
+
+        if author:
+            postings.append(self.by_author.get(author, set()))
+
+        if tags:
+            tagged = set()
+            for tag in tags:
+                tagged |= self.by_tag.get(tag, set())
+            postings.append(tagged)
+
+        if max_generation is not None:
+            generations = set()
+            for generation, ids in self.by_generation.items():
+                if generation <= max_generation:
+                    generations |= ids
+            postings.append(generations)
+
+        if min_fitness is not None:
+            postings.append(set(self.fitness.at_least(min_fitness)))
+
+        if query:
+            needs_text_check = True
+            text_candidates = self.text_candidates(query)
+            if text_candidates is not None:
+                postings.append(text_candidates)
+
+        if not postings:
+            return None, needs_text_check
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+
+        return result, needs_text_check
+
+    def order_by_fitness(self, ids: Optional[Set[str]]) -> List[str]:
+        """Ids sorted by fitness (highest first, ties in registration order)"""
+        if ids is None:
+            return list(self.fitness.descending())
+
+        # Walking the full index is cheaper than sorting a large candidate set
+        if len(ids) * 8 > len(self.fitness):
+            return [organism_id for organism_id in self.fitness.descending() if organism_id in ids]
+
+        return sorted(
+            ids,
+            key=lambda organism_id: (-self.fitness.value(organism_id), self.sequence[organism_id])
+        )
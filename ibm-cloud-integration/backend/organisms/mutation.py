@@ -0,0 +1,162 @@
+"""Token-Based Mutation Engine for DNALang"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+# Token kinds
+STRING, IDENT, NUMBER, SPACE, PUNCT = range(5)
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+   |(?P<ident>[A-Za-z_]\w*)
+   |(?P<number>\d+\.?\d*(?:[eE][-+]?\d+)?)
+   |(?P<space>\s+)
+   |(?P<punct>.)
+""", re.VERBOSE | re.DOTALL)
+
+KINDS = {'string': STRING, 'ident': IDENT, 'number': NUMBER, 'space': SPACE, 'punct': PUNCT}
+
+Token = Tuple[int, str]
+
+
+def tokenize(dna_code: str) -> List[Token]:
+    """Split DNA into string, identifier, number, whitespace and punctuation tokens"""
+    return [(KINDS[match.lastgroup], match.group()) for match in TOKEN_PATTERN.finditer(dna_code)]
+
+
+class MutationPlan:
+    """Mutation operators compiled into lookup tables
+
+    ``gate_substitution`` maps whole identifiers (so ``H`` no longer
+    rewrites the ``H`` inside ``HADAMARD``) and substitutions are applied
+    simultaneously, making swaps like ``{H: X, X: H}`` well defined.
+    ``parameter_shift`` scales numeric literals (including exponents)
+    outside strings and identifiers, so ``q0`` and ``"1.0.0"`` are left
+    alone. ``trait_modification`` sets the value following ``trait:``;
+    traits take precedence over shifts and substitutions.
+    """
+
+    __slots__ = ('substitutions', 'factor', 'traits')
+
+    def __init__(self, mutations: Dict[str, Any]):
+        self.substitutions: Dict[str, str] = {}
+        self.factor: Optional[float] = None
+        self.traits: Dict[str, str] = {}
+
+        for mutation_type, mutation_value in mutations.items():
+            if mutation_type == 'gate_substitution':
+                self.substitutions.update(
+                    {str(old): str(new) for old, new in mutation_value.items()}
+                )
+            elif mutation_type == 'parameter_shift':
+                self.factor = mutation_value.get('factor', 1.1)
+            elif mutation_type == 'trait_modification':
+                self.traits.update({str(trait): str(value) for trait, value in mutation_value.items()})
+
+    def is_identity(self) -> bool:
+        return not self.substitutions and self.factor is None and not self.traits
+
+
+class ParsedDNA:
+    """Token texts of a DNA body with the positions each operator touches
+
+    ``identifiers`` maps each identifier to its token positions, ``numbers``
+    lists numeric literal positions with their values, and ``traits`` maps
+    each ``name: value`` pair to the token span it covers. Mutating copies
+    the text list, patches only affected positions and joins once.
+    """
+
+    __slots__ = ('texts', 'identifiers', 'numbers', 'traits')
+
+    def __init__(self, dna_code: str):
+        tokens = tokenize(dna_code)
+        self.texts: List[str] = [text for _, text in tokens]
+        self.identifiers: Dict[str, List[int]] = {}
+        self.numbers: List[Tuple[int, float]] = []
+        self.traits: Dict[str, List[Tuple[int, int]]] = {}
+
+        for position, (kind, text) in enumerate(tokens):
+            if kind == IDENT:
+                self.identifiers.setdefault(text, []).append(position)
+                end = self._trait_value_end(tokens, position)
+                if end is not None:
+                    self.traits.setdefault(text, []).append((position, end))
+            elif kind == NUMBER:
+                self.numbers.append((position, float(text)))
+
+    @staticmethod
+    def _trait_value_end(tokens: List[Token], start: int) -> Optional[int]:
+        """Index after the value of a ``trait: value`` pair beginning at start"""
+        n = len(tokens)
+        i = start + 1
+        if i >= n or tokens[i] != (PUNCT, ':'):
+            return None
+        i += 1
+        if i < n and tokens[i][0] == SPACE:
+            i += 1
+        if i < n and tokens[i] == (PUNCT, '-'):
+            i += 1
+        if i < n and tokens[i][0] in (NUMBER, IDENT, STRING):
+            return i + 1
+        return None
+
+    def emit(self, plan: MutationPlan) -> str:
+        """Re-emit text with the plan applied"""
+        out = self.texts.copy()
+
+        for old, new in plan.substitutions.items():
+            for position in self.identifiers.get(old, ()):
+                out[position] = new
+
+        if plan.factor is not None:
+            factor = plan.factor
+            for position, value in self.numbers:
+                out[position] = str(value * factor)
+
+        for trait, value in plan.traits.items():
+            for start, end in self.traits.get(trait, ()):
+                out[start] = f"{trait}: {value}"
+                for position in range(start + 1, end):
+                    out[position] = ''
+
+        return ''.join(out)
+
+
+class MutationEngine:
+    """Applies all mutation operators in one pass over cached parses
+
+    DNA is tokenized once into a ``ParsedDNA`` kept in a small LRU cache,
+    since evolution sweeps mutate the same parent many times.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = cache_size
+        self._parsed: "OrderedDict[str, ParsedDNA]" = OrderedDict()
+
+    def parse(self, dna_code: str) -> ParsedDNA:
+        parsed = self._parsed.get(dna_code)
+        if parsed is not None:
+            self._parsed.move_to_end(dna_code)
+            return parsed
+
+        parsed = ParsedDNA(dna_code)
+        self._parsed[dna_code] = parsed
+        if len(self._parsed) > self.cache_size:
+            self._parsed.popitem(last=False)
+        return parsed
+
+    def apply(self, dna_code: str, mutations: Dict[str, Any]) -> str:
+        """Apply mutations to DNA code"""
+        plan = mutations if isinstance(mutations, MutationPlan) else MutationPlan(mutations)
+        if plan.is_identity():
+            return dna_code
+        return self.parse(dna_code).emit(plan)
+
+
+_engine = MutationEngine()
+
+
+def apply_mutations(dna_code: str, mutations: Dict[str, Any]) -> str:
+    """Apply mutations with the shared engine"""
+    return _engine.apply(dna_code, mutations)
@@ -1,36 +1,119 @@
 """Organism Registry and Management System"""
 
+import sys
+import copy
 import json
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Iterable, Tuple
+from collections import deque
 from datetime import datetime
-from dataclasses import dataclass, asdict
 import hashlib
-
+import heapq
+
+from .dna_cache import DNACache
+from .dna_pool import DNAPool
+from .genealogy import GenealogyIndex
+from .indexes import OrganismIndex
+from .mutation import MutationEngine
+from .statistics import RegistryStatistics
+from .storage import OrganismStore
 from ..config import settings
 
 
-@dataclass
 class Organism:
-    """Organism data structure"""
-    id: str
-    name: str
-    dna_code: str
-    version: str
-    created_at: datetime
-    updated_at: datetime
-    author: str
-    consciousness_level: float = 0.0
-    fitness: float = 0.0
-    generation: int = 0
-    lineage: List[str] = None
-    metadata: Dict[str, Any] = None
-    circuit_qasm: Optional[str] = None
-    tags: List[str] = None
+    """Organism data structure
+
+    Slotted record: lineage is reconstructed by walking ``parent`` pointers
+    instead of being copied into every descendant, repeated strings are
+    interned, and the DNA body lives in a shared ``DNAPool`` keyed by
+    content hash (loaded lazily when the pool has evicted it).
+    """
+
+    __slots__ = (
+        'id', 'name', 'version', 'created_at', 'updated_at', 'author',
+        'consciousness_level', 'fitness', 'generation', 'parent',
+        'metadata', 'circuit_qasm', 'tags', '_dna_key', '_pool'
+    )
+
+    # Serialized fields, in export order
+    FIELDS = (
+        'id', 'name', 'dna_code', 'version', 'created_at', 'updated_at', 'author',
+        'consciousness_level', 'fitness', 'generation', 'lineage', 'metadata',
+        'circuit_qasm', 'tags'
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        dna_code: str,
+        version: str,
+        created_at: datetime,
+        updated_at: datetime,
+        author: str,
+        consciousness_level: float = 0.0,
+        fitness: float = 0.0,
+        generation: int = 0,
+        parent: Optional['Organism'] = None,
+        metadata: Dict[str, Any] = None,
+        circuit_qasm: Optional[str] = None,
+        tags: List[str] = None,
+        pool: Optional[DNAPool] = None
+    ):
+        self.id = id
+        self.name = sys.intern(name)
+        self.version = sys.intern(version)
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.author = sys.intern(author)
+        self.consciousness_level = consciousness_level
+        self.fitness = fitness
+        self.generation = generation
+        self.parent = parent
+        self.metadata = metadata
+        self.circuit_qasm = circuit_qasm
+        self.tags = [sys.intern(tag) for tag in tags] if tags is not None else None
+        self._pool = pool if pool is not None else DNAPool()
+        self._dna_key = self._pool.add(dna_code) if dna_code is not None else None
+
+    @property
+    def dna_code(self) -> Optional[str]:
+        return self._pool.get(self._dna_key, self.id)
+
+    @dna_code.setter
+    def dna_code(self, value: str):
+        previous = self._dna_key
+        self._dna_key = self._pool.add(value)
+        self._pool.release(previous)
+
+    @property
+    def dna_digest(self) -> Optional[bytes]:
+        """SHA-256 digest of the DNA body (its key in the pool)"""
+        return self._dna_key
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        return self.parent.id if self.parent else None
+
+    @property
+    def lineage(self) -> List[str]:
+        """Ancestor ids, root first"""
+        path = []
+        node = self.parent
+        while node is not None:
+            path.append(node.id)
+            node = node.parent
+        path.reverse()
+        return path
+
+    def __repr__(self) -> str:
+        return f"Organism(id={self.id!r}, name={self.name!r}, generation={self.generation})"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        data = asdict(self)
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data['metadata'] = copy.deepcopy(self.metadata)
+        data['tags'] = list(self.tags) if self.tags is not None else None
         data['created_at'] = self.created_at.isoformat()
         data['updated_at'] = self.updated_at.isoformat()
         return data
@@ -42,12 +125,102 @@ class Organism:
 
 
 class OrganismRegistry:
-    """Central registry for all organisms"""
+    """Central registry for all organisms
+
+    With a ``store`` the registry is a write-through cache: every register
+    and update is persisted before returning, and on startup the metadata
+    and indexes are rebuilt from the store while DNA bodies are evicted
+    from the pool and loaded lazily on first access.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        store: Optional[OrganismStore] = None,
+        dna_cache: Optional[DNACache] = None
+    ):
         self.organisms: Dict[str, Organism] = {}
         self.species_map: Dict[str, List[str]] = {}  # Species to organism IDs
+        self.organism_species: Dict[str, str] = {}  # Organism ID to species
         self.evolution_tree: Dict[str, List[str]] = {}  # Parent to children
+        self.index = OrganismIndex()  # Secondary indexes for search
+        self.genealogy = GenealogyIndex(self.evolution_tree, self.organisms)
+        self.stats = RegistryStatistics()  # Running aggregates for get_statistics
+        self.mutation_engine = MutationEngine()
+        self.store = store
+        self.dna_pool = DNAPool(
+            loader=store.load_dna if store else None,
+            batch_loader=store.load_dna_many if store else None,
+            max_loaded=settings.ORGANISM_DNA_RESIDENT
+        )
+        self.dna_cache = dna_cache if dna_cache is not None else DNACache(settings.DNA_CACHE_SIZE)
+
+        if self.store:
+            self._load_from_store()
+
+    def _load_from_store(self):
+        """Rebuild the in-memory registry and indexes from the store
+
+        Parents are linked in a second pass, since a store need not yield a
+        parent before children created in the same instant.
+        """
+        parents: Dict[str, str] = {}  # Organism ID to parent ID
+        for row in self.store.load_all():
+            dna_code = row['dna_code']
+            parent_id = row.get('parent_id')
+            species = row.get('species') or self._extract_species(dna_code)
+
+            organism = Organism(
+                pool=self.dna_pool,
+                metadata=row.get('metadata') or {},
+                tags=row.get('tags') or [],
+                **{
+                    field: row[field] for field in Organism.FIELDS
+                    if field not in ('lineage', 'metadata', 'tags') and field in row
+                }
+            )
+
+            self.organisms[organism.id] = organism
+            self.index.add(organism)
+            self._add_to_species(organism.id, species)
+            self.stats.add(organism, self.organism_species[organism.id])
+            if parent_id:
+                parents[organism.id] = parent_id
+                self.evolution_tree.setdefault(parent_id, []).append(organism.id)
+
+            # DNA bodies stay in the store until requested
+            self.dna_pool.evict(organism.dna_digest)
+
+        for organism_id, parent_id in parents.items():
+            self.organisms[organism_id].parent = self.organisms.get(parent_id)
+
+        self.genealogy.invalidate()
+
+    def _add_to_species(self, organism_id: str, species: str):
+        species = sys.intern(species)
+        if species not in self.species_map:
+            self.species_map[species] = []
+        self.species_map[species].append(organism_id)
+        self.organism_species[organism_id] = species
+
+    def _persist(self, organism: Organism):
+        """Write an organism through to the store"""
+        if not self.store:
+            return
+
+        self.store.save(self._row(organism))
+        self.dna_pool.persisted([organism.dna_digest])
+
+    def _row(self, organism: Organism) -> Dict[str, Any]:
+        """Store row for an organism"""
+        row = {field: getattr(organism, field) for field in Organism.FIELDS}
+        row['parent_id'] = organism.parent_id
+        row['species'] = self.organism_species.get(organism.id)
+        return row
+
+    def close(self):
+        """Close the backing store"""
+        if self.store:
+            self.store.close()
 
     def register_organism(
         self,
@@ -59,20 +232,37 @@ class OrganismRegistry:
     ) -> str:
         """Register a new organism"""
 
-        organism_id = str(uuid.uuid4())
-        now = datetime.now()
+        organism = self._build_organism(name, dna_code, author, parent_id, metadata, datetime.now())
+
+        # Store in registry
+        self.organisms[organism.id] = organism
+        self.index.add(organism)
+        self._link(organism, parent_id)
+
+        self._persist(organism)
+
+        return organism.id
+
+    def _build_organism(
+        self,
+        name: str,
+        dna_code: str,
+        author: str,
+        parent_id: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        now: datetime
+    ) -> Organism:
+        """Create an organism record (not yet registered)"""
 
         # Determine lineage
-        lineage = []
+        parent = None
         generation = 0
         if parent_id and parent_id in self.organisms:
             parent = self.organisms[parent_id]
-            lineage = parent.lineage + [parent_id] if parent.lineage else [parent_id]
             generation = parent.generation + 1
 
-        # Create organism
-        organism = Organism(
-            id=organism_id,
+        return Organism(
+            id=str(uuid.uuid4()),
             name=name,
             dna_code=dna_code,
             version="1.0.0",
@@ -80,30 +270,113 @@ class OrganismRegistry:
             updated_at=now,
             author=author,
             generation=generation,
-            lineage=lineage,
+            parent=parent,
             metadata=metadata or {},
-            tags=[]
+            tags=[],
+            pool=self.dna_pool
         )
 
-        # Store in registry
-        self.organisms[organism_id] = organism
+    def _link(self, organism: Organism, parent_id: Optional[str]):
+        """Add a registered organism to the species map, statistics and evolution tree"""
 
         # Update species map
-        species = self._extract_species(dna_code)
-        if species not in self.species_map:
-            self.species_map[species] = []
-        self.species_map[species].append(organism_id)
+        self._add_to_species(
+            organism.id, self._extract_species(organism.dna_code, organism.dna_digest)
+        )
+        self.stats.add(organism, self.organism_species[organism.id])
 
         # Update evolution tree
         if parent_id:
             if parent_id not in self.evolution_tree:
                 self.evolution_tree[parent_id] = []
-            self.evolution_tree[parent_id].append(organism_id)
+            self.evolution_tree[parent_id].append(organism.id)
+            self.genealogy.invalidate()
+
+    # Fields a bulk spec may set besides name, dna_code, author and metadata
+    BULK_FIELDS = ('consciousness_level', 'fitness', 'circuit_qasm', 'tags')
+
+    def _validate_specs(self, specs: List[Dict[str, Any]]):
+        """Check a batch of organism specs, raising ValueError listing all problems"""
+        errors = []
+
+        for position, spec in enumerate(specs):
+            if not isinstance(spec, dict):
+                errors.append(f"[{position}] must be an object")
+                continue
+            if not isinstance(spec.get('name'), str) or not spec['name']:
+                errors.append(f"[{position}] name is required")
+            if not isinstance(spec.get('dna_code'), str) or not spec['dna_code'].strip():
+                errors.append(f"[{position}] dna_code is required")
+
+            parent_index = spec.get('parent_index')
+            if parent_index is not None and (
+                not isinstance(parent_index, int) or not 0 <= parent_index < position
+            ):
+                errors.append(f"[{position}] parent_index must refer to an earlier organism")
+            parent_id = spec.get('parent_id')
+            if parent_id is not None and parent_id not in self.organisms:
+                errors.append(f"[{position}] parent {parent_id} not found")
+
+            if spec.get('tags') is not None and not isinstance(spec['tags'], list):
+                errors.append(f"[{position}] tags must be a list")
+
+        if errors:
+            raise ValueError(f"Invalid organisms: {'; '.join(errors[:20])}")
+
+    def register_many(self, specs: Iterable[Dict[str, Any]]) -> List[str]:
+        """Register a batch of organisms
+
+        Each spec has ``name`` and ``dna_code`` and optionally ``author``,
+        ``metadata``, ``fitness``, ``consciousness_level``, ``circuit_qasm``,
+        ``tags`` and a parent, given as ``parent_id`` (already registered)
+        or ``parent_index`` (an earlier spec in the same batch). The batch
+        is validated as a whole before anything is registered; ranking
+        indexes are merged once and the store receives a single write.
+        """
+
+        specs = list(specs)
+        self._validate_specs(specs)
+
+        now = datetime.now()
+        organisms: List[Organism] = []
+
+        for spec in specs:
+            if spec.get('parent_index') is not None:
+                parent_id = organisms[spec['parent_index']].id
+            else:
+                parent_id = spec.get('parent_id')
+
+            organism = self._build_organism(
+                spec['name'],
+                spec['dna_code'],
+                spec.get('author', 'system'),
+                parent_id,
+                spec.get('metadata'),
+                now
+            )
+            for field in self.BULK_FIELDS:
+                if spec.get(field) is not None:
+                    setattr(organism, field, spec[field])
 
-        return organism_id
+            # Later specs may name this one as parent
+            self.organisms[organism.id] = organism
+            organisms.append(organism)
+            self._link(organism, parent_id)
 
-    def _extract_species(self, dna_code: str) -> str:
-        """Extract species name from DNA code"""
+        self.index.add_many(organisms)
+
+        if self.store:
+            self.store.save_many([self._row(organism) for organism in organisms])
+            self.dna_pool.persisted(organism.dna_digest for organism in organisms)
+
+        return [organism.id for organism in organisms]
+
+    def _extract_species(self, dna_code: str, digest: Optional[bytes] = None) -> str:
+        """Extract species name from DNA code (cached by content hash)"""
+        return self.dna_cache.get_or_compute(dna_code, 'species', self._parse_species, digest)
+
+    @staticmethod
+    def _parse_species(dna_code: str) -> str:
         # Parse DNALang to find ORGANISM name
         lines = dna_code.split('\n')
         for line in lines:
@@ -126,7 +399,30 @@ class OrganismRegistry:
         if organism_id not in self.organisms:
             return False
 
-        organism = self.organisms[organism_id]
+        organism = self._apply_update(self.organisms[organism_id], updates)
+        self._persist(organism)
+
+        return True
+
+    def update_many(self, updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Update several organisms (id -> updates) with a single store write
+
+        Unknown ids are skipped; returns the ids that were updated.
+        """
+        organisms = [
+            self._apply_update(self.organisms[organism_id], organism_updates)
+            for organism_id, organism_updates in updates.items()
+            if organism_id in self.organisms
+        ]
+
+        if self.store and organisms:
+            self.store.save_many([self._row(organism) for organism in organisms])
+            self.dna_pool.persisted(organism.dna_digest for organism in organisms)
+
+        return [organism.id for organism in organisms]
+
+    def _apply_update(self, organism: Organism, updates: Dict[str, Any]) -> Organism:
+        """Apply updates to a registered organism and its indexes (not persisted)"""
 
         # Update allowed fields
         allowed_fields = [
@@ -134,6 +430,18 @@ class OrganismRegistry:
             'metadata', 'tags'
         ]
 
+        # Keep secondary indexes in sync with the new values
+        if 'tags' in updates:
+            self.index.update_tags(organism.id, organism.tags, updates['tags'])
+
+        self.stats.update(
+            fitness_delta=updates.get('fitness', organism.fitness) - organism.fitness,
+            consciousness_delta=(
+                updates.get('consciousness_level', organism.consciousness_level)
+                - organism.consciousness_level
+            )
+        )
+
         for field in allowed_fields:
             if field in updates:
                 setattr(organism, field, updates[field])
@@ -142,12 +450,16 @@ class OrganismRegistry:
 
         # Update version if DNA changed
         if 'dna_code' in updates:
+            self.index.remove_dna(organism)
             organism.dna_code = updates['dna_code']
+            self.index.add_dna(organism)
             version_parts = organism.version.split('.')
             version_parts[1] = str(int(version_parts[1]) + 1)
             organism.version = '.'.join(version_parts)
 
-        return True
+        self.index.update_rankings(organism)
+
+        return organism
 
     def evolve_organism(
         self,
@@ -180,75 +492,136 @@ class OrganismRegistry:
 
         return evolved_id
 
+    def evolve_many(
+        self,
+        evolutions: Iterable[Tuple[str, Dict[str, Any]]],
+        author: str = "evolution"
+    ) -> List[str]:
+        """Create evolved versions for a batch of ``(parent_id, mutations)`` pairs"""
+
+        evolutions = list(evolutions)
+        missing = [parent_id for parent_id, _ in evolutions if parent_id not in self.organisms]
+        if missing:
+            raise ValueError(f"Parents not found: {', '.join(missing[:20])}")
+
+        timestamp = datetime.now().isoformat()
+        specs = []
+        for parent_id, mutations in evolutions:
+            parent = self.organisms[parent_id]
+            specs.append({
+                'name': f"{parent.name}_gen{parent.generation + 1}",
+                'dna_code': self._apply_mutations(parent.dna_code, mutations),
+                'author': author,
+                'parent_id': parent_id,
+                'metadata': {
+                    'mutations': mutations,
+                    'parent_fitness': parent.fitness,
+                    'evolution_timestamp': timestamp
+                }
+            })
+
+        return self.register_many(specs)
+
     def _apply_mutations(
         self,
         dna_code: str,
         mutations: Dict[str, Any]
     ) -> str:
-        """Apply mutations to DNA code"""
-
-        # Simple mutation application
-        # In production, this would be more sophisticated
-        mutated_dna = dna_code
-
-        for mutation_type, mutation_value in mutations.items():
-            if mutation_type == 'gate_substitution':
-                # Replace quantum gates
-                for old_gate, new_gate in mutation_value.items():
-                    mutated_dna = mutated_dna.replace(old_gate, new_gate)
-
-            elif mutation_type == 'parameter_shift':
-                # Shift numerical parameters
-                import re
-                pattern = r'(\d+\.?\d*)'
-
-                def shift_param(match):
-                    value = float(match.group(1))
-                    return str(value * mutation_value.get('factor', 1.1))
-
-                mutated_dna = re.sub(pattern, shift_param, mutated_dna)
-
-            elif mutation_type == 'trait_modification':
-                # Modify traits
-                for trait, value in mutation_value.items():
-                    trait_pattern = f"{trait}:\\s*\\S+"
-                    new_trait = f"{trait}: {value}"
-                    mutated_dna = re.sub(trait_pattern, new_trait, mutated_dna)
-
-        return mutated_dna
+        """Apply mutations to DNA code (see ``MutationEngine``)"""
+        return self.mutation_engine.apply(dna_code, mutations)
 
     def get_species_members(self, species: str) -> List[Organism]:
         """Get all organisms of a species"""
         organism_ids = self.species_map.get(species, [])
         return [self.organisms[oid] for oid in organism_ids if oid in self.organisms]
 
-    def get_lineage(self, organism_id: str) -> List[Organism]:
-        """Get complete lineage of an organism"""
-        if organism_id not in self.organisms:
-            return []
+    def iter_lineage(
+        self,
+        organism_id: str,
+        max_depth: Optional[int] = None
+    ) -> Iterator[Organism]:
+        """Stream ancestors from the parent upwards, up to max_depth of them"""
+        organism = self.organisms.get(organism_id)
+        if organism is None:
+            return
+
+        depth = 0
+        ancestor = organism.parent
+        while ancestor is not None and (max_depth is None or depth < max_depth):
+            yield ancestor
+            ancestor = ancestor.parent
+            depth += 1
+
+    def get_lineage(
+        self,
+        organism_id: str,
+        max_depth: Optional[int] = None
+    ) -> List[Organism]:
+        """Get lineage of an organism, root first"""
+        lineage = list(self.iter_lineage(organism_id, max_depth))
+        lineage.reverse()
+        return lineage
 
-        organism = self.organisms[organism_id]
-        lineage = []
+    def iter_descendants(
+        self,
+        organism_id: str,
+        max_depth: Optional[int] = None,
+        limit: Optional[int] = None,
+        order: str = "dfs"
+    ) -> Iterator[Organism]:
+        """Stream descendants without recursion
+
+        ``order`` is ``dfs`` (pre-order, children in registration order) or
+        ``bfs`` (generation by generation). ``max_depth`` bounds the number
+        of generations below the organism and ``limit`` the number yielded.
+        """
+
+        if order not in ("dfs", "bfs"):
+            raise ValueError(f"Unknown traversal order: {order}")
+
+        frontier = deque([(organism_id, 0)])
+        pop = frontier.pop if order == "dfs" else frontier.popleft
+        yielded = 0
+
+        while frontier:
+            node_id, depth = pop()
+
+            if node_id != organism_id:
+                yield self.organisms[node_id]
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            if max_depth is not None and depth >= max_depth:
+                continue
 
-        for ancestor_id in organism.lineage or []:
-            if ancestor_id in self.organisms:
-                lineage.append(self.organisms[ancestor_id])
+            children = [
+                child_id for child_id in self.evolution_tree.get(node_id, [])
+                if child_id in self.organisms
+            ]
+            if order == "dfs":
+                children.reverse()
+            frontier.extend((child_id, depth + 1) for child_id in children)
 
-        return lineage
+    def get_descendants(
+        self,
+        organism_id: str,
+        max_depth: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Organism]:
+        """Get descendants of an organism (depth-first)"""
+        return list(self.iter_descendants(organism_id, max_depth, limit))
 
-    def get_descendants(self, organism_id: str) -> List[Organism]:
-        """Get all descendants of an organism"""
-        descendants = []
+    def is_ancestor(self, ancestor_id: str, organism_id: str) -> bool:
+        """Whether ancestor_id is an ancestor of organism_id (O(1) after indexing)"""
+        return self.genealogy.is_ancestor(ancestor_id, organism_id)
 
-        def collect_descendants(parent_id):
-            if parent_id in self.evolution_tree:
-                for child_id in self.evolution_tree[parent_id]:
-                    if child_id in self.organisms:
-                        descendants.append(self.organisms[child_id])
-                        collect_descendants(child_id)
+    def count_descendants(self, organism_id: str) -> int:
+        """Number of descendants of an organism (O(1) after indexing)"""
+        return self.genealogy.count_descendants(organism_id)
 
-        collect_descendants(organism_id)
-        return descendants
+    # Candidates whose DNA is fetched together during a text search
+    SEARCH_BATCH_SIZE = 256
 
     def search_organisms(
         self,
@@ -258,38 +631,42 @@ class OrganismRegistry:
         tags: Optional[List[str]] = None,
         author: Optional[str] = None
     ) -> List[Organism]:
-        """Search organisms with filters"""
-
-        results = []
-
-        for organism in self.organisms.values():
-            # Text search in name and DNA
-            if query:
-                if query.lower() not in organism.name.lower() and \
-                   query.lower() not in organism.dna_code.lower():
-                    continue
+        """Search organisms with filters
+
+        Filters are answered by intersecting the author, tag, generation,
+        fitness and n-gram posting lists; only the surviving candidates are
+        checked against the text query.
+        """
+
+        candidates, needs_text_check = self.index.candidates(
+            query=query,
+            min_fitness=min_fitness,
+            max_generation=max_generation,
+            tags=tags,
+            author=author
+        )
 
-            # Fitness filter
-            if min_fitness is not None and organism.fitness < min_fitness:
-                continue
+        ordered = self.index.order_by_fitness(candidates)  # Highest fitness first
+        if not needs_text_check:
+            return [self.organisms[organism_id] for organism_id in ordered]
 
-            # Generation filter
-            if max_generation is not None and organism.generation > max_generation:
-                continue
+        # Text search in name and DNA; DNA evicted to the store is fetched a
+        # batch of candidates at a time rather than one round trip each
+        results = []
+        query_lower = query.lower()
+        for start in range(0, len(ordered), self.SEARCH_BATCH_SIZE):
+            batch = [self.organisms[organism_id] for organism_id in ordered[start:start + self.SEARCH_BATCH_SIZE]]
+            unmatched = [organism for organism in batch if query_lower not in organism.name.lower()]
+            bodies = self.dna_pool.get_many(
+                (organism.dna_digest, organism.id) for organism in unmatched
+            )
+            unmatched_ids = {organism.id for organism in unmatched}
 
-            # Tag filter
-            if tags:
-                if not organism.tags or not any(tag in organism.tags for tag in tags):
+            for organism in batch:
+                if organism.id in unmatched_ids and \
+                   query_lower not in bodies.get(organism.dna_digest, '').lower():
                     continue
-
-            # Author filter
-            if author and organism.author != author:
-                continue
-
-            results.append(organism)
-
-        # Sort by fitness (highest first)
-        results.sort(key=lambda x: x.fitness, reverse=True)
+                results.append(organism)
 
         return results
 
@@ -298,46 +675,29 @@ class OrganismRegistry:
         limit: int = 10,
         metric: str = "fitness"
     ) -> List[Organism]:
-        """Get top organisms by metric"""
-
-        organisms = list(self.organisms.values())
-
-        if metric == "fitness":
-            organisms.sort(key=lambda x: x.fitness, reverse=True)
-        elif metric == "consciousness":
-            organisms.sort(key=lambda x: x.consciousness_level, reverse=True)
-        elif metric == "generation":
-            organisms.sort(key=lambda x: x.generation, reverse=True)
-        elif metric == "recent":
-            organisms.sort(key=lambda x: x.updated_at, reverse=True)
-
-        return organisms[:limit]
-
-    def calculate_diversity_index(self) -> float:
-        """Calculate diversity index of organism population"""
+        """Get top organisms by metric
 
-        if not self.organisms:
-            return 0.0
+        Built-in metrics (fitness, consciousness, generation, recent) are read
+        from order-maintained indexes in O(k); any other organism attribute
+        falls back to ``heapq.nlargest``.
+        """
 
-        # Shannon diversity index based on species
-        species_counts = {}
-        total = len(self.organisms)
+        ranking = self.index.ranking(metric)
+        if ranking is not None:
+            return [self.organisms[organism_id] for organism_id in ranking.top(limit)]
 
-        for species, members in self.species_map.items():
-            species_counts[species] = len(members)
+        organisms = self.organisms.values()
+        if organisms and hasattr(next(iter(organisms)), metric):
+            return heapq.nlargest(limit, organisms, key=lambda x: getattr(x, metric))
 
-        # Calculate Shannon index
-        diversity = 0
-        for count in species_counts.values():
-            if count > 0:
-                proportion = count / total
-                diversity -= proportion * np.log(proportion)
+        return list(organisms)[:limit]
 
-        # Normalize to 0-1 scale
-        max_diversity = np.log(len(species_counts)) if len(species_counts) > 1 else 1
-        normalized_diversity = diversity / max_diversity if max_diversity > 0 else 0
+    def calculate_diversity_index(self) -> float:
+        """Calculate diversity index of organism population
 
-        return normalized_diversity
+        Shannon index over species, from running species counts in O(1).
+        """
+        return self.stats.diversity_index()
 
     def export_organism(self, organism_id: str) -> Optional[Dict[str, Any]]:
         """Export organism data for sharing"""
@@ -363,42 +723,114 @@ class OrganismRegistry:
         """Import organism from exported data"""
 
         try:
-            org_data = organism_data['organism']
-
-            # Create new organism
-            organism_id = self.register_organism(
-                name=org_data['name'],
-                dna_code=org_data['dna_code'],
-                author=org_data.get('author', 'imported'),
-                metadata=org_data.get('metadata', {})
-            )
-
-            # Update properties
-            if organism_id:
-                self.update_organism(organism_id, {
-                    'consciousness_level': org_data.get('consciousness_level', 0),
-                    'fitness': org_data.get('fitness', 0),
-                    'circuit_qasm': org_data.get('circuit_qasm'),
-                    'tags': org_data.get('tags', [])
-                })
-
-                # Import lineage if requested
-                if preserve_lineage and 'lineage' in organism_data:
-                    for ancestor_data in organism_data['lineage']:
-                        self.import_organism({'organism': ancestor_data}, False)
-
-            return organism_id
+            return self.import_many([organism_data], preserve_lineage)[0]
 
         except Exception as e:
             print(f"Import failed: {e}")
             return None
 
+    @staticmethod
+    def _import_spec(org_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'name': org_data.get('name'),
+            'dna_code': org_data.get('dna_code'),
+            'author': org_data.get('author', 'imported'),
+            'metadata': org_data.get('metadata', {}),
+            'consciousness_level': org_data.get('consciousness_level', 0),
+            'fitness': org_data.get('fitness', 0),
+            'circuit_qasm': org_data.get('circuit_qasm'),
+            'tags': org_data.get('tags', [])
+        }
+
+    def import_many(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        preserve_lineage: bool = False
+    ) -> List[str]:
+        """Import a batch of exported organisms (see ``export_organism``)
+
+        With ``preserve_lineage`` each document's ancestors are imported
+        root first and linked as parents, so the imported organism keeps its
+        lineage; ancestors shared between documents are imported once.
+        Returns the new id of each document's organism.
+        """
+
+        specs: List[Dict[str, Any]] = []
+        imported: Dict[str, int] = {}  # Exported id -> spec position
+        positions: List[int] = []
+
+        def add(org_data: Dict[str, Any], parent_index: Optional[int]) -> int:
+            exported_id = org_data.get('id')
+            if exported_id is not None and exported_id in imported:
+                return imported[exported_id]
+
+            spec = self._import_spec(org_data)
+            spec['parent_index'] = parent_index
+            specs.append(spec)
+            if exported_id is not None:
+                imported[exported_id] = len(specs) - 1
+            return len(specs) - 1
+
+        for document in documents:
+            if not isinstance(document, dict) or not isinstance(document.get('organism'), dict):
+                raise ValueError("Each document needs an 'organism' object")
+
+            parent_index = None
+            if preserve_lineage:
+                for ancestor_data in document.get('lineage') or []:
+                    parent_index = add(ancestor_data, parent_index)
+
+            positions.append(add(document['organism'], parent_index))
+
+        ids = self.register_many(specs)
+        return [ids[position] for position in positions]
+
+    def import_jsonl(
+        self,
+        lines: Iterable[str],
+        preserve_lineage: bool = False,
+        batch_size: int = 1000
+    ) -> List[str]:
+        """Stream exported organisms from JSON lines, importing in batches
+
+        Each line is an export document or a bare organism object; any
+        other JSON value raises ValueError.
+        """
+
+        ids: List[str] = []
+        batch: List[Dict[str, Any]] = []
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            document = json.loads(line)
+            if not isinstance(document, dict):
+                raise ValueError(f"Expected a JSON object per line, got {type(document).__name__}")
+            if 'organism' not in document:
+                document = {'organism': document}
+            batch.append(document)
+
+            if len(batch) >= batch_size:
+                ids.extend(self.import_many(batch, preserve_lineage))
+                batch = []
+
+        if batch:
+            ids.extend(self.import_many(batch, preserve_lineage))
+
+        return ids
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get registry statistics"""
+        """Get registry statistics
 
-        organisms = list(self.organisms.values())
+        Served from running aggregates and the ranking indexes, so the cost
+        does not grow with the number of organisms.
+        """
 
-        if not organisms:
+        stats = self.stats
+
+        if not stats.count:
             return {
                 'total_organisms': 0,
                 'species_count': 0,
@@ -406,14 +838,14 @@ class OrganismRegistry:
             }
 
         return {
-            'total_organisms': len(organisms),
+            'total_organisms': stats.count,
             'species_count': len(self.species_map),
-            'average_fitness': np.mean([o.fitness for o in organisms]),
-            'max_fitness': max(o.fitness for o in organisms),
-            'average_generation': np.mean([o.generation for o in organisms]),
-            'max_generation': max(o.generation for o in organisms),
-            'average_consciousness': np.mean([o.consciousness_level for o in organisms]),
-            'diversity_index': self.calculate_diversity_index(),
-            'authors': list(set(o.author for o in organisms)),
+            'average_fitness': stats.mean(stats.fitness_sum),
+            'max_fitness': self.index.ranking('fitness').max(),
+            'average_generation': stats.mean(stats.generation_sum),
+            'max_generation': self.index.ranking('generation').max(),
+            'average_consciousness': stats.mean(stats.consciousness_sum),
+            'diversity_index': stats.diversity_index(),
+            'authors': stats.authors(),
             'total_lineages': len(self.evolution_tree)
-        }
\ No newline at end of file
+        }
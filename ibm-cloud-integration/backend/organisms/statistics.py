@@ -0,0 +1,63 @@
+"""Running Aggregates for Registry Statistics"""
+
+import math
+from typing import Dict, List
+
+
+class RegistryStatistics:
+    """Aggregates maintained on register/update
+
+    Keeps counts and sums of fitness, generation and consciousness, author
+    and species counts, and ``sum(c * ln c)`` over species counts so the
+    Shannon index ``H = ln N - sum(c ln c) / N`` is available in O(1).
+    Maxima come from the registry's sorted ranking indexes.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.fitness_sum = 0.0
+        self.generation_sum = 0
+        self.consciousness_sum = 0.0
+
+        self.author_counts: Dict[str, int] = {}
+        self.species_counts: Dict[str, int] = {}
+        self._species_entropy_sum = 0.0  # sum of c * ln(c)
+
+    @staticmethod
+    def _c_log_c(count: int) -> float:
+        return count * math.log(count) if count > 0 else 0.0
+
+    def add(self, organism, species: str):
+        """Account for a newly registered organism"""
+        self.count += 1
+        self.fitness_sum += organism.fitness
+        self.generation_sum += organism.generation
+        self.consciousness_sum += organism.consciousness_level
+
+        self.author_counts[organism.author] = self.author_counts.get(organism.author, 0) + 1
+
+        previous = self.species_counts.get(species, 0)
+        self.species_counts[species] = previous + 1
+        self._species_entropy_sum += self._c_log_c(previous + 1) - self._c_log_c(previous)
+
+    def update(self, fitness_delta: float = 0.0, consciousness_delta: float = 0.0):
+        """Account for changed fitness / consciousness of an organism"""
+        self.fitness_sum += fitness_delta
+        self.consciousness_sum += consciousness_delta
+
+    def mean(self, total: float) -> float:
+        return total / self.count if self.count else 0.0
+
+    def diversity_index(self) -> float:
+        """Shannon diversity over species, normalized to 0-1"""
+        if not self.count:
+            return 0.0
+
+        diversity = max(0.0, math.log(self.count) - self._species_entropy_sum / self.count)
+
+        species = len(self.species_counts)
+        max_diversity = math.log(species) if species > 1 else 1
+        return diversity / max_diversity if max_diversity > 0 else 0
+
+    def authors(self) -> List[str]:
+        return [author for author, count in self.author_counts.items() if count > 0]
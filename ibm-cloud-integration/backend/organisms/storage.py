@@ -0,0 +1,345 @@
+"""Persistent Storage Backends for the Organism Registry"""
+
+import json
+import asyncio
+import sqlite3
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Any, Iterator
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class OrganismStore(ABC):
+    """Persistence interface used by ``OrganismRegistry``
+
+    Rows are plain dicts with the ``Organism`` fields plus ``parent_id``
+    and ``species``. ``load_all`` yields rows in creation order including
+    ``dna_code`` (used once to build indexes); afterwards DNA bodies are
+    fetched on demand with ``load_dna``, or ``load_dna_many`` when a scan
+    needs several at once.
+    """
+
+    @abstractmethod
+    def load_all(self) -> Iterator[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def load_dna(self, organism_id: str) -> Optional[str]:
+        ...
+
+    def load_dna_many(self, organism_ids: List[str]) -> Dict[str, str]:
+        bodies = {}
+        for organism_id in organism_ids:
+            dna_code = self.load_dna(organism_id)
+            if dna_code is not None:
+                bodies[organism_id] = dna_code
+        return bodies
+
+    @abstractmethod
+    def save(self, row: Dict[str, Any]):
+        ...
+
+    def save_many(self, rows: List[Dict[str, Any]]):
+        for row in rows:
+            self.save(row)
+
+    def close(self):
+        pass
+
+
+class SQLiteOrganismStore(OrganismStore):
+    """Single-file SQLite store (local persistence across restarts)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS organisms (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            dna_code TEXT NOT NULL,
+            dna_hash TEXT NOT NULL,
+            version TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            author TEXT NOT NULL,
+            consciousness_level REAL DEFAULT 0,
+            fitness REAL DEFAULT 0,
+            generation INTEGER DEFAULT 0,
+            parent_id TEXT,
+            lineage TEXT,
+            metadata TEXT,
+            circuit_qasm TEXT,
+            tags TEXT,
+            species TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_organisms_created ON organisms(created_at);
+    """
+
+    COLUMNS = [
+        'id', 'name', 'dna_code', 'dna_hash', 'version', 'created_at', 'updated_at',
+        'author', 'consciousness_level', 'fitness', 'generation', 'parent_id',
+        'lineage', 'metadata', 'circuit_qasm', 'tags', 'species'
+    ]
+
+    # Columns holding JSON-encoded values
+    JSON_COLUMNS = ('lineage', 'metadata', 'tags')
+
+    # Ids per IN (...) query, under SQLite's bound parameter limit
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self.lock = threading.Lock()
+
+    def _encode(self, row: Dict[str, Any]) -> List[Any]:
+        values = []
+        for column in self.COLUMNS:
+            if column == 'dna_hash':
+                value = hashlib.sha256(row['dna_code'].encode()).hexdigest()
+            else:
+                value = row.get(column)
+            if column in self.JSON_COLUMNS:
+                value = json.dumps(value, default=str)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            values.append(value)
+        return values
+
+    def _decode(self, record: sqlite3.Row) -> Dict[str, Any]:
+        row = dict(record)
+        for column in self.JSON_COLUMNS:
+            row[column] = json.loads(row[column]) if row[column] else None
+        row['created_at'] = datetime.fromisoformat(row['created_at'])
+        row['updated_at'] = datetime.fromisoformat(row['updated_at'])
+        row.pop('dna_hash', None)
+        return row
+
+    def load_all(self) -> Iterator[Dict[str, Any]]:
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM organisms ORDER BY created_at, rowid"
+        )
+        for record in cursor:
+            yield self._decode(record)
+
+    def load_dna(self, organism_id: str) -> Optional[str]:
+        record = self.conn.execute(
+            "SELECT dna_code FROM organisms WHERE id = ?", (organism_id,)
+        ).fetchone()
+        return record['dna_code'] if record else None
+
+    def load_dna_many(self, organism_ids: List[str]) -> Dict[str, str]:
+        bodies = {}
+        for start in range(0, len(organism_ids), self.BATCH_SIZE):
+            batch = organism_ids[start:start + self.BATCH_SIZE]
+            cursor = self.conn.execute(
+                f"SELECT id, dna_code FROM organisms WHERE id IN ({', '.join('?' for _ in batch)})",
+                batch
+            )
+            bodies.update((record['id'], record['dna_code']) for record in cursor)
+        return bodies
+
+    def _upsert_sql(self) -> str:
+        updates = ', '.join(f"{c} = excluded.{c}" for c in self.COLUMNS if c != 'id')
+        return (
+            f"INSERT INTO organisms ({', '.join(self.COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in self.COLUMNS)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
+    def save(self, row: Dict[str, Any]):
+        with self.lock, self.conn:
+            self.conn.execute(self._upsert_sql(), self._encode(row))
+
+    def save_many(self, rows: List[Dict[str, Any]]):
+        with self.lock, self.conn:
+            self.conn.executemany(self._upsert_sql(), [self._encode(row) for row in rows])
+
+    def close(self):
+        self.conn.close()
+
+
+class PostgresOrganismStore(OrganismStore):
+    """PostgreSQL store shared by all replicas, via ``database.connection``
+
+    Uses ``OrganismRepository`` on a dedicated event loop thread so the
+    synchronous registry can write through without blocking on the API's
+    own loop. Requires the repository root on ``PYTHONPATH`` and the
+    ``DATABASE_URL`` used by ``database/connection.py``.
+
+    The ``organisms`` table is shared with the platform schema: registry
+    fields without a column (author, version, fitness, circuit, lineage,
+    species and the display name) live under ``metadata['registry']``, and
+    the ``name`` column is suffixed with the id to satisfy the per-tenant
+    unique name constraint, since evolved siblings share names.
+    """
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, tenant_id: str, owner_id: str):
+        from database.connection import (
+            OrganismRepository, init_db_pool, close_db_pool, fetch_all, get_db_transaction
+        )
+
+        self.tenant_id = tenant_id
+        self.owner_id = owner_id
+        self._close_db_pool = close_db_pool
+        self._fetch_all = fetch_all
+        self._transaction = get_db_transaction
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+        self._run(init_db_pool())
+        self.repository = OrganismRepository(tenant_id)
+        self.persisted: set = set()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def _to_record(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = dict(row.get('metadata') or {})
+        metadata['registry'] = {
+            'name': row['name'],
+            'author': row['author'],
+            'version': row['version'],
+            'fitness': row['fitness'],
+            'circuit_qasm': row.get('circuit_qasm'),
+            'lineage': row.get('lineage') or [],
+            'species': row.get('species')
+        }
+        return {
+            'id': row['id'],
+            'owner_id': self.owner_id,
+            'name': f"{row['name']}-{row['id'][:8]}",
+            'dna_code': row['dna_code'],
+            'dna_hash': hashlib.sha256(row['dna_code'].encode()).hexdigest(),
+            'phi': row['consciousness_level'],
+            'generation': row['generation'],
+            'parent_organism_id': row.get('parent_id'),
+            'tags': row.get('tags') or [],
+            'metadata': json.dumps(metadata, default=str),
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+
+    def _from_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = record.get('metadata') or {}
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata)
+        registry = metadata.pop('registry', {})
+
+        return {
+            'id': str(record['id']),
+            'name': registry.get('name', record['name']),
+            'dna_code': record.get('dna_code'),
+            'version': registry.get('version', '1.0.0'),
+            'created_at': record['created_at'],
+            'updated_at': record['updated_at'],
+            'author': registry.get('author', 'system'),
+            'consciousness_level': float(record.get('phi') or 0),
+            'fitness': registry.get('fitness', 0.0),
+            'generation': record.get('generation') or 0,
+            'parent_id': str(record['parent_organism_id']) if record.get('parent_organism_id') else None,
+            'lineage': registry.get('lineage', []),
+            'metadata': metadata,
+            'circuit_qasm': registry.get('circuit_qasm'),
+            'tags': list(record.get('tags') or []),
+            'species': registry.get('species')
+        }
+
+    def load_all(self) -> Iterator[Dict[str, Any]]:
+        # Keyset pages on (created_at, id): batches share created_at, so
+        # OFFSET paging on created_at alone could skip or repeat rows
+        query = (
+            "SELECT * FROM organisms WHERE tenant_id = $1 AND deleted_at IS NULL {after}"
+            "ORDER BY created_at, id LIMIT $2"
+        )
+        records = self._run(self._fetch_all(query.format(after=''), self.tenant_id, self.PAGE_SIZE))
+        while records:
+            for record in records:
+                self.persisted.add(str(record['id']))
+                yield self._from_record(record)
+            if len(records) < self.PAGE_SIZE:
+                break
+
+            last = records[-1]
+            records = self._run(self._fetch_all(
+                query.format(after="AND (created_at, id) > ($3, $4) "),
+                self.tenant_id, self.PAGE_SIZE, last['created_at'], last['id']
+            ))
+
+    def load_dna(self, organism_id: str) -> Optional[str]:
+        record = self._run(self.repository.find_by_id(organism_id))
+        return record['dna_code'] if record else None
+
+    def load_dna_many(self, organism_ids: List[str]) -> Dict[str, str]:
+        records = self._run(self._fetch_all(
+            "SELECT id, dna_code FROM organisms "
+            "WHERE id = ANY($1::uuid[]) AND tenant_id = $2 AND deleted_at IS NULL",
+            organism_ids,
+            self.tenant_id
+        ))
+        return {str(record['id']): record['dna_code'] for record in records}
+
+    def save(self, row: Dict[str, Any]):
+        record = self._to_record(row)
+        if row['id'] in self.persisted:
+            record.pop('id')
+            record.pop('created_at')
+            self._run(self.repository.update(row['id'], record))
+        else:
+            self._run(self.repository.create(record))
+            self.persisted.add(row['id'])
+
+    def save_many(self, rows: List[Dict[str, Any]]):
+        """Upsert rows with one executemany in a single transaction"""
+        if not rows:
+            return
+
+        records = [self._to_record(row) for row in rows]
+        columns = ['tenant_id'] + list(records[0])
+        updates = ', '.join(
+            f"{column} = excluded.{column}" for column in columns
+            if column not in ('id', 'tenant_id', 'owner_id', 'created_at')
+        )
+        query = (
+            f"INSERT INTO organisms ({', '.join(columns)}) "
+            f"VALUES ({', '.join(f'${i + 1}' for i in range(len(columns)))}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates} WHERE organisms.deleted_at IS NULL"
+        )
+        values = [[self.tenant_id] + [record[column] for column in columns[1:]] for record in records]
+
+        self._run(self._upsert_many(query, values))
+        self.persisted.update(row['id'] for row in rows)
+
+    async def _upsert_many(self, query: str, values: List[List[Any]]):
+        async with self._transaction() as conn:
+            await conn.execute("SET app.current_tenant = $1", self.tenant_id)
+            await conn.executemany(query, values)
+
+    def close(self):
+        try:
+            self._run(self._close_db_pool())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def create_organism_store(url: str, tenant_id: str = "", owner_id: str = "") -> Optional[OrganismStore]:
+    """Build a store from a URL: ``sqlite:///path/to.db`` or ``postgresql``"""
+    if not url:
+        return None
+
+    if url.startswith('sqlite:///'):
+        return SQLiteOrganismStore(url[len('sqlite:///'):])
+
+    if url.startswith('postgres'):
+        return PostgresOrganismStore(tenant_id, owner_id)
+
+    raise ValueError(f"Unsupported organism store URL: {url}")
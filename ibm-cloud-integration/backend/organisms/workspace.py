@@ -0,0 +1,407 @@
+"""Incrementally Parsed DNALang Documents for the IDE"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+
+from .dnalang import (
+    tokenize, typed_value, ParseIssue,
+    IDENT, LBRACE, RBRACE, LBRACKET, RBRACKET, COLON
+)
+
+# Parser state at a line boundary: (open blocks, pending construct, warned line).
+# Open blocks are (kind, name, Line) frames and Lines compare by identity, so
+# states stay equal when lines are inserted or removed elsewhere.
+INITIAL_STATE = ((), None, None)
+
+
+@dataclass
+class TextEdit:
+    """Replacement of a 0-based (line, character) range; no range replaces everything"""
+    text: str
+    start_line: Optional[int] = None
+    start_character: Optional[int] = None
+    end_line: Optional[int] = None
+    end_character: Optional[int] = None
+
+    @property
+    def is_full(self) -> bool:
+        return self.start_line is None or self.end_line is None
+
+
+class Line:
+    """Source line with its tokens, entry parser state and parse results"""
+
+    __slots__ = ('text', 'tokens', 'state', 'blocks', 'fields', 'issues', 'index')
+
+    def __init__(self, text: str, index: int = 0):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.state = None
+        self.blocks: Tuple[Optional[str], ...] = ()  # Kinds of blocks opened on this line
+        self.fields: Tuple[tuple, ...] = ()  # (name, value, owner kind, Line)
+        self.issues: Tuple[tuple, ...] = ()  # (Line, severity, message)
+        self.index: Optional[int] = index  # None once removed from its document
+
+    def set_text(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+
+
+class LineParser:
+    """The ``dnalang.Parser`` grammar as a per-line state machine
+
+    Consumes one line from an immutable entry state and yields the blocks,
+    fields and diagnostics the batch parser would produce for it, plus the
+    exit state. A document can therefore resume parsing at any line and
+    stop as soon as the exit state matches what the next line saw before.
+
+    Pending constructs are a block header (one or two identifiers waiting
+    for ``{`` or ``:``) or a bracketed field value spanning lines:
+    ``('field', name, Line, owner, depth, items, raw, gap, colon Line)``.
+    """
+
+    def __init__(self, line: Optional[Line], state: tuple):
+        self.line = line
+        self.stack, self.pending, self.warned = state
+        self.blocks: List[Optional[str]] = []
+        self.fields: List[tuple] = []
+        self.issues: List[tuple] = []
+        self._cursor = 0  # Column up to which field text has been consumed
+
+    def state(self) -> tuple:
+        # Warning de-duplication only matters while a header spans lines
+        return (self.stack, self.pending, self.warned if self.pending else None)
+
+    def run(self, limit: Optional[int] = None) -> 'LineParser':
+        """Parse the line; with a limit, only tokens ending at or before it"""
+        text = self.line.text
+
+        for kind, start, end in self.line.tokens:
+            if limit is not None and end > limit:
+                return self
+            self._token(kind, start, end, text)
+
+        if limit is None:
+            pending = self.pending
+            if pending and pending[0] == 'field':
+                if pending[4] == 0:
+                    self._finish_field(pending)
+                else:
+                    gap = pending[7] + text[self._cursor:] + '\n'
+                    self.pending = pending[:7] + (gap, pending[8])
+        return self
+
+    def finish(self) -> 'LineParser':
+        """Flush constructs still open at the end of the document"""
+        pending = self.pending
+        if pending and pending[0] == 'field':
+            self._finish_field(pending)
+        elif pending:
+            for ident, line in pending[1]:
+                self._unexpected(line, ident)
+            self.pending = None
+
+        for kind, _, line in self.stack:
+            self.issues.append((line, 'error', f'Unclosed brace for {kind or "block"}'))
+        return self
+
+    def _unexpected(self, line: Line, text: str):
+        if line is not self.warned:
+            self.warned = line
+            self.issues.append((line, 'warning', f"Unexpected '{text}'"))
+
+    def _open(self, kind: Optional[str], name: Optional[str], line: Line):
+        self.stack = self.stack + ((kind, name, line),)
+        self.blocks.append(kind)
+
+    def _finish_field(self, field: tuple):
+        _, name, line, owner, depth, items, raw = field[:7]
+        if depth > 0:
+            self.issues.append((line, 'error', "Unclosed '['"))
+        self.fields.append((name, typed_value(list(items), raw or ''), owner, line))
+        self.pending = None
+
+    def _token(self, kind: int, start: int, end: int, text: str):
+        line = self.line
+        pending = self.pending
+
+        if pending and pending[0] == 'field':
+            if pending[4] > 0 or kind not in (LBRACE, RBRACE):
+                self._field_token(pending, kind, start, end, text)
+                return
+            self._finish_field(pending)
+            pending = None
+
+        if pending:
+            idents = pending[1]
+
+            if kind == LBRACE:
+                self.pending = None
+                self._open(idents[0][0], idents[1][0] if len(idents) == 2 else None, idents[0][1])
+                return
+
+            if len(idents) == 1 and kind == COLON:
+                owner = self.stack[-1][0] if self.stack else None
+                self.pending = ('field', idents[0][0], idents[0][1], owner, 0, (), None, '', line)
+                return
+
+            if len(idents) == 1 and kind == IDENT:
+                self.pending = ('header', idents + ((text[start:end], line),))
+                return
+
+            # Not a header after all: the first identifier is stray
+            self._unexpected(idents[0][1], idents[0][0])
+            self.pending = ('header', idents[1:]) if len(idents) == 2 else None
+            if self.pending:
+                self._token(kind, start, end, text)
+                return
+
+        if kind == IDENT:
+            self.pending = ('header', ((text[start:end], line),))
+        elif kind == RBRACE:
+            if self.stack:
+                self.stack = self.stack[:-1]
+            else:
+                self.issues.append((line, 'error', 'Unexpected closing brace'))
+        elif kind == LBRACE:
+            self._open(None, None, line)
+        else:
+            self._unexpected(line, text[start:end])
+
+    def _field_token(self, field: tuple, kind: int, start: int, end: int, text: str):
+        _, name, name_line, owner, depth, items, raw, gap, colon_line = field
+
+        if kind == LBRACKET:
+            depth += 1
+        elif kind == RBRACKET:
+            depth -= 1
+
+        if raw is None:
+            raw = ''
+        else:
+            raw += gap + text[self._cursor:start]
+        items += ((kind, len(raw), len(raw) + end - start),)
+        raw += text[start:end]
+        self._cursor = end
+
+        field = ('field', name, name_line, owner, depth, items, raw, '', colon_line)
+        # Past the first line a value ends as soon as its brackets balance
+        if depth < 0 or (depth == 0 and colon_line is not self.line):
+            self._finish_field(field)
+        else:
+            self.pending = field
+
+
+class EditableDocument:
+    """DNALang document kept as parsed lines and updated by text edits
+
+    Each line stores its tokens, the parser state on entry and what it
+    contributed (blocks, fields, diagnostics). An edit re-tokenizes only
+    the lines it touches and re-parses forward until a line's entry state
+    is unchanged, so typing inside a gene costs O(edited lines) rather
+    than a full parse. Section counts, fields by name and diagnostics are
+    maintained as running aggregates for validation.
+    """
+
+    def __init__(self, text: str, version: int = 0):
+        self.version = version
+        self.lines: List[Line] = []
+        self.block_counts: Dict[Optional[str], int] = {}
+        self._field_lines: Dict[str, Dict[Line, None]] = {}
+        self._issue_lines: Dict[Line, None] = {}
+        self._final = LineParser(None, INITIAL_STATE)  # Constructs closed by end of text
+        self._stale_from = 0  # First line whose stored index may be outdated
+        self.reparsed_lines = 0
+        self._replace_all(text)
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(line.text for line in self.lines)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def apply(self, edits: List[TextEdit], version: Optional[int] = None):
+        """Apply edits in order, each against the result of the previous one"""
+        self.reparsed_lines = 0
+        for edit in edits:
+            if edit.is_full:
+                self._replace_all(edit.text)
+            else:
+                self._replace_range(edit)
+        self.version = self.version + 1 if version is None else version
+
+    def _clamp(self, line: int, character: Optional[int]) -> Tuple[int, int]:
+        line = min(max(line, 0), len(self.lines) - 1)
+        length = len(self.lines[line].text)
+        return line, length if character is None else min(max(character, 0), length)
+
+    def _replace_all(self, text: str):
+        for line in self.lines:
+            line.index = None
+        self.lines = [Line(line, index) for index, line in enumerate(text.split('\n'))]
+        self.block_counts = {}
+        self._field_lines = {}
+        self._issue_lines = {}
+        self._stale_from = len(self.lines)
+        self.lines[0].state = INITIAL_STATE
+        self._reparse(0, len(self.lines))
+
+    def _replace_range(self, edit: TextEdit):
+        start = self._clamp(edit.start_line, edit.start_character)
+        end = self._clamp(edit.end_line, edit.end_character)
+        if end < start:
+            start, end = end, start
+
+        lines = self.lines
+        first, last = lines[start[0]], lines[end[0]]
+        texts = (first.text[:start[1]] + edit.text + last.text[end[1]:]).split('\n')
+
+        removed = lines[start[0] + 1:end[0] + 1]
+        for line in removed:
+            self._retract(line)
+            line.index = None
+
+        # The first line object is kept so open-block frames that refer to it stay equal
+        first.set_text(texts[0])
+        lines[start[0] + 1:end[0] + 1] = [
+            Line(text, start[0] + offset) for offset, text in enumerate(texts[1:], 1)
+        ]
+        if len(removed) != len(texts) - 1:
+            self._stale_from = min(self._stale_from, start[0] + 1)
+
+        self._reparse(start[0], start[0] + len(texts))
+
+    def _reparse(self, first: int, changed_end: int):
+        """Re-parse from a line until past changed_end with matching entry state"""
+        lines = self.lines
+        state = lines[first].state
+        index = first
+
+        while index < len(lines):
+            line = lines[index]
+            if index >= changed_end and line.state == state:
+                return
+            line.state = state
+
+            parser = LineParser(line, state).run()
+            self._retract(line)
+            line.blocks = tuple(parser.blocks)
+            line.fields = tuple(parser.fields)
+            line.issues = tuple(parser.issues)
+            self._account(line)
+
+            state = parser.state()
+            self.reparsed_lines += 1
+            index += 1
+
+        self._final = LineParser(None, state).finish()
+
+    def _account(self, line: Line):
+        for kind in line.blocks:
+            self.block_counts[kind] = self.block_counts.get(kind, 0) + 1
+        for field in line.fields:
+            self._field_lines.setdefault(field[0], {})[line] = None
+        if line.issues:
+            self._issue_lines[line] = None
+
+    def _retract(self, line: Line):
+        for kind in line.blocks:
+            self.block_counts[kind] -= 1
+            if not self.block_counts[kind]:
+                del self.block_counts[kind]
+        for field in line.fields:
+            owners = self._field_lines.get(field[0])
+            if owners is not None:
+                owners.pop(line, None)
+        self._issue_lines.pop(line, None)
+        line.blocks = line.fields = line.issues = ()
+
+    def line_number(self, line: Line) -> Optional[int]:
+        """1-based line number, or None for a line no longer in the document"""
+        if line.index is None:
+            return None
+        if self._stale_from < len(self.lines):
+            for index in range(self._stale_from, len(self.lines)):
+                self.lines[index].index = index
+            self._stale_from = len(self.lines)
+        return line.index + 1
+
+    def issues(self) -> List[ParseIssue]:
+        """Parser diagnostics ordered by line"""
+        found = []
+        for issues in [line.issues for line in self._issue_lines] + [self._final.issues]:
+            for target, severity, message in issues:
+                number = self.line_number(target)
+                if number is not None:
+                    found.append(ParseIssue(number, severity, message))
+        found.sort(key=lambda issue: issue.line)
+        return found
+
+    def fields(self, name: str) -> Iterator[Tuple[Any, Optional[str], int]]:
+        """(value, owner block kind, line number) of every field with a name"""
+        lines = self._field_lines.get(name, ())
+        for fields in [line.fields for line in lines] + [self._final.fields]:
+            for field_name, value, owner, target in fields:
+                if field_name == name:
+                    number = self.line_number(target)
+                    if number is not None:
+                        yield value, owner, number
+
+    def path_at(self, line: int, character: int) -> List[Tuple[Optional[str], Optional[str]]]:
+        """(kind, name) of blocks open at a position, outermost first"""
+        line, character = self._clamp(line, character)
+        target = self.lines[line]
+        parser = LineParser(target, target.state).run(limit=character)
+        return [(kind, name) for kind, name, _ in parser.stack]
+
+
+class DocumentCache:
+    """Open IDE documents keyed by id, each at a known version
+
+    Least recently used documents are dropped beyond ``max_documents``;
+    the editor re-opens them with full text on the next request.
+    """
+
+    def __init__(self, max_documents: int = 64):
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[str, EditableDocument]" = OrderedDict()
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def open(self, document_id: str, text: str, version: int = 0) -> EditableDocument:
+        document = EditableDocument(text, version)
+        self._documents[document_id] = document
+        self._documents.move_to_end(document_id)
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+        return document
+
+    def get(self, document_id: str, version: Optional[int] = None) -> EditableDocument:
+        """Open document; KeyError if unknown, ValueError if not at version"""
+        document = self._documents[document_id]
+        if version is not None and document.version != version:
+            raise ValueError(
+                f"Document {document_id} is at version {document.version}, not {version}"
+            )
+        self._documents.move_to_end(document_id)
+        return document
+
+    def apply(self, document_id: str, version: int, edits: List[TextEdit]) -> EditableDocument:
+        """Apply edits producing a newer version"""
+        document = self.get(document_id)
+        if version <= document.version:
+            raise ValueError(
+                f"Stale edit for {document_id}: version {version} <= {document.version}"
+            )
+        document.apply(edits, version)
+        return document
+
+    def close(self, document_id: str) -> bool:
+        return self._documents.pop(document_id, None) is not None
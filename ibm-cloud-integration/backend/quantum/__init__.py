@@ -1,7 +1,7 @@
 """Quantum computing module for DNALang IBM integration"""
 
 from .qiskit_client import QiskitClient
-from .orchestrator import QuantumOrchestrator
+from .orchestrator import QuantumOrchestrator, BudgetExceededError
 from .circuits import CircuitLibrary
 
-__all__ = ["QiskitClient", "QuantumOrchestrator", "CircuitLibrary"]
\ No newline at end of file
+__all__ = ["QiskitClient", "QuantumOrchestrator", "BudgetExceededError", "CircuitLibrary"]
\ No newline at end of file
@@ -3,7 +3,7 @@
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -25,6 +25,18 @@ active_jobs = Gauge('quantum_active_jobs', 'Currently active quantum jobs')
 organism_fitness = Histogram('organism_fitness', 'Organism fitness distribution')
 
 
+class BudgetExceededError(RuntimeError):
+    """Raised when a job submission is rejected by the budget gate"""
+
+    def __init__(self, decision: Dict[str, Any]):
+        self.decision = decision
+        super().__init__(
+            f"{decision.get('period', 'budget')} limit for {decision.get('service')} "
+            f"would be exceeded: {decision.get('spending', 0):.4f} + "
+            f"{decision.get('estimated_cost', 0):.4f} > {decision.get('limit', 0):.4f} USD"
+        )
+
+
 class JobStatus(Enum):
     """Quantum job status states"""
     PENDING = "pending"
@@ -50,6 +62,7 @@ class QuantumJob:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     cost_estimate: Optional[float] = None
+    runtime_estimate: Optional[float] = None  # Seconds, for cost recording
     metadata: Dict[str, Any] = None
 
     def to_dict(self) -> Dict[str, Any]:
@@ -73,8 +86,19 @@ class QuantumOrchestrator:
         self.job_queue: asyncio.Queue = asyncio.Queue()
         self.active_jobs: Dict[str, QuantumJob] = {}
         self.job_callbacks: Dict[str, List[Callable]] = {}
+        self.job_waiters: Dict[str, asyncio.Future] = {}  # Batch jobs awaiting wait_for_jobs
+        self.queued_jobs: Dict[str, QuantumJob] = {}  # Batch jobs not yet dequeued
+        self.transpiled_circuits: Dict[str, QuantumCircuit] = {}  # Batch job circuits, transpiled at submission
         self.evolution_history: List[Dict[str, Any]] = []
 
+        # Optional pre-submission budget check: (service, estimated_cost) -> decision
+        self.budget_gate: Optional[Callable[[str, float], Dict[str, Any]]] = None
+
+        # Optional cost recording for batch jobs, called per job as it starts with
+        # the keyword arguments of CostTracker.track_quantum_execution (single
+        # jobs are recorded by their caller)
+        self.cost_recorder: Optional[Callable[..., Any]] = None
+
     async def initialize(self):
         """Initialize orchestrator connections"""
         try:
@@ -103,6 +127,12 @@ class QuantumOrchestrator:
         # Estimate cost
         cost_estimate = self.client.estimate_cost(circuit, shots)
 
+        # Reject before queuing if the budget would be exceeded
+        if self.budget_gate:
+            decision = self.budget_gate('quantum', cost_estimate.get('estimated_cost_usd', 0))
+            if not decision.get('allowed', True):
+                raise BudgetExceededError(decision)
+
         # Create job
         job = QuantumJob(
             id=job_id,
@@ -140,75 +170,194 @@ class QuantumOrchestrator:
         logger.info(f"Job {job_id} submitted for organism {organism_id}")
         return job_id
 
-    async def execute_jobs(self):
-        """Main execution loop for quantum jobs"""
-        while True:
-            try:
-                # Get next job from queue
-                priority, job = await self.job_queue.get()
+    async def submit_batch(
+        self,
+        organism_ids: List[str],
+        circuits: List[QuantumCircuit],
+        shots: int = 1024,
+        priority: int = 0,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Submit circuits to run together as one hardware job
+
+        One job is created per circuit (for status and history) but they
+        are queued as a single entry, executed in one Sampler run and
+        budget-checked once against their total estimated cost. Collect
+        the results with ``wait_for_jobs``. Circuits are transpiled once,
+        off the event loop, for both the estimate and the execution.
+        """
+        if len(organism_ids) != len(circuits):
+            raise ValueError("organism_ids and circuits must have the same length")
+        if not circuits:
+            return []
+
+        transpiled, estimates, serialized = await asyncio.to_thread(self._prepare_batch, circuits, shots)
+
+        if self.budget_gate:
+            decision = self.budget_gate(
+                'quantum', sum(estimate.get('estimated_cost_usd', 0) for estimate in estimates)
+            )
+            if not decision.get('allowed', True):
+                raise BudgetExceededError(decision)
+
+        backend = self.client.backend.name if self.client.backend else "unknown"
+        created_at = datetime.now()
+        loop = asyncio.get_running_loop()
+        jobs = []
+
+        for i, (organism_id, estimate) in enumerate(zip(organism_ids, estimates)):
+            job = QuantumJob(
+                id=str(uuid.uuid4()),
+                organism_id=organism_id,
+                circuit=serialized[i],
+                shots=shots,
+                backend=backend,
+                status=JobStatus.PENDING,
+                created_at=created_at,
+                cost_estimate=estimate.get('estimated_cost_usd', 0),
+                runtime_estimate=estimate.get('runtime_seconds', 0),
+                metadata=dict(metadata or {})
+            )
+            self.job_waiters[job.id] = loop.create_future()
+            self.queued_jobs[job.id] = job
+            if transpiled is not None:
+                self.transpiled_circuits[job.id] = transpiled[i]
+            jobs.append(job)
 
-                # Update job status
-                job.status = JobStatus.QUEUED
-                job.started_at = datetime.now()
-                self.active_jobs[job.id] = job
+        await self.job_queue.put((priority, jobs))
 
-                # Update in Redis
+        if self.redis_client:
+            for job in jobs:
+                await self.redis_client.hset(f"quantum_job:{job.id}", mapping=job.to_dict())
+                await self.redis_client.expire(f"quantum_job:{job.id}", 86400)
+
+        job_counter.inc(len(jobs))
+        active_jobs.inc(len(jobs))
+
+        logger.info(f"Batch of {len(jobs)} jobs submitted")
+        return [job.id for job in jobs]
+
+    def _prepare_batch(
+        self,
+        circuits: List[QuantumCircuit],
+        shots: int
+    ) -> Tuple[Optional[List[QuantumCircuit]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Transpiled circuits (None without a backend), cost estimates and serialized circuits"""
+        transpiled = self.client.transpile_circuits(circuits) if self.client.backend else None
+        estimates = [
+            self.client.estimate_cost(circuit, shots, transpiled[i] if transpiled is not None else None)
+            for i, circuit in enumerate(circuits)
+        ]
+        return transpiled, estimates, [self._serialize_circuit(circuit) for circuit in circuits]
+
+    async def wait_for_jobs(
+        self,
+        job_ids: List[str],
+        timeout: Optional[float] = None
+    ) -> List[QuantumJob]:
+        """Finished (completed, failed or cancelled) jobs of a batch, in order
+
+        Raises ``asyncio.TimeoutError`` if they do not all finish in time;
+        the jobs can then be waited for again, or given up on with
+        ``abandon_jobs``.
+        """
+        waiters = [self.job_waiters[job_id] for job_id in job_ids]
+        jobs = await asyncio.wait_for(asyncio.shield(asyncio.gather(*waiters)), timeout)
+
+        for job_id in job_ids:
+            self.job_waiters.pop(job_id, None)
+        return jobs
+
+    async def abandon_jobs(self, job_ids: List[str]) -> List[Optional[QuantumJob]]:
+        """Stop waiting for a batch; finished jobs in order, None for the rest
+
+        Jobs still queued are cancelled and will not run (nor be charged).
+        Jobs already running complete in the background and are recorded
+        as usual.
+        """
+        jobs = []
+        for job_id in job_ids:
+            waiter = self.job_waiters.pop(job_id, None)
+            if waiter is not None and waiter.done():
+                jobs.append(waiter.result())
+                continue
+
+            job = self.queued_jobs.pop(job_id, None)
+            if job is not None:
+                job.status = JobStatus.CANCELLED
+                job.completed_at = datetime.now()
+                active_jobs.dec()
                 if self.redis_client:
                     await self.redis_client.hset(
-                        f"quantum_job:{job.id}",
-                        mapping={"status": job.status.value, "started_at": job.started_at.isoformat()}
+                        f"quantum_job:{job_id}",
+                        mapping={"status": job.status.value, "completed_at": job.completed_at.isoformat()}
                     )
+                logger.info(f"Job {job_id} cancelled")
+            jobs.append(None)
+        return jobs
 
-                # Execute on quantum hardware
-                logger.info(f"Executing job {job.id} on {job.backend}")
-                job.status = JobStatus.RUNNING
+    async def execute_jobs(self):
+        """Main execution loop for quantum jobs"""
+        while True:
+            try:
+                # Get next job, or batch of jobs sharing one hardware run
+                priority, item = await self.job_queue.get()
+                transpiled = None
+                if isinstance(item, list):
+                    transpiled = {job.id: self.transpiled_circuits.pop(job.id, None) for job in item}
+                    for job in item:
+                        self.queued_jobs.pop(job.id, None)
+                    # Batch jobs abandoned while queued are skipped
+                    jobs = [job for job in item if job.status != JobStatus.CANCELLED]
+                    if not jobs:
+                        continue
+                else:
+                    jobs = [item]
 
                 try:
-                    # Deserialize and execute circuit
-                    circuit = self._deserialize_circuit(job.circuit)
-                    result = await asyncio.to_thread(
-                        self.client.execute_circuit,
-                        circuit,
-                        job.shots
-                    )
-
-                    # Update job with results
-                    job.status = JobStatus.COMPLETED
-                    job.result = result
-                    job.completed_at = datetime.now()
-
-                    # Process organism evolution
-                    await self._process_organism_evolution(job)
-
-                    # Execute callbacks
-                    await self._execute_callbacks(job.id, job)
-
-                    # Update metrics
-                    duration = (job.completed_at - job.started_at).total_seconds()
-                    job_duration.observe(duration)
-
-                    if result.get('phi', 0) > 0:
-                        organism_fitness.observe(result['phi'])
+                    for job in jobs:
+                        await self._start_job(job)
+                        if isinstance(item, list) and self.cost_recorder:
+                            self.cost_recorder(
+                                job_id=job.id,
+                                organism_id=job.organism_id,
+                                backend=job.backend,
+                                runtime_seconds=job.runtime_estimate or 0,
+                                shots=job.shots,
+                                circuit_depth=job.circuit['depth']
+                            )
+
+                    # Deserialize and execute circuits
+                    circuits = [self._deserialize_circuit(job.circuit) for job in jobs]
+                    if transpiled is None:
+                        results = [await asyncio.to_thread(
+                            self.client.execute_circuit,
+                            circuits[0],
+                            jobs[0].shots
+                        )]
+                    else:
+                        ready = [transpiled[job.id] for job in jobs]
+                        results = await asyncio.to_thread(
+                            self.client.execute_circuits,
+                            circuits,
+                            jobs[0].shots,
+                            ready if all(circuit is not None for circuit in ready) else None
+                        )
 
-                    logger.info(f"Job {job.id} completed successfully. Phi: {result.get('phi', 0):.3f}")
+                    for job, result in zip(jobs, results):
+                        await self._complete_job(job, result)
 
                 except Exception as e:
-                    job.status = JobStatus.FAILED
-                    job.error = str(e)
-                    job.completed_at = datetime.now()
-                    logger.error(f"Job {job.id} failed: {e}")
+                    for job in jobs:
+                        if job.status not in (JobStatus.COMPLETED, JobStatus.FAILED):
+                            job.status = JobStatus.FAILED
+                            job.error = str(e)
+                            job.completed_at = datetime.now()
+                            logger.error(f"Job {job.id} failed: {e}")
 
                 finally:
-                    # Update Redis
-                    if self.redis_client:
-                        await self.redis_client.hset(
-                            f"quantum_job:{job.id}",
-                            mapping=job.to_dict()
-                        )
-
-                    # Remove from active jobs
-                    del self.active_jobs[job.id]
-                    active_jobs.dec()
+                    for job in jobs:
+                        await self._finish_job(job)
 
             except asyncio.CancelledError:
                 break
@@ -216,6 +365,70 @@ class QuantumOrchestrator:
                 logger.error(f"Orchestrator error: {e}")
                 await asyncio.sleep(1)
 
+    async def _start_job(self, job: QuantumJob):
+        """Mark a dequeued job as running"""
+        job.status = JobStatus.QUEUED
+        job.started_at = datetime.now()
+        self.active_jobs[job.id] = job
+
+        # Update in Redis
+        if self.redis_client:
+            await self.redis_client.hset(
+                f"quantum_job:{job.id}",
+                mapping={"status": job.status.value, "started_at": job.started_at.isoformat()}
+            )
+
+        # Execute on quantum hardware
+        logger.info(f"Executing job {job.id} on {job.backend}")
+        job.status = JobStatus.RUNNING
+
+    async def _complete_job(self, job: QuantumJob, result: Dict[str, Any]):
+        """Record a job's results and run evolution processing and callbacks"""
+        try:
+            # Update job with results
+            job.status = JobStatus.COMPLETED
+            job.result = result
+            job.completed_at = datetime.now()
+
+            # Process organism evolution
+            await self._process_organism_evolution(job)
+
+            # Execute callbacks
+            await self._execute_callbacks(job.id, job)
+
+            # Update metrics
+            duration = (job.completed_at - job.started_at).total_seconds()
+            job_duration.observe(duration)
+
+            if result.get('phi', 0) > 0:
+                organism_fitness.observe(result['phi'])
+
+            logger.info(f"Job {job.id} completed successfully. Phi: {result.get('phi', 0):.3f}")
+
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.completed_at = datetime.now()
+            logger.error(f"Job {job.id} failed: {e}")
+
+    async def _finish_job(self, job: QuantumJob):
+        """Persist a finished job, release it and wake its waiter"""
+        try:
+            # Update Redis
+            if self.redis_client:
+                await self.redis_client.hset(
+                    f"quantum_job:{job.id}",
+                    mapping=job.to_dict()
+                )
+        finally:
+            # Remove from active jobs
+            if self.active_jobs.pop(job.id, None) is not None:
+                active_jobs.dec()
+
+            waiter = self.job_waiters.get(job.id)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(job)
+
     async def _process_organism_evolution(self, job: QuantumJob):
         """Process organism evolution based on quantum results"""
         if not job.result:
@@ -318,6 +531,11 @@ class QuantumOrchestrator:
 
                 del self.active_jobs[job_id]
                 active_jobs.dec()
+
+                waiter = self.job_waiters.get(job_id)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(job)
+
                 logger.info(f"Job {job_id} cancelled")
                 return True
 
@@ -132,6 +132,56 @@ class QiskitClient:
             logger.error(f"Circuit execution failed: {e}")
             raise
 
+    def transpile_circuits(self, circuits: List[QuantumCircuit]) -> List[QuantumCircuit]:
+        """Transpile circuits for the backend with the configured passes"""
+        if not self.backend:
+            raise RuntimeError("No backend available")
+
+        return transpile(
+            circuits,
+            backend=self.backend,
+            optimization_level=settings.OPTIMIZATION_LEVEL,
+            routing_method=settings.ROUTING_METHOD,
+            layout_method=settings.LAYOUT_METHOD
+        )
+
+    def execute_circuits(
+        self,
+        circuits: List[QuantumCircuit],
+        shots: int = 1024,
+        transpiled: Optional[List[QuantumCircuit]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute several circuits as one Sampler job in a single session
+
+        Pass ``transpiled`` (from ``transpile_circuits``) to skip transpiling
+        again.
+        """
+        if not self.backend:
+            raise RuntimeError("No backend available")
+
+        if transpiled is None:
+            transpiled = self.transpile_circuits(circuits)
+
+        try:
+            with Session(service=self.service, backend=self.backend) as session:
+                sampler = Sampler(session=session)
+                options = SamplerOptions()
+                options.resilience_level = settings.RESILIENCE_LEVEL
+                options.execution.shots = shots
+                sampler.options.update_options(**options)
+
+                job = sampler.run(transpiled)
+                result = job.result()
+
+                return [
+                    self._process_results(result[i].data.meas.get_counts(), circuit, transpiled[i])
+                    for i, circuit in enumerate(circuits)
+                ]
+
+        except Exception as e:
+            logger.error(f"Batch execution failed: {e}")
+            raise
+
     def _process_results(
         self,
         counts: Dict[str, int],
@@ -241,17 +291,23 @@ class QiskitClient:
         circuit.measure_all()
         return circuit
 
-    def estimate_cost(self, circuit: QuantumCircuit, shots: int = 1024) -> Dict[str, float]:
+    def estimate_cost(
+        self,
+        circuit: QuantumCircuit,
+        shots: int = 1024,
+        transpiled: Optional[QuantumCircuit] = None
+    ) -> Dict[str, float]:
         """Estimate IBM Quantum cost for circuit execution"""
         if not self.backend:
             return {"error": "No backend available"}
 
         # Transpile to get actual circuit
-        transpiled = transpile(
-            circuit,
-            backend=self.backend,
-            optimization_level=settings.OPTIMIZATION_LEVEL
-        )
+        if transpiled is None:
+            transpiled = transpile(
+                circuit,
+                backend=self.backend,
+                optimization_level=settings.OPTIMIZATION_LEVEL
+            )
 
         # IBM Quantum pricing model (simplified)
         # Actual pricing depends on runtime seconds